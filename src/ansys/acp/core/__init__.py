@@ -25,139 +25,153 @@
 PyACP enables you to design and analyze layered composite structures.
 """
 
+import importlib
 import importlib.metadata
+from typing import TYPE_CHECKING, Any
 
-from . import (
-    dpf_integration_helpers,
-    extras,
-    material_property_sets,
-    mechanical_integration_helpers,
-    mesh_data,
-)
-from ._model_printer import get_model_tree, print_model
-from ._plotter import get_directions_plotter
-from ._recursive_copy import LinkedObjectHandling, recursive_copy
-from ._server import (
-    ACPInstance,
-    ConnectLaunchConfig,
-    ConnectLocalLaunchConfig,
-    DirectLaunchConfig,
-    DockerComposeLaunchConfig,
-    LaunchMode,
-    launch_acp,
-)
-from ._tree_objects import (
-    AnalysisPly,
-    ArrowType,
-    BaseElementMaterialHandling,
-    BooleanOperationType,
-    BooleanSelectionRule,
-    ButtJointSequence,
-    CADComponent,
-    CADGeometry,
-    CoordinateTransformation,
-    CutOffGeometry,
-    CutOffGeometryOrientationType,
-    CutOffMaterialHandling,
-    CutOffRuleType,
-    CutOffSelectionRule,
-    CylindricalSelectionRule,
-    DrapingMaterialModel,
-    DrapingType,
-    DropOffMaterialHandling,
-    DropOffSettings,
-    DropOffType,
-    EdgeSet,
-    EdgeSetType,
-    ElementalDataType,
-    ElementSet,
-    ElementTechnology,
-    ExtrusionGuide,
-    ExtrusionGuideType,
-    ExtrusionMethod,
-    ExtrusionType,
-    Fabric,
-    FabricWithAngle,
-    FeFormat,
-    FieldDefinition,
-    GeometricalRuleType,
-    GeometricalSelectionRule,
-    HDF5CompositeCAEImportMode,
-    HDF5CompositeCAEProjectionMode,
-    IgnorableEntity,
-    ImportedAnalysisPly,
-    ImportedModelingGroup,
-    ImportedModelingPly,
-    ImportedPlyDrapingType,
-    ImportedPlyOffsetType,
-    ImportedPlyThicknessType,
-    ImportedProductionPly,
-    ImportedSolidModel,
-    ImportedSolidModelExportSettings,
-    InterfaceLayer,
-    IntersectionType,
-    Lamina,
-    LayupMappingObject,
-    LayupMappingRosetteSelectionMethod,
-    LinkedSelectionRule,
-    LookUpTable1D,
-    LookUpTable1DColumn,
-    LookUpTable3D,
-    LookUpTable3DColumn,
-    LookUpTable3DInterpolationAlgorithm,
-    LookUpTableColumnValueType,
-    Material,
-    MeshImportType,
-    Model,
-    ModelingGroup,
-    ModelingPly,
-    NodalDataType,
-    OffsetType,
-    OrientedSelectionSet,
-    ParallelSelectionRule,
-    PhysicalDimension,
-    PlyCutOffType,
-    PlyGeometryExportFormat,
-    PlyType,
-    PrimaryPly,
-    ProductionPly,
-    ReinforcingBehavior,
-    Rosette,
-    RosetteSelectionMethod,
-    RosetteType,
-    SamplingPoint,
-    SectionCut,
-    SectionCutCDBExportType,
-    SectionCutType,
-    Sensor,
-    SensorType,
-    ShellMappingProperties,
-    SnapToGeometry,
-    SnapToGeometryOrientationType,
-    SolidElementSet,
-    SolidMappingProperties,
-    SolidModel,
-    SolidModelExportFormat,
-    SolidModelExportSettings,
-    SolidModelImportFormat,
-    SolidModelOffsetDirectionType,
-    SolidModelSkinExportFormat,
-    SphericalSelectionRule,
-    Stackup,
-    Status,
-    StressStateType,
-    SubLaminate,
-    SubShape,
-    SymmetryType,
-    TaperEdge,
-    ThicknessFieldType,
-    ThicknessType,
-    TubeSelectionRule,
-    UnitSystemType,
-    VariableOffsetSelectionRule,
-    VirtualGeometry,
-    VirtualGeometryDimension,
-)
+if TYPE_CHECKING:  # pragma: no cover
+    from . import (
+        dpf_integration_helpers,
+        extras,
+        material_property_sets,
+        mechanical_integration_helpers,
+        mesh_data,
+    )
+    from ._model_diff import FieldChange, ModelDiff, ObjectChange, diff
+    from ._model_printer import get_model_tree, print_model
+    from ._parameter_sweep import ParameterSweep, SweepResult, apply_property_parameters, sweep
+    from ._plotter import get_directions_plotter
+    from ._recursive_copy import LinkedObjectHandling, recursive_copy
+    from ._server import (
+        ACPInstance,
+        ACPInstancePool,
+        ConnectLaunchConfig,
+        ConnectLocalLaunchConfig,
+        DirectLaunchConfig,
+        DockerComposeLaunchConfig,
+        LaunchMode,
+        LaunchTimings,
+        RetryPolicy,
+        TransportProfile,
+        launch_acp,
+        remove_docker_compose_stack,
+    )
+    from ._store_many import store_many
+    from ._tree_objects import (
+        AnalysisPly,
+        ArrowType,
+        BaseElementMaterialHandling,
+        BooleanOperationType,
+        BooleanSelectionRule,
+        ButtJointSequence,
+        CADComponent,
+        CADGeometry,
+        CoordinateTransformation,
+        CutOffGeometry,
+        CutOffGeometryOrientationType,
+        CutOffMaterialHandling,
+        CutOffRuleType,
+        CutOffSelectionRule,
+        CylindricalSelectionRule,
+        DrapingMaterialModel,
+        DrapingType,
+        DropOffMaterialHandling,
+        DropOffSettings,
+        DropOffType,
+        EdgeSet,
+        EdgeSetType,
+        ElementalDataType,
+        ElementSet,
+        ElementTechnology,
+        ExportManifest,
+        ExportManifestEntry,
+        ExtrusionGuide,
+        ExtrusionGuideType,
+        ExtrusionMethod,
+        ExtrusionType,
+        Fabric,
+        FabricWithAngle,
+        FeFormat,
+        FieldDefinition,
+        GeometricalRuleType,
+        GeometricalSelectionRule,
+        HDF5CompositeCAEImportMode,
+        HDF5CompositeCAEProjectionMode,
+        IgnorableEntity,
+        ImportedAnalysisPly,
+        ImportedModelingGroup,
+        ImportedModelingPly,
+        ImportedPlyDrapingType,
+        ImportedPlyOffsetType,
+        ImportedPlyThicknessType,
+        ImportedProductionPly,
+        ImportedSolidModel,
+        ImportedSolidModelExportSettings,
+        InterfaceLayer,
+        IntersectionType,
+        Lamina,
+        LayupMappingObject,
+        LayupMappingRosetteSelectionMethod,
+        LinkedSelectionRule,
+        LookUpTable1D,
+        LookUpTable1DColumn,
+        LookUpTable3D,
+        LookUpTable3DColumn,
+        LookUpTable3DInterpolationAlgorithm,
+        LookUpTableColumnValueType,
+        Material,
+        MeshImportType,
+        Model,
+        ModelCheckpoint,
+        ModelingGroup,
+        ModelingPly,
+        NodalDataType,
+        OffsetType,
+        OrientedSelectionSet,
+        ParallelSelectionRule,
+        PhysicalDimension,
+        PlyCutOffType,
+        PlyGeometryExportFormat,
+        PlyType,
+        PrimaryPly,
+        ProductionPly,
+        ReinforcingBehavior,
+        Rosette,
+        RosetteSelectionMethod,
+        RosetteType,
+        SamplingPoint,
+        SectionCut,
+        SectionCutCDBExportType,
+        SectionCutType,
+        Sensor,
+        SensorType,
+        ShellMappingProperties,
+        SnapToGeometry,
+        SnapToGeometryOrientationType,
+        SolidElementSet,
+        SolidMappingProperties,
+        SolidModel,
+        SolidModelExportFormat,
+        SolidModelExportSettings,
+        SolidModelImportFormat,
+        SolidModelOffsetDirectionType,
+        SolidModelSkinExportFormat,
+        SphericalSelectionRule,
+        Stackup,
+        Status,
+        StressStateType,
+        SubLaminate,
+        SubShape,
+        SymmetryType,
+        TaperEdge,
+        ThicknessFieldType,
+        ThicknessType,
+        TubeSelectionRule,
+        UnitSystemType,
+        VariableOffsetSelectionRule,
+        VirtualGeometry,
+        VirtualGeometryDimension,
+    )
 
 __version__ = importlib.metadata.version(__name__.replace(".", "-"))
 
@@ -165,7 +179,9 @@ __version__ = importlib.metadata.version(__name__.replace(".", "-"))
 __all__ = [
     "__version__",
     "ACPInstance",
+    "ACPInstancePool",
     "AnalysisPly",
+    "apply_property_parameters",
     "ArrowType",
     "BaseElementMaterialHandling",
     "BooleanOperationType",
@@ -182,6 +198,7 @@ __all__ = [
     "CutOffRuleType",
     "CutOffSelectionRule",
     "CylindricalSelectionRule",
+    "diff",
     "DirectLaunchConfig",
     "DockerComposeLaunchConfig",
     "dpf_integration_helpers",
@@ -195,6 +212,8 @@ __all__ = [
     "ElementalDataType",
     "ElementSet",
     "ElementTechnology",
+    "ExportManifest",
+    "ExportManifestEntry",
     "extras",
     "ExtrusionGuide",
     "ExtrusionGuideType",
@@ -203,6 +222,7 @@ __all__ = [
     "Fabric",
     "FabricWithAngle",
     "FeFormat",
+    "FieldChange",
     "FieldDefinition",
     "GeometricalRuleType",
     "GeometricalSelectionRule",
@@ -225,6 +245,7 @@ __all__ = [
     "Lamina",
     "launch_acp",
     "LaunchMode",
+    "LaunchTimings",
     "LayupMappingObject",
     "LayupMappingRosetteSelectionMethod",
     "LinkedObjectHandling",
@@ -241,11 +262,15 @@ __all__ = [
     "mesh_data",
     "MeshImportType",
     "Model",
+    "ModelCheckpoint",
+    "ModelDiff",
     "ModelingGroup",
     "ModelingPly",
     "NodalDataType",
+    "ObjectChange",
     "OffsetType",
     "OrientedSelectionSet",
+    "ParameterSweep",
     "ParallelSelectionRule",
     "PhysicalDimension",
     "PlyCutOffType",
@@ -256,6 +281,8 @@ __all__ = [
     "ProductionPly",
     "recursive_copy",
     "ReinforcingBehavior",
+    "remove_docker_compose_stack",
+    "RetryPolicy",
     "Rosette",
     "RosetteSelectionMethod",
     "RosetteType",
@@ -279,16 +306,206 @@ __all__ = [
     "SphericalSelectionRule",
     "Stackup",
     "Status",
+    "store_many",
     "StressStateType",
     "SubLaminate",
     "SubShape",
+    "sweep",
+    "SweepResult",
     "SymmetryType",
     "TaperEdge",
     "ThicknessFieldType",
     "ThicknessType",
+    "TransportProfile",
     "TubeSelectionRule",
     "UnitSystemType",
     "VariableOffsetSelectionRule",
     "VirtualGeometry",
     "VirtualGeometryDimension",
 ]
+
+# The public attributes are imported from their defining module when they
+# are first accessed, to keep 'import ansys.acp.core' fast. The modules
+# defining the tree objects and their dependencies take most of the
+# import time.
+_LAZY_SUBMODULES = (
+    "dpf_integration_helpers",
+    "extras",
+    "material_property_sets",
+    "mechanical_integration_helpers",
+    "mesh_data",
+)
+
+_LAZY_IMPORTS: dict[str, tuple[str, ...]] = {
+    "._model_diff": (
+        "FieldChange",
+        "ModelDiff",
+        "ObjectChange",
+        "diff",
+    ),
+    "._model_printer": (
+        "get_model_tree",
+        "print_model",
+    ),
+    "._parameter_sweep": (
+        "ParameterSweep",
+        "SweepResult",
+        "apply_property_parameters",
+        "sweep",
+    ),
+    "._plotter": ("get_directions_plotter",),
+    "._recursive_copy": (
+        "LinkedObjectHandling",
+        "recursive_copy",
+    ),
+    "._server": (
+        "ACPInstance",
+        "ACPInstancePool",
+        "ConnectLaunchConfig",
+        "ConnectLocalLaunchConfig",
+        "DirectLaunchConfig",
+        "DockerComposeLaunchConfig",
+        "LaunchMode",
+        "LaunchTimings",
+        "RetryPolicy",
+        "TransportProfile",
+        "launch_acp",
+        "remove_docker_compose_stack",
+    ),
+    "._store_many": ("store_many",),
+    "._tree_objects": (
+        "AnalysisPly",
+        "ArrowType",
+        "BaseElementMaterialHandling",
+        "BooleanOperationType",
+        "BooleanSelectionRule",
+        "ButtJointSequence",
+        "CADComponent",
+        "CADGeometry",
+        "CoordinateTransformation",
+        "CutOffGeometry",
+        "CutOffGeometryOrientationType",
+        "CutOffMaterialHandling",
+        "CutOffRuleType",
+        "CutOffSelectionRule",
+        "CylindricalSelectionRule",
+        "DrapingMaterialModel",
+        "DrapingType",
+        "DropOffMaterialHandling",
+        "DropOffSettings",
+        "DropOffType",
+        "EdgeSet",
+        "EdgeSetType",
+        "ElementalDataType",
+        "ElementSet",
+        "ElementTechnology",
+        "ExportManifest",
+        "ExportManifestEntry",
+        "ExtrusionGuide",
+        "ExtrusionGuideType",
+        "ExtrusionMethod",
+        "ExtrusionType",
+        "Fabric",
+        "FabricWithAngle",
+        "FeFormat",
+        "FieldDefinition",
+        "GeometricalRuleType",
+        "GeometricalSelectionRule",
+        "HDF5CompositeCAEImportMode",
+        "HDF5CompositeCAEProjectionMode",
+        "IgnorableEntity",
+        "ImportedAnalysisPly",
+        "ImportedModelingGroup",
+        "ImportedModelingPly",
+        "ImportedPlyDrapingType",
+        "ImportedPlyOffsetType",
+        "ImportedPlyThicknessType",
+        "ImportedProductionPly",
+        "ImportedSolidModel",
+        "ImportedSolidModelExportSettings",
+        "InterfaceLayer",
+        "IntersectionType",
+        "Lamina",
+        "LayupMappingObject",
+        "LayupMappingRosetteSelectionMethod",
+        "LinkedSelectionRule",
+        "LookUpTable1D",
+        "LookUpTable1DColumn",
+        "LookUpTable3D",
+        "LookUpTable3DColumn",
+        "LookUpTable3DInterpolationAlgorithm",
+        "LookUpTableColumnValueType",
+        "Material",
+        "MeshImportType",
+        "Model",
+        "ModelCheckpoint",
+        "ModelingGroup",
+        "ModelingPly",
+        "NodalDataType",
+        "OffsetType",
+        "OrientedSelectionSet",
+        "ParallelSelectionRule",
+        "PhysicalDimension",
+        "PlyCutOffType",
+        "PlyGeometryExportFormat",
+        "PlyType",
+        "PrimaryPly",
+        "ProductionPly",
+        "ReinforcingBehavior",
+        "Rosette",
+        "RosetteSelectionMethod",
+        "RosetteType",
+        "SamplingPoint",
+        "SectionCut",
+        "SectionCutCDBExportType",
+        "SectionCutType",
+        "Sensor",
+        "SensorType",
+        "ShellMappingProperties",
+        "SnapToGeometry",
+        "SnapToGeometryOrientationType",
+        "SolidElementSet",
+        "SolidMappingProperties",
+        "SolidModel",
+        "SolidModelExportFormat",
+        "SolidModelExportSettings",
+        "SolidModelImportFormat",
+        "SolidModelOffsetDirectionType",
+        "SolidModelSkinExportFormat",
+        "SphericalSelectionRule",
+        "Stackup",
+        "Status",
+        "StressStateType",
+        "SubLaminate",
+        "SubShape",
+        "SymmetryType",
+        "TaperEdge",
+        "ThicknessFieldType",
+        "ThicknessType",
+        "TubeSelectionRule",
+        "UnitSystemType",
+        "VariableOffsetSelectionRule",
+        "VirtualGeometry",
+        "VirtualGeometryDimension",
+    ),
+}
+_ATTRIBUTE_MODULES = {
+    name: module_name for module_name, names in _LAZY_IMPORTS.items() for name in names
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    try:
+        module_name = _ATTRIBUTE_MODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Store the attribute, such that '__getattr__' is only called once per name.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
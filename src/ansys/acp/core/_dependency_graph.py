@@ -20,16 +20,21 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+from __future__ import annotations
+
 from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
-
-import networkx as nx
+from typing import TYPE_CHECKING
 
 from ._tree_objects._grpc_helpers.linked_object_helpers import get_linked_paths
 from ._tree_objects._grpc_helpers.mapping import Mapping
 from ._tree_objects._grpc_helpers.polymorphic_from_pb import tree_object_from_resource_path
 from ._tree_objects.base import CreatableTreeObject, TreeObject
 
+if TYPE_CHECKING:  # pragma: no cover
+    # networkx is imported when it is first used, since importing it is slow.
+    import networkx as nx
+
 
 @dataclass
 class _WalkTreeOptions:
@@ -41,6 +46,8 @@ def _build_dependency_graph(
     *, source_objects: Iterable[CreatableTreeObject], options: _WalkTreeOptions
 ) -> nx.DiGraph:
     """Build a dependency graph of the given objects."""
+    import networkx as nx
+
     graph = nx.DiGraph()
 
     # We need to manually keep track of which objects have been visited,
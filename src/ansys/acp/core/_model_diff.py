@@ -0,0 +1,243 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Structural comparison of models and checkpoints."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+import dataclasses
+from typing import Any, cast
+
+from google.protobuf.descriptor import FieldDescriptor
+from google.protobuf.json_format import MessageToDict
+from google.protobuf.message import Message
+
+from ._tree_objects._grpc_helpers.linked_object_helpers import _is_repeated
+from ._tree_objects._snapshot import ModelCheckpoint, _object_class, _parent_path, _subtree_hashes
+from ._tree_objects.model import Model
+
+__all__ = ["diff", "FieldChange", "ModelDiff", "ObjectChange"]
+
+
+@dataclasses.dataclass(frozen=True)
+class FieldChange:
+    """Change of a single field of an object.
+
+    Parameters
+    ----------
+    field :
+        Dotted path of the field in the object's protobuf message, for example
+        ``"properties.thickness"``.
+    old_value :
+        Value in the first model. Links to other objects are represented by
+        their path relative to the model.
+    new_value :
+        Value in the second model.
+    """
+
+    field: str
+    old_value: Any
+    new_value: Any
+
+
+@dataclasses.dataclass(frozen=True)
+class ObjectChange:
+    """Changes of an object which is present in both models.
+
+    Parameters
+    ----------
+    path :
+        Resource path of the object, relative to the model.
+    field_changes :
+        Changes of the individual fields of the object.
+    """
+
+    path: str
+    field_changes: tuple[FieldChange, ...]
+
+
+@dataclasses.dataclass(frozen=True)
+class ModelDiff:
+    """Differences between two models, as computed by :func:`.diff`.
+
+    Objects are identified by their resource path relative to the model,
+    for example ``"modeling_groups/ModelingGroup.1/modeling_plies/ModelingPly.1"``.
+
+    Parameters
+    ----------
+    added :
+        Paths of the objects which are only present in the second model.
+    removed :
+        Paths of the objects which are only present in the first model.
+    changed :
+        Objects which are present in both models, but differ.
+    """
+
+    added: tuple[str, ...]
+    removed: tuple[str, ...]
+    changed: tuple[ObjectChange, ...]
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+
+def diff(model_a: Model | ModelCheckpoint, model_b: Model | ModelCheckpoint) -> ModelDiff:
+    """Compute the differences between the definitions of two models.
+
+    Objects are matched by their resource path relative to the model, and
+    compared by their properties. Objects which are generated by the server
+    on update, such as analysis plies, are not compared.
+
+    The objects are first compared by hashes of their subtrees (Merkle tree),
+    such that unchanged parts of the model are skipped without comparing the
+    individual objects.
+
+    Parameters
+    ----------
+    model_a :
+        First model, or a checkpoint of a model created with :meth:`.Model.checkpoint`.
+    model_b :
+        Second model, or a checkpoint of a model.
+
+    Returns
+    -------
+    :
+        The added, removed, and changed objects.
+
+    Examples
+    --------
+    To find the changes made by a script, create a checkpoint before running it:
+
+    .. code-block:: python
+
+        import ansys.acp.core as pyacp
+
+        checkpoint = model.checkpoint()
+        ...  # modify the model
+        model_diff = pyacp.diff(checkpoint, model)
+        for object_change in model_diff.changed:
+            print(object_change.path, object_change.field_changes)
+    """
+    infos_a = dict(_as_checkpoint(model_a).object_infos)
+    infos_b = dict(_as_checkpoint(model_b).object_infos)
+    hashes_a = _subtree_hashes(infos_a)
+    hashes_b = _subtree_hashes(infos_b)
+
+    added: list[str] = []
+    removed: list[str] = []
+    changed: list[ObjectChange] = []
+
+    # Walk both trees from the root, only descending into subtrees which differ.
+    stack = [""] if infos_a and infos_b else []
+    children_a = _children(infos_a)
+    children_b = _children(infos_b)
+    while stack:
+        path = stack.pop()
+        if hashes_a[path] == hashes_b[path]:
+            continue
+        if infos_a[path] != infos_b[path]:
+            field_changes = tuple(_field_changes(path, infos_a[path], infos_b[path]))
+            if field_changes:
+                changed.append(ObjectChange(path=path, field_changes=field_changes))
+        child_paths_a = children_a.get(path, [])
+        child_paths_b = children_b.get(path, [])
+        for child_path in child_paths_a:
+            if child_path in hashes_b:
+                stack.append(child_path)
+            else:
+                removed.extend(_subtree_paths(child_path, children_a))
+        for child_path in child_paths_b:
+            if child_path not in hashes_a:
+                added.extend(_subtree_paths(child_path, children_b))
+
+    return ModelDiff(
+        added=tuple(sorted(added)),
+        removed=tuple(sorted(removed)),
+        changed=tuple(sorted(changed, key=lambda object_change: object_change.path)),
+    )
+
+
+def _as_checkpoint(model: Model | ModelCheckpoint) -> ModelCheckpoint:
+    if isinstance(model, ModelCheckpoint):
+        return model
+    return model.checkpoint()
+
+
+def _children(infos: dict[str, bytes]) -> dict[str, list[str]]:
+    children: dict[str, list[str]] = {}
+    for path in infos:
+        if path:
+            children.setdefault(_parent_path(path), []).append(path)
+    return children
+
+
+def _subtree_paths(path: str, children: dict[str, list[str]]) -> Iterator[str]:
+    stack = [path]
+    while stack:
+        current_path = stack.pop()
+        yield current_path
+        stack.extend(children.get(current_path, []))
+
+
+def _field_changes(path: str, serialized_a: bytes, serialized_b: bytes) -> Iterator[FieldChange]:
+    object_info_type = _object_class(path)._OBJECT_INFO_TYPE
+    message_a = object_info_type()
+    message_a.ParseFromString(serialized_a)
+    message_b = object_info_type()
+    message_b.ParseFromString(serialized_b)
+    yield from _message_field_changes("", message_a, message_b)
+
+
+def _message_field_changes(
+    prefix: str, message_a: Message, message_b: Message
+) -> Iterator[FieldChange]:
+    field_descriptors = cast(Iterable[FieldDescriptor], message_a.DESCRIPTOR.fields)
+    for field_descriptor in field_descriptors:
+        field_name = f"{prefix}{field_descriptor.name}"
+        value_a = getattr(message_a, field_descriptor.name)
+        value_b = getattr(message_b, field_descriptor.name)
+        if value_a == value_b:
+            continue
+        if field_descriptor.message_type is not None and not _is_repeated(field_descriptor):
+            if field_descriptor.message_type.name == "ResourcePath":
+                yield FieldChange(
+                    field=field_name, old_value=value_a.value, new_value=value_b.value
+                )
+            else:
+                yield from _message_field_changes(f"{field_name}.", value_a, value_b)
+        else:
+            yield FieldChange(
+                field=field_name,
+                old_value=_to_python(value_a),
+                new_value=_to_python(value_b),
+            )
+
+
+def _to_python(value: Any) -> Any:
+    if isinstance(value, Message):
+        if value.DESCRIPTOR.name == "ResourcePath":
+            return value.value  # type: ignore
+        return MessageToDict(value, preserving_proto_field_name=True)
+    if hasattr(value, "__len__") and not isinstance(value, (str, bytes)):
+        return [_to_python(item) for item in value]
+    return value
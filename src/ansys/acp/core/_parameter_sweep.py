@@ -0,0 +1,431 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Evaluation of parameter sweeps on a pool of ACP instances."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable, Iterable, Iterator, Mapping, Sequence
+import concurrent.futures
+import dataclasses
+import itertools
+import threading
+import typing
+from typing import Any, Generic, TypeVar
+
+import numpy as np
+import numpy.typing as npt
+
+from ansys.api.acp.v0.base_pb2 import ResourcePath
+
+from ._server import ACPInstance, ACPInstancePool
+from ._server.common import ControllableServerProtocol
+from ._tree_objects._grpc_helpers.polymorphic_from_pb import tree_object_from_resource_path
+from ._tree_objects.base import TreeObject
+from ._utils.resource_paths import join as _rp_join
+from ._utils.resource_paths import to_parts
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    from ._tree_objects import Model
+
+__all__ = ["apply_property_parameters", "ParameterSweep", "SweepResult", "sweep"]
+
+ResultT = TypeVar("ResultT")
+
+_ModelFactory = Callable[[ACPInstance[ControllableServerProtocol]], "Model"]
+_ParameterGrid = Mapping[str, Iterable[Any]] | Iterable[Mapping[str, Any]]
+
+
+@dataclasses.dataclass(frozen=True)
+class SweepResult(Generic[ResultT]):
+    """Results of a parameter sweep.
+
+    Parameters
+    ----------
+    parameter_names :
+        Names of the parameters.
+    parameter_values :
+        Values of the parameters, with one row per design point and one
+        column per parameter.
+    results :
+        Results of the evaluation function, in the same order as the
+        design points.
+    """
+
+    parameter_names: tuple[str, ...]
+    parameter_values: npt.NDArray[Any]
+    results: tuple[ResultT, ...]
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def results_array(self) -> npt.NDArray[Any]:
+        """Get the results as a numpy array, with the design points along the first axis."""
+        return np.asarray(self.results)
+
+    def points(self) -> Iterator[dict[str, Any]]:
+        """Iterate over the design points, as dictionaries from parameter name to value."""
+        for row in self.parameter_values:
+            yield dict(zip(self.parameter_names, row))
+
+
+class ParameterSweep(Generic[ResultT]):
+    """Evaluate design points of a model on a pool of ACP instances.
+
+    For each design point, the parameters are applied to a baseline model,
+    the model is updated, and the evaluation function is called. The model
+    is then reset to the baseline state with a :class:`.ModelCheckpoint`.
+
+    Evaluations are memoized by parameter values. Points which were
+    evaluated before are served from the cache, which is useful for
+    optimizers such as Nelder-Mead that revisit points.
+
+    By default, parameter names are interpreted as the resource path of
+    an object relative to the model, followed by the property name. For
+    example, ``"fabrics/Fabric.1/thickness"`` sets the thickness of the
+    fabric with ID ``Fabric.1``, and
+    ``"modeling_groups/ModelingGroup.1/modeling_plies/ModelingPly.1/ply_angle"``
+    sets the ply angle of a modeling ply. Edits of the same object are sent
+    to the server in a single request. To apply parameters differently,
+    pass an ``apply_parameters`` function.
+
+    Parameters
+    ----------
+    model_factory :
+        Function which creates the baseline model on a given ACP instance,
+        for example by calling :meth:`.ACPInstance.import_model`. It is
+        called once per instance.
+    evaluate :
+        Function which computes the result for an updated model. It may
+        export files or read data from the model, but should not modify it.
+    instances :
+        Either the number of ACP instances to launch with the default
+        configuration, or an existing :class:`.ACPInstancePool`. Instances
+        launched by the sweep are stopped by :meth:`close`.
+    apply_parameters :
+        Function which applies the parameters of a design point to the model.
+    update :
+        Whether to update the model before calling the evaluation function.
+
+    Examples
+    --------
+    Use the sweep as objective function of an optimizer:
+
+    .. code-block:: python
+
+        import functools
+        import scipy.optimize
+        import ansys.acp.core as pyacp
+
+        names = ["fabrics/Fabric.1/thickness", "fabrics/Fabric.2/thickness"]
+        with pyacp.ParameterSweep(
+            model_factory=functools.partial(pyacp.ACPInstance.import_model, path="model.acph5"),
+            evaluate=lambda model: model.elemental_data.mass.values.sum(),
+        ) as parameter_sweep:
+            res = scipy.optimize.minimize(
+                lambda x: parameter_sweep.evaluate(dict(zip(names, x))),
+                x0=[0.1, 0.1],
+                method="Nelder-Mead",
+            )
+    """
+
+    def __init__(
+        self,
+        model_factory: _ModelFactory,
+        evaluate: Callable[[Model], ResultT],
+        *,
+        instances: int | ACPInstancePool = 1,
+        apply_parameters: Callable[[Model, Mapping[str, Any]], None] | None = None,
+        update: bool = True,
+    ) -> None:
+        if isinstance(instances, ACPInstancePool):
+            self._pool = instances
+            self._owns_pool = False
+        else:
+            self._pool = ACPInstancePool(size=instances)
+            self._owns_pool = True
+        try:
+            self._pool._load_baseline_models(model_factory)
+        except BaseException:
+            self.close()
+            raise
+        self._evaluate = evaluate
+        self._apply_parameters = (
+            apply_parameters if apply_parameters is not None else apply_property_parameters
+        )
+        self._update = update
+        self._cache: dict[Hashable, ResultT] = {}
+        self._cache_lock = threading.Lock()
+        self._cache_hits = 0
+
+    def __enter__(self) -> ParameterSweep[ResultT]:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    @property
+    def cache_size(self) -> int:
+        """Number of design points stored in the cache."""
+        return len(self._cache)
+
+    @property
+    def cache_hits(self) -> int:
+        """Number of evaluations which were served from the cache."""
+        return self._cache_hits
+
+    def clear_cache(self) -> None:
+        """Remove all memoized evaluations."""
+        with self._cache_lock:
+            self._cache.clear()
+
+    def evaluate(self, parameters: Mapping[str, Any]) -> ResultT:
+        """Evaluate a single design point.
+
+        Parameters
+        ----------
+        parameters :
+            Parameter values of the design point, by parameter name.
+        """
+        key = _parameter_key(parameters)
+        with self._cache_lock:
+            if key in self._cache:
+                self._cache_hits += 1
+                return self._cache[key]
+        result = self._evaluate_uncached(parameters)
+        with self._cache_lock:
+            self._cache[key] = result
+        return result
+
+    def run(
+        self, param_grid: _ParameterGrid, *, max_pending: int | None = None
+    ) -> SweepResult[ResultT]:
+        """Evaluate all design points of a parameter grid.
+
+        The design points are distributed over the ACP instances of the pool.
+        At most ``max_pending`` points are submitted at a time, such that large
+        grids do not queue up unbounded work.
+
+        Parameters
+        ----------
+        param_grid :
+            Either a mapping from parameter name to the values of the parameter,
+            in which case all combinations of values are evaluated, or a sequence
+            of design points, each given as mapping from parameter name to value.
+        max_pending :
+            Maximum number of design points which are submitted but not yet
+            finished. Defaults to twice the number of instances.
+
+        Returns
+        -------
+        :
+            Parameter values and results of all design points, in the order of
+            the grid.
+        """
+        points = _expand_grid(param_grid)
+        parameter_names = tuple(points[0]) if points else ()
+        for point in points:
+            if set(point) != set(parameter_names):
+                raise ValueError("All design points must define the same parameters.")
+        if max_pending is None:
+            max_pending = 2 * len(self._pool)
+        if max_pending < 1:
+            raise ValueError("'max_pending' must be at least 1.")
+
+        # Evaluate each distinct point only once.
+        keys = [_parameter_key(point) for point in points]
+        first_indices: dict[Hashable, int] = {}
+        for index, key in enumerate(keys):
+            first_indices.setdefault(key, index)
+        unique_results: dict[Hashable, ResultT] = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(self._pool)) as executor:
+            pending: dict[concurrent.futures.Future[ResultT], Hashable] = {}
+            try:
+                for index in first_indices.values():
+                    if len(pending) >= max_pending:
+                        _collect(pending, unique_results, concurrent.futures.FIRST_COMPLETED)
+                    pending[executor.submit(self.evaluate, points[index])] = keys[index]
+                _collect(pending, unique_results, concurrent.futures.ALL_COMPLETED)
+            except BaseException:
+                for future in pending:
+                    future.cancel()
+                raise
+        results = [unique_results[key] for key in keys]
+        return SweepResult(
+            parameter_names=parameter_names,
+            parameter_values=np.array(
+                [[point[name] for name in parameter_names] for point in points]
+            ),
+            results=tuple(results),
+        )
+
+    def close(self) -> None:
+        """Stop the ACP instances, if they were launched by the sweep."""
+        if self._owns_pool:
+            self._pool.close()
+
+    def _evaluate_uncached(self, parameters: Mapping[str, Any]) -> ResultT:
+        with self._pool.lease_model() as model:
+            self._apply_parameters(model, parameters)
+            if self._update:
+                model.update()
+            return self._evaluate(model)
+
+
+def sweep(
+    model_factory: _ModelFactory,
+    param_grid: _ParameterGrid,
+    evaluate: Callable[[Model], ResultT],
+    *,
+    instances: int | ACPInstancePool = 1,
+    apply_parameters: Callable[[Model, Mapping[str, Any]], None] | None = None,
+    update: bool = True,
+    max_pending: int | None = None,
+) -> SweepResult[ResultT]:
+    """Evaluate a parameter grid on a pool of ACP instances.
+
+    This is a shortcut for creating a :class:`.ParameterSweep` and calling
+    its :meth:`~.ParameterSweep.run` method. To reuse the instances and
+    the cache of evaluated points, use :class:`.ParameterSweep` directly.
+
+    Parameters
+    ----------
+    model_factory :
+        Function which creates the baseline model on a given ACP instance.
+    param_grid :
+        Either a mapping from parameter name to the values of the parameter,
+        in which case all combinations of values are evaluated, or a sequence
+        of design points.
+    evaluate :
+        Function which computes the result for an updated model.
+    instances :
+        Either the number of ACP instances to launch, or an existing
+        :class:`.ACPInstancePool`.
+    apply_parameters :
+        Function which applies the parameters of a design point to the model.
+        By default, :func:`.apply_property_parameters` is used.
+    update :
+        Whether to update the model before calling the evaluation function.
+    max_pending :
+        Maximum number of design points which are submitted but not yet
+        finished. Defaults to twice the number of instances.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        import functools
+        import ansys.acp.core as pyacp
+
+        result = pyacp.sweep(
+            model_factory=functools.partial(pyacp.ACPInstance.import_model, path="model.acph5"),
+            param_grid={
+                "fabrics/Fabric.1/thickness": [0.1, 0.2, 0.3],
+                "modeling_groups/ModelingGroup.1/modeling_plies/ModelingPly.1/ply_angle": [0, 45],
+            },
+            evaluate=lambda model: model.elemental_data.mass.values.sum(),
+            instances=4,
+        )
+        masses = result.results_array()
+    """
+    with ParameterSweep(
+        model_factory,
+        evaluate,
+        instances=instances,
+        apply_parameters=apply_parameters,
+        update=update,
+    ) as parameter_sweep:
+        return parameter_sweep.run(param_grid, max_pending=max_pending)
+
+
+def apply_property_parameters(model: Model, parameters: Mapping[str, Any]) -> None:
+    """Set properties of the objects in a model.
+
+    Each parameter name consists of the resource path of an object relative
+    to the model, followed by the property name, for example
+    ``"fabrics/Fabric.1/thickness"``. Edits of the same object are combined
+    into a single request to the server.
+
+    Parameters
+    ----------
+    model :
+        Model whose objects are modified.
+    parameters :
+        Property values, by parameter name.
+    """
+    edits_by_object: dict[str, list[tuple[str, Any]]] = {}
+    for name, value in parameters.items():
+        *path_parts, property_name = to_parts(name)
+        edits_by_object.setdefault(_rp_join(*path_parts), []).append((property_name, value))
+
+    model_path = model._resource_path.value
+    for relative_path, edits in edits_by_object.items():
+        if relative_path:
+            tree_object = tree_object_from_resource_path(
+                ResourcePath(value=_rp_join(model_path, relative_path)),
+                server_wrapper=model._server_wrapper,
+            )
+        else:
+            tree_object = model
+        if not isinstance(tree_object, TreeObject):
+            raise ValueError(f"No editable object found at path '{relative_path}'.")
+        with tree_object._batch_edit():
+            for property_name, value in edits:
+                setattr(tree_object, property_name, value)
+
+
+def _collect(
+    pending: dict[concurrent.futures.Future[ResultT], Hashable],
+    results: dict[Hashable, ResultT],
+    return_when: str,
+) -> None:
+    done, _ = concurrent.futures.wait(pending, return_when=return_when)
+    for future in done:
+        results[pending.pop(future)] = future.result()
+
+
+def _expand_grid(param_grid: _ParameterGrid) -> list[dict[str, Any]]:
+    if isinstance(param_grid, Mapping):
+        names = list(param_grid)
+        return [
+            dict(zip(names, values))
+            for values in itertools.product(*(list(param_grid[name]) for name in names))
+        ]
+    return [dict(point) for point in param_grid]
+
+
+def _parameter_key(parameters: Mapping[str, Any]) -> Hashable:
+    """Get a hashable key which identifies the parameter values."""
+    return tuple(sorted((name, _hashable(value)) for name, value in parameters.items()))
+
+
+def _hashable(value: Any) -> Hashable:
+    if isinstance(value, np.ndarray):
+        # Arrays are keyed like the equivalent nested lists.
+        return _hashable(value.tolist())
+    if isinstance(value, np.generic):
+        return value.item()  # type: ignore
+    if isinstance(value, Sequence) and not isinstance(value, str):
+        return tuple(_hashable(item) for item in value)
+    if isinstance(value, Mapping):
+        return tuple(sorted((key, _hashable(item)) for key, item in value.items()))
+    return typing.cast(Hashable, value)
@@ -23,8 +23,6 @@
 import collections
 from collections.abc import Iterable
 
-import networkx as nx
-
 from ansys.api.acp.v0.base_pb2 import ResourcePath
 
 from ._dependency_graph import _build_dependency_graph, _WalkTreeOptions
@@ -206,6 +204,8 @@ def recursive_copy(
         for obj, new_obj in parent_mapping.items()
     }
 
+    import networkx as nx
+
     # The 'topological_sort' of the graph ensures that each node is only handled
     # once its parent and linked objects are stored.
     for tree_object in reversed(list(nx.topological_sort(graph))):
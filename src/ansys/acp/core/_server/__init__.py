@@ -24,15 +24,23 @@ from .acp_instance import ACPInstance
 from .common import LaunchMode
 from .connect import ConnectLaunchConfig, ConnectLocalLaunchConfig
 from .direct import DirectLaunchConfig
-from .docker_compose import DockerComposeLaunchConfig
+from .docker_compose import DockerComposeLaunchConfig, remove_docker_compose_stack
 from .launch import launch_acp
+from .pool import ACPInstancePool
+from .startup import LaunchTimings
+from .transport import RetryPolicy, TransportProfile
 
 __all__ = [
     "ACPInstance",
+    "ACPInstancePool",
     "ConnectLaunchConfig",
     "ConnectLocalLaunchConfig",
     "DirectLaunchConfig",
     "DockerComposeLaunchConfig",
     "launch_acp",
+    "LaunchTimings",
     "LaunchMode",
+    "remove_docker_compose_stack",
+    "RetryPolicy",
+    "TransportProfile",
 ]
@@ -22,36 +22,73 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator, Sequence
+import concurrent.futures
+import dataclasses
+import functools
+import hashlib
 import os
 import pathlib
 import shutil
+import tempfile
+import threading
+import time
 import typing
-from typing import Any, Generic, Protocol, TypeVar, cast
+from typing import Any, BinaryIO, Generic, Protocol, TypeVar, cast
+import uuid
 
 import grpc
 
 from ansys.api.acp.v0 import control_pb2_grpc, model_pb2_grpc
 from ansys.api.acp.v0.base_pb2 import CollectionPath, DeleteRequest, Empty, ListRequest
+from ansys.api.tools.filetransfer.v1 import (
+    file_transfer_service_pb2,
+    file_transfer_service_pb2_grpc,
+)
 from ansys.tools.common.exceptions import ProductInstanceError
 from ansys.tools.filetransfer import Client as FileTransferClient
 
 from .._tree_objects._grpc_helpers.exceptions import wrap_grpc_errors
+from .._utils.modification_tracker import ModificationTracker
 from .._utils.typing_helper import PATH as _PATH
 from .common import ServerKey, ServerProtocol
+from .startup import LaunchTimings, wait_until_running
+from .transport import (
+    RetryPolicy,
+    TransportProfile,
+    get_transport_options,
+    get_transport_profile,
+    with_compression,
+)
 
 if typing.TYPE_CHECKING:  # pragma: no cover
     from .._tree_objects import Model
+    from .._tree_objects.base import ServerWrapper
 
 
 __all__ = ["ACPInstance"]
 
+# Maximum number of files transferred at the same time.
+_MAX_PARALLEL_TRANSFERS = 4
+_DOWNLOAD_CHUNK_SIZE = 1 << 16
+
+T = TypeVar("T")
+
 
 class FileTransferStrategy(Protocol):
     def upload_file(self, local_path: _PATH) -> pathlib.PurePath: ...
 
     def download_file(self, remote_path: _PATH, local_path: _PATH) -> None: ...
 
+    def download_to_stream(self, remote_path: _PATH, stream: BinaryIO) -> None:
+        """Write the content of a temporary export file to a stream.
+
+        The file is removed afterwards, if it is accessible to the client.
+        Files on a remote server are left in its working directory, since
+        the file transfer service cannot delete them.
+        """
+        ...
+
     def to_export_path(self, path: _PATH, is_directory: bool = False) -> pathlib.Path: ...
 
 
@@ -71,6 +108,12 @@ class LocalFileTransferStrategy(FileTransferStrategy):
             return
         shutil.copyfile(remote_path_aslocal, local_path)
 
+    def download_to_stream(self, remote_path: _PATH, stream: BinaryIO) -> None:
+        remote_path_aslocal = self._get_local_path(remote_path)
+        with open(remote_path_aslocal, "rb") as file:
+            shutil.copyfileobj(file, stream)
+        remote_path_aslocal.unlink()
+
     def to_export_path(self, path: _PATH, is_directory: bool = False) -> pathlib.Path:
         return self._get_remote_path(path)
 
@@ -109,16 +152,46 @@ class LocalFileTransferStrategy(FileTransferStrategy):
 
 
 class RemoteFileTransferStrategy(FileTransferStrategy):
-    def __init__(self, channel_getter: Callable[[], grpc.Channel]) -> None:
+    def __init__(
+        self,
+        channel_getter: Callable[[], grpc.Channel],
+        *,
+        compression: str = "none",
+        compression_threshold: int = 0,
+    ) -> None:
         self._channel_getter = channel_getter
+        self._compression = compression
+        self._compression_threshold = compression_threshold
+        self._client_lock = threading.Lock()
+        self._clients: tuple[grpc.Channel, FileTransferClient, FileTransferClient] | None = None
+
+    def _get_clients(self) -> tuple[FileTransferClient, FileTransferClient]:
+        # The clients are re-created only if the channel changes, for example
+        # when the server is restarted.
+        channel = self._channel_getter()
+        with self._client_lock:
+            if self._clients is None or self._clients[0] is not channel:
+                client = FileTransferClient(channel)
+                compressing_client = client
+                if self._compression != "none":
+                    compressing_client = FileTransferClient(
+                        with_compression(channel, self._compression)
+                    )
+                self._clients = (channel, client, compressing_client)
+            return self._clients[1], self._clients[2]
 
     @property
     def _ft_client(self) -> FileTransferClient:
-        return FileTransferClient(self._channel_getter())
+        return self._get_clients()[0]
 
     def upload_file(self, local_path: _PATH) -> pathlib.PurePath:
         remote_path = os.path.basename(local_path)
-        self._ft_client.upload_file(local_filename=str(local_path), remote_filename=remote_path)
+        client, compressing_client = self._get_clients()
+        # The server decompresses the upload on receipt. Compression is
+        # not worth its overhead for small files.
+        if os.path.getsize(local_path) >= self._compression_threshold:
+            client = compressing_client
+        client.upload_file(local_filename=str(local_path), remote_filename=remote_path)
         return pathlib.PurePosixPath(remote_path)
 
     def download_file(self, remote_path: _PATH, local_path: _PATH) -> None:
@@ -126,6 +199,45 @@ class RemoteFileTransferStrategy(FileTransferStrategy):
             remote_filename=str(remote_path), local_filename=str(local_path)
         )
 
+    def download_to_stream(self, remote_path: _PATH, stream: BinaryIO) -> None:
+        # The file transfer client only downloads to files, so the download
+        # is implemented here. The checksum is computed while streaming.
+        # The file transfer service has no way to delete files, so the
+        # export file remains on the server.
+        channel = self._channel_getter()
+        stub = file_transfer_service_pb2_grpc.FileTransferServiceStub(channel)
+
+        def requests() -> Iterator[file_transfer_service_pb2.DownloadFileRequest]:
+            yield file_transfer_service_pb2.DownloadFileRequest(
+                initialize=file_transfer_service_pb2.DownloadFileRequest.Initialize(
+                    filename=str(remote_path),
+                    chunk_size=_DOWNLOAD_CHUNK_SIZE,
+                    compute_sha1_checksum=True,
+                )
+            )
+            yield file_transfer_service_pb2.DownloadFileRequest(
+                receive_data=file_transfer_service_pb2.DownloadFileRequest.ReceiveData()
+            )
+            yield file_transfer_service_pb2.DownloadFileRequest(
+                finalize=file_transfer_service_pb2.DownloadFileRequest.Finalize()
+            )
+
+        expected_sha1 = None
+        hasher = hashlib.sha1(usedforsecurity=False)
+        for response in stub.DownloadFile(requests()):
+            sub_step = response.WhichOneof("sub_step")
+            if sub_step == "file_info":
+                expected_sha1 = response.file_info.sha1.hex_digest
+            elif sub_step == "file_data":
+                data = response.file_data.data
+                hasher.update(data)
+                stream.write(data)
+        if expected_sha1 is not None and hasher.hexdigest() != expected_sha1:
+            raise ValueError(
+                f"Checksum mismatch ({hasher.hexdigest()} != {expected_sha1}) between the "
+                "downloaded data and the remote file. Download failed."
+            )
+
     def to_export_path(self, path: _PATH, is_directory: bool = False) -> pathlib.Path:
         # Export to the working directory of the server
         if is_directory:
@@ -133,18 +245,135 @@ class RemoteFileTransferStrategy(FileTransferStrategy):
         return pathlib.Path(pathlib.Path(path).name)
 
 
+def _file_digest(path: pathlib.Path) -> str:
+    hasher = hashlib.sha256()
+    with path.open("rb") as file:
+        while chunk := file.read(1024**2):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+@dataclasses.dataclass(frozen=True)
+class _LocalFileState:
+    size: int
+    mtime_ns: int
+    digest: str
+
+
+class _UploadCache:
+    """Record which file contents were uploaded to the server.
+
+    The content of a local file is identified by its SHA-256 digest. The
+    digest is only re-computed if the size or modification time of the
+    file changed since it was last computed.
+    A file is not uploaded again if the server holds a file with the same
+    name and digest. Remote files which may have been overwritten on the
+    server must be invalidated.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._local_files: dict[pathlib.Path, _LocalFileState] = {}
+        self._remote_path_by_digest: dict[str, pathlib.PurePath] = {}
+        # Remote paths are stored in POSIX format, since the server and
+        # client may format them differently.
+        self._digest_by_remote_path: dict[str, str] = {}
+
+    def upload(
+        self,
+        local_path: _PATH,
+        upload_file: Callable[[_PATH], pathlib.PurePath],
+    ) -> pathlib.PurePath:
+        path = pathlib.Path(local_path).resolve()
+        stat = path.stat()
+        with self._lock:
+            state = self._local_files.get(path)
+        if state is None or (state.size, state.mtime_ns) != (stat.st_size, stat.st_mtime_ns):
+            state = _LocalFileState(
+                size=stat.st_size, mtime_ns=stat.st_mtime_ns, digest=_file_digest(path)
+            )
+            with self._lock:
+                self._local_files[path] = state
+        with self._lock:
+            remote_path = self._remote_path_by_digest.get(state.digest)
+            if (
+                remote_path is not None
+                and remote_path.name == path.name
+                and self._digest_by_remote_path.get(remote_path.as_posix()) == state.digest
+            ):
+                return remote_path
+        remote_path = upload_file(local_path)
+        with self._lock:
+            self._remote_path_by_digest[state.digest] = remote_path
+            self._digest_by_remote_path[remote_path.as_posix()] = state.digest
+        return remote_path
+
+    def invalidate(self, remote_path: _PATH | None = None) -> None:
+        with self._lock:
+            if remote_path is None:
+                self._digest_by_remote_path.clear()
+                self._remote_path_by_digest.clear()
+            else:
+                self._digest_by_remote_path.pop(pathlib.PurePath(remote_path).as_posix(), None)
+
+
 class FileTransferHandler:
     def __init__(
         self, filetransfer_strategy: FileTransferStrategy, auto_transfer_files: bool
     ) -> None:
         self._filetransfer_strategy = filetransfer_strategy
         self._auto_transfer_files = auto_transfer_files
+        # Local files are used by the server directly, and need no cache.
+        self._upload_cache: _UploadCache | None = None
+        if isinstance(filetransfer_strategy, RemoteFileTransferStrategy):
+            self._upload_cache = _UploadCache()
+        self._executor_lock = threading.Lock()
+        self._executor: concurrent.futures.ThreadPoolExecutor | None = None
+
+    def submit_transfer(
+        self, func: Callable[..., T], /, *args: Any
+    ) -> concurrent.futures.Future[T]:
+        """Run a file transfer in the background.
+
+        The transfers share a thread pool, which limits the number of
+        files transferred at the same time.
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=_MAX_PARALLEL_TRANSFERS, thread_name_prefix="acp-file-transfer"
+                )
+            executor = self._executor
+        return executor.submit(func, *args)
+
+    def close(self) -> None:
+        """Stop the threads running background transfers.
+
+        Transfers which have not started are cancelled. The threads are
+        started again by the next background transfer.
+        """
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _map_transfers(self, func: Callable[..., T], *iterables: Iterable[Any]) -> list[T]:
+        arguments = list(zip(*iterables))
+        if len(arguments) <= 1:
+            return [func(*args) for args in arguments]
+        futures = [self.submit_transfer(func, *args) for args in arguments]
+        return [future.result() for future in futures]
 
     def upload_file_if_autotransfer(self, local_path: _PATH) -> pathlib.PurePath:
         if self._auto_transfer_files:
             return self.upload_file(local_path)
         return pathlib.Path(local_path)
 
+    def upload_many_if_autotransfer(self, local_paths: Sequence[_PATH]) -> list[pathlib.PurePath]:
+        if self._auto_transfer_files:
+            return self.upload_many(local_paths)
+        return [pathlib.Path(local_path) for local_path in local_paths]
+
     def download_file_if_autotransfer(self, remote_path: _PATH, local_path: _PATH) -> None:
         if self._auto_transfer_files:
             self.download_file(remote_path, local_path)
@@ -155,15 +384,84 @@ class FileTransferHandler:
 
     def to_export_path(self, path: _PATH, is_directory: bool = False) -> _PATH:
         if self._auto_transfer_files:
-            return self._filetransfer_strategy.to_export_path(path, is_directory=is_directory)
+            export_path = self._filetransfer_strategy.to_export_path(
+                path, is_directory=is_directory
+            )
+            # The export may overwrite uploaded files.
+            self.invalidate_upload_cache(None if is_directory else export_path)
+            return export_path
         return path
 
     def upload_file(self, local_path: _PATH) -> pathlib.PurePath:
-        return self._filetransfer_strategy.upload_file(local_path)
+        if self._upload_cache is None:
+            return self._filetransfer_strategy.upload_file(local_path)
+        return self._upload_cache.upload(local_path, self._filetransfer_strategy.upload_file)
+
+    def invalidate_upload_cache(self, remote_path: _PATH | None = None) -> None:
+        """Upload files again, even if their content is unchanged.
+
+        Parameters
+        ----------
+        remote_path :
+            Path of the remote file to invalidate. If ``None``, all uploads
+            are invalidated.
+        """
+        if self._upload_cache is not None:
+            self._upload_cache.invalidate(remote_path)
 
     def download_file(self, remote_path: _PATH, local_path: _PATH) -> None:
         self._filetransfer_strategy.download_file(remote_path, local_path)
 
+    @property
+    def exports_are_local(self) -> bool:
+        """Whether exported files are accessible at their path on the client."""
+        return self._auto_transfer_files or isinstance(
+            self._filetransfer_strategy, LocalFileTransferStrategy
+        )
+
+    def _check_stream_export_supported(self) -> None:
+        if not self.exports_are_local:
+            raise RuntimeError(
+                "Exporting to a file-like object is not supported for a remote server "
+                "with 'auto_transfer_files=False', since the export is written to the "
+                "server's file system. Export to a file path instead, or enable "
+                "'auto_transfer_files'."
+            )
+
+    def to_stream_export_path(self, suffix: str) -> _PATH:
+        """Get a path for a temporary export, which is downloaded to a stream."""
+        self._check_stream_export_supported()
+        filename = f"pyacp_export_{uuid.uuid4().hex}{suffix}"
+        if self._auto_transfer_files:
+            return self.to_export_path(filename)
+        return pathlib.Path(tempfile.gettempdir()) / filename
+
+    def download_to_stream_if_autotransfer(self, remote_path: _PATH, stream: BinaryIO) -> None:
+        if self._auto_transfer_files:
+            self._filetransfer_strategy.download_to_stream(remote_path, stream)
+        else:
+            # Without auto-transfer, the server writes to the client's file system.
+            self._check_stream_export_supported()
+            with open(remote_path, "rb") as file:
+                shutil.copyfileobj(file, stream)
+            os.remove(remote_path)
+
+    def upload_many(self, local_paths: Sequence[_PATH]) -> list[pathlib.PurePath]:
+        return self._map_transfers(self.upload_file, local_paths)
+
+    def download_many(self, paths: Sequence[tuple[_PATH, _PATH]]) -> None:
+        self._map_transfers(
+            self.download_file,
+            [remote_path for remote_path, _ in paths],
+            [local_path for _, local_path in paths],
+        )
+
+    def download_many_if_autotransfer(self, paths: Sequence[tuple[_PATH, _PATH]]) -> None:
+        if self._auto_transfer_files:
+            self.download_many(paths)
+        else:
+            assert all(remote_path == local_path for remote_path, local_path in paths)
+
 
 ServerT = TypeVar("ServerT", bound=ServerProtocol, covariant=True)
 
@@ -182,11 +480,21 @@ class ACPInstance(Generic[ServerT]):
 
     Note that this class is not meant for instantiating directly.
     The :func:`.launch_acp` function should be used instead.
+
+    ACP instances, and the objects of models loaded on them, can be pickled,
+    for example to send them to the workers of a
+    :class:`concurrent.futures.ProcessPoolExecutor`. They are pickled as a
+    description of the server connection. When unpickled, a connection to the
+    same server is opened, and shared by all objects unpickled in the process.
+    The unpickled instance cannot be used to start or stop the server.
     """
 
     _server: ServerT
     _filetransfer_handler: FileTransferHandler
     _is_remote: bool
+    _modification_tracker: ModificationTracker
+    _server_version_cache: tuple[grpc.Channel, str] | None
+    _server_wrapper_cache: ServerWrapper | None
 
     def __init__(
         self,
@@ -194,14 +502,86 @@ class ACPInstance(Generic[ServerT]):
         server: ServerT,
         filetransfer_handler: FileTransferHandler,
         is_remote: bool,
+        transport_profile: TransportProfile | None = None,
     ) -> None:
         self._server = server
         self._filetransfer_handler = filetransfer_handler
         self._is_remote = is_remote
+        self._modification_tracker = ModificationTracker()
+        self._transport_profile = transport_profile
+        self._channels: dict[str, grpc.Channel] = {}
+        # Server channels wrapped with retries. These are closed by the server.
+        self._server_channels: dict[str, tuple[grpc.Channel, grpc.Channel]] = {}
+        self._channels_lock = threading.Lock()
+        self._launch_timings: LaunchTimings | None = None
+        # Information about the server is requested once per connection.
+        self._server_version_cache = None
+        self._server_wrapper_cache = None
 
     @property
     def _channel(self) -> grpc.Channel:
-        return self._server.channels[ServerKey.MAIN]
+        return self._get_channel(ServerKey.MAIN)
+
+    @property
+    def _transport_profile_evaluated(self) -> TransportProfile | None:
+        if self._transport_profile is not None:
+            return self._transport_profile
+        return get_transport_profile(self._server)
+
+    @property
+    def _retry_policy(self) -> RetryPolicy | None:
+        profile = self._transport_profile_evaluated
+        if profile is None:
+            return RetryPolicy()
+        return profile.retry_policy
+
+    @property
+    def _bulk_data_channel(self) -> grpc.Channel:
+        return self._get_channel(ServerKey.BULK_DATA)
+
+    def _get_channel(self, key: str) -> grpc.Channel:
+        # Without a transport profile, the channels created by the server are
+        # used. Otherwise, channels with the settings of the profile are created
+        # on first use.
+        # The bulk data channel is a separate connection to the main server,
+        # such that large transfers do not delay other calls. It falls back
+        # to the main channel if the server's transport options are unknown.
+        profile = self._transport_profile_evaluated
+        transport_options = get_transport_options(self._server)
+        if transport_options is None or (profile is None and key != ServerKey.BULK_DATA):
+            if key == ServerKey.BULK_DATA:
+                key = ServerKey.MAIN
+            return self._get_server_channel(key)
+        if profile is None:
+            profile = TransportProfile()
+        with self._channels_lock:
+            if key not in self._channels:
+                if key == ServerKey.BULK_DATA:
+                    self._channels[key] = profile.create_channel(
+                        transport_options[ServerKey.MAIN], dedicated_connection=True
+                    )
+                else:
+                    self._channels[key] = profile.create_channel(transport_options[key])
+            return self._channels[key]
+
+    def _get_server_channel(self, key: str) -> grpc.Channel:
+        channel = self._server.channels[key]
+        retry_policy = self._retry_policy
+        if retry_policy is None:
+            return channel
+        with self._channels_lock:
+            cached = self._server_channels.get(key)
+            if cached is None or cached[0] is not channel:
+                cached = (channel, retry_policy.intercept_channel(channel))
+                self._server_channels[key] = cached
+            return cached[1]
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Pickle the instance as a description of its connection. When
+        # unpickled, a new connection to the same server is opened.
+        from .connection import connection_descriptor, reconnect
+
+        return (reconnect, (connection_descriptor(self),))
 
     @property
     def is_remote(self) -> bool:
@@ -210,14 +590,36 @@ class ACPInstance(Generic[ServerT]):
 
     @property
     def server_version(self) -> str:
-        """Version of the connected server."""
-        control_stub = control_pb2_grpc.ControlStub(self._channel)
+        """Version of the connected server.
+
+        The version is requested from the server once per connection.
+        """
+        channel = self._channel
+        cached = self._server_version_cache
+        if cached is not None and cached[0] is channel:
+            return cached[1]
+        control_stub = control_pb2_grpc.ControlStub(channel)
         server_info = control_stub.GetServerInfo(Empty())
         version = server_info.version
         if not version:
             raise RuntimeError("Server version could not be determined.")
+        self._server_version_cache = (channel, cast(str, version))
         return cast(str, version)
 
+    def _clear_server_info(self) -> None:
+        # The server may be replaced by a different version, for example
+        # when it is restarted from a different image. Its address may
+        # also change, so the channels are re-created.
+        with self._channels_lock:
+            for channel in self._channels.values():
+                channel.close()
+            self._channels.clear()
+            self._server_channels.clear()
+        # Files uploaded to the previous server may no longer exist.
+        self._filetransfer_handler.invalidate_upload_cache()
+        self._server_version_cache = None
+        self._server_wrapper_cache = None
+
     def import_model(
         self,
         path: _PATH,
@@ -300,6 +702,7 @@ class ACPInstance(Generic[ServerT]):
                         resource_path=model.info.resource_path, version=model.info.version
                     )
                 )
+                self._modification_tracker.mark_modified(model.info.resource_path.value)
 
     @property
     def models(self) -> tuple[Model, ...]:
@@ -310,8 +713,8 @@ class ACPInstance(Generic[ServerT]):
         from .._tree_objects import Model
         from .._tree_objects.base import ServerWrapper
 
-        model_stub = model_pb2_grpc.ObjectServiceStub(self._channel)
         server_wrapper = ServerWrapper.from_acp_instance(self)
+        model_stub = server_wrapper.get_stub(model_pb2_grpc.ObjectServiceStub)
         return tuple(
             [
                 Model._from_object_info(model_info, server_wrapper)
@@ -342,6 +745,17 @@ class ACPInstance(Generic[ServerT]):
         """
         return self._filetransfer_handler.upload_file(local_path)
 
+    def invalidate_upload_cache(self) -> None:
+        """Upload files again on their next use, even if they are unchanged.
+
+        Files are not uploaded again if a file with the same name and
+        content was already uploaded to the server. This cache is cleared
+        when the server is started or restarted, and when an export writes
+        to the path of an uploaded file.
+        Call this method if files on the server are modified by other means.
+        """
+        self._filetransfer_handler.invalidate_upload_cache()
+
     def download_file(self, remote_path: _PATH, local_path: _PATH) -> None:
         """Download a file from the server.
 
@@ -360,6 +774,49 @@ class ACPInstance(Generic[ServerT]):
         """
         self._filetransfer_handler.download_file(remote_path, local_path)
 
+    def upload_many(self, local_paths: Sequence[_PATH]) -> list[pathlib.PurePath]:
+        """Upload multiple files to the server.
+
+        The files are transferred in parallel.
+
+        .. warning::
+
+            Do not execute this function with untrusted input parameters.
+            See the :ref:`security guide<security_file_upload_download>`
+            for details.
+
+        Parameters
+        ----------
+        local_paths :
+            The paths of the files to be uploaded.
+
+        Returns
+        -------
+        :
+            The paths of the uploaded files on the server, in the same order
+            as ``local_paths``.
+        """
+        return self._filetransfer_handler.upload_many(local_paths)
+
+    def download_many(self, paths: Sequence[tuple[_PATH, _PATH]]) -> None:
+        """Download multiple files from the server.
+
+        The files are transferred in parallel.
+
+        .. warning::
+
+            Do not execute this function with untrusted input parameters.
+            See the :ref:`security guide<security_file_upload_download>`
+            for details.
+
+        Parameters
+        ----------
+        paths :
+            Pairs of the path of a file on the server, and the path it is
+            downloaded to.
+        """
+        self._filetransfer_handler.download_many(paths)
+
     def check(self, timeout: float | None = None) -> bool:
         """Check if the ACP instance is running.
 
@@ -389,7 +846,38 @@ class ACPInstance(Generic[ServerT]):
         ansys.tools.common.exceptions.ProductInstanceError
             In case the server still has not responded after ``timeout`` seconds.
         """
-        self._server.wait(timeout=timeout)
+        wait_until_running(lambda check_timeout: self._server.check(timeout=check_timeout), timeout)
+
+    @property
+    def launch_timings(self) -> LaunchTimings | None:
+        """Time spent in the steps of the last start of the server.
+
+        ``None`` if the server was not started by this instance, for example
+        when connecting to a running server from a pickled instance.
+        """
+        return self._launch_timings
+
+    def _start_and_wait(self, start: Callable[[], None], timeout: float | None) -> None:
+        launch_start_time = time.perf_counter()
+        start()
+        self._clear_server_info()
+        self._wait_after_launch(time.perf_counter() - launch_start_time, timeout)
+
+    def _wait_after_launch(self, launch_time: float, timeout: float | None) -> None:
+        """Wait for the launched server, and record the launch timings."""
+        wait_time = None
+        try:
+            if timeout is not None:
+                wait_start_time = time.perf_counter()
+                self.wait(timeout=timeout)
+                wait_time = time.perf_counter() - wait_start_time
+        finally:
+            launcher = getattr(self._server, "_launcher", None)
+            self._launch_timings = LaunchTimings(
+                launch=launch_time,
+                wait=wait_time,
+                details=dict(getattr(launcher, "launch_timings", {})),
+            )
 
     def start(self, timeout: float | None = None) -> None:
         """Start the product instance.
@@ -412,9 +900,7 @@ class ACPInstance(Generic[ServerT]):
                 "This ACP server does not expose a method to start it. "
                 "Please use a different launch method."
             )
-        self._server.start()
-        if timeout is not None:
-            self.wait(timeout=timeout)
+        self._start_and_wait(self._server.start, timeout)
 
     def stop(self, *, timeout: float | None = None) -> None:
         """Stop the product instance.
@@ -438,7 +924,9 @@ class ACPInstance(Generic[ServerT]):
                 "This ACP server does not expose a method to stop it. "
                 "Please use a different launch method."
             )
+        self._filetransfer_handler.close()
         self._server.stop(timeout=timeout)
+        self._clear_server_info()
 
     def restart(
         self, stop_timeout: float | None = None, start_timeout: float | None = None
@@ -467,6 +955,6 @@ class ACPInstance(Generic[ServerT]):
                 "This ACP server does not expose a method to restart it. "
                 "Please use a different launch method."
             )
-        self._server.restart(stop_timeout=stop_timeout)
-        if start_timeout is not None:
-            self.wait(timeout=start_timeout)
+        self._start_and_wait(
+            functools.partial(self._server.restart, stop_timeout=stop_timeout), start_timeout
+        )
@@ -34,6 +34,8 @@ __all__ = ["LaunchMode"]
 class ServerKey(StrEnum):
     MAIN = "main"
     FILE_TRANSFER = "file_transfer"
+    # Channel to the main server, used for calls which transfer large amounts of data.
+    BULK_DATA = "bulk_data"
 
 
 class LaunchMode(StrEnum):
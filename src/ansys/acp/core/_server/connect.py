@@ -40,6 +40,11 @@ from ansys.tools.common.launcher.interface import (
 )
 
 from .common import ServerKey
+from .transport import (
+    TransportProfileConfig,
+    TransportProfileLauncherMixin,
+    transport_profile_field,
+)
 
 __all__ = ["ConnectLaunchConfig", "ConnectLocalLaunchConfig"]
 
@@ -203,8 +208,11 @@ class ConnectLaunchConfig:
     )
     """Whether to allow connecting to a remote host for the filetransfer server."""
 
+    transport_profile: TransportProfileConfig = transport_profile_field()
+    """Settings of the gRPC channels, as a :class:`.TransportProfile` or a dictionary of its fields."""
+
 
-class ConnectLauncher(LauncherProtocol[ConnectLaunchConfig]):
+class ConnectLauncher(TransportProfileLauncherMixin, LauncherProtocol[ConnectLaunchConfig]):
     CONFIG_MODEL = ConnectLaunchConfig
     SERVER_SPEC = {ServerKey.MAIN: ServerType.GRPC, ServerKey.FILE_TRANSFER: ServerType.GRPC}
 
@@ -364,8 +372,13 @@ class ConnectLocalLaunchConfig:
     )
     """Whether to allow connecting to a remote host."""
 
+    transport_profile: TransportProfileConfig = transport_profile_field()
+    """Settings of the gRPC channels, as a :class:`.TransportProfile` or a dictionary of its fields."""
+
 
-class ConnectLocalLauncher(LauncherProtocol[ConnectLocalLaunchConfig]):
+class ConnectLocalLauncher(
+    TransportProfileLauncherMixin, LauncherProtocol[ConnectLocalLaunchConfig]
+):
     CONFIG_MODEL = ConnectLocalLaunchConfig
     SERVER_SPEC = {ServerKey.MAIN: ServerType.GRPC}
 
@@ -0,0 +1,185 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Serializable descriptions of ACP server connections."""
+
+from __future__ import annotations
+
+from collections.abc import Hashable, Mapping
+import dataclasses
+import os
+import threading
+from typing import Any
+
+import grpc
+
+from ansys.tools.common.launcher.grpc_transport import TransportOptionsType
+from ansys.tools.common.launcher.helpers.grpc import check_grpc_health
+
+from .acp_instance import (
+    ACPInstance,
+    FileTransferHandler,
+    FileTransferStrategy,
+    LocalFileTransferStrategy,
+    RemoteFileTransferStrategy,
+)
+from .common import ServerKey
+from .startup import wait_until_running
+from .transport import TransportProfile, get_transport_options
+
+__all__ = ["ConnectionDescriptor", "connection_descriptor", "reconnect"]
+
+
+@dataclasses.dataclass(frozen=True)
+class ConnectionDescriptor:
+    """Information needed to connect to a running ACP instance from another process.
+
+    Parameters
+    ----------
+    transport_options :
+        gRPC transport options of the servers, by server key.
+    is_remote :
+        Whether the server is remote or local.
+    auto_transfer_files :
+        Whether files are automatically transferred to and from the server.
+    working_directory :
+        Working directory of a local server, used to convert relative paths.
+    transport_profile :
+        Settings of the gRPC channels. If ``None``, the default settings are used.
+    """
+
+    transport_options: tuple[tuple[str, TransportOptionsType], ...]
+    is_remote: bool
+    auto_transfer_files: bool
+    working_directory: str | None
+    transport_profile: TransportProfile | None = None
+
+    def _cache_key(self) -> Hashable:
+        return (
+            tuple(
+                (key, type(options).__name__, tuple(sorted(dataclasses.asdict(options).items())))
+                for key, options in self.transport_options
+            ),
+            self.is_remote,
+            self.auto_transfer_files,
+            self.working_directory,
+            self.transport_profile,
+        )
+
+
+class _ReconnectedServer:
+    """Server which was connected to from its transport options."""
+
+    def __init__(self, transport_options: Mapping[str, TransportOptionsType]) -> None:
+        self._transport_options = dict(transport_options)
+        # Channels with the default settings. If a transport profile is used,
+        # the ACP instance creates its own channels.
+        self._channels = {
+            key: TransportProfile().create_channel(options)
+            for key, options in self._transport_options.items()
+        }
+
+    @property
+    def transport_options(self) -> dict[str, TransportOptionsType]:
+        return self._transport_options
+
+    @property
+    def channels(self) -> dict[str, grpc.Channel]:
+        return self._channels
+
+    def check(self, timeout: float | None = None) -> bool:
+        return all(
+            check_grpc_health(channel=channel, timeout=timeout)
+            for channel in self._channels.values()
+        )
+
+    def wait(self, timeout: float) -> None:
+        wait_until_running(lambda check_timeout: self.check(timeout=check_timeout), timeout)
+
+
+def connection_descriptor(acp_instance: ACPInstance[Any]) -> ConnectionDescriptor:
+    """Get the connection descriptor of an ACP instance.
+
+    Raises
+    ------
+    TypeError
+        If the transport options of the instance cannot be determined.
+    """
+    transport_options = get_transport_options(acp_instance._server)
+    if transport_options is None:
+        raise TypeError(
+            "Cannot serialize the ACP instance, since its connection options are unknown."
+        )
+    filetransfer_handler = acp_instance._filetransfer_handler
+    filetransfer_strategy = filetransfer_handler._filetransfer_strategy
+    if isinstance(filetransfer_strategy, LocalFileTransferStrategy):
+        working_directory: str | None = str(filetransfer_strategy._working_directory)
+    else:
+        working_directory = None
+    return ConnectionDescriptor(
+        transport_options=tuple(sorted(transport_options.items())),
+        is_remote=acp_instance.is_remote,
+        auto_transfer_files=filetransfer_handler._auto_transfer_files,
+        working_directory=working_directory,
+        transport_profile=acp_instance._transport_profile_evaluated,
+    )
+
+
+_INSTANCES_LOCK = threading.Lock()
+_INSTANCES: dict[tuple[int, Hashable], ACPInstance[Any]] = {}
+
+
+def reconnect(descriptor: ConnectionDescriptor) -> ACPInstance[Any]:
+    """Get an ACP instance connected to the server described by the descriptor.
+
+    The instances are cached per process, such that all objects unpickled in
+    a process share the same channels. The cache is keyed by the process ID,
+    since gRPC channels cannot be used across a fork.
+    """
+    key = (os.getpid(), descriptor._cache_key())
+    with _INSTANCES_LOCK:
+        if key not in _INSTANCES:
+            _INSTANCES[key] = _connect(descriptor)
+        return _INSTANCES[key]
+
+
+def _connect(descriptor: ConnectionDescriptor) -> ACPInstance[Any]:
+    server = _ReconnectedServer(dict(descriptor.transport_options))
+    filetransfer_strategy: FileTransferStrategy
+    if descriptor.is_remote:
+        transport_profile = descriptor.transport_profile or TransportProfile()
+        filetransfer_strategy = RemoteFileTransferStrategy(
+            channel_getter=lambda: server.channels[ServerKey.FILE_TRANSFER],
+            compression=transport_profile.file_transfer_compression,
+            compression_threshold=transport_profile.file_transfer_compression_threshold,
+        )
+    else:
+        assert descriptor.working_directory is not None
+        filetransfer_strategy = LocalFileTransferStrategy(descriptor.working_directory)
+    return ACPInstance(
+        server=server,
+        filetransfer_handler=FileTransferHandler(
+            filetransfer_strategy, auto_transfer_files=descriptor.auto_transfer_files
+        ),
+        is_remote=descriptor.is_remote,
+        transport_profile=descriptor.transport_profile,
+    )
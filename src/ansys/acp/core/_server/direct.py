@@ -24,6 +24,7 @@ import dataclasses
 import os
 import pathlib
 import subprocess  # nosec B404
+import time
 from typing import TextIO
 import uuid
 
@@ -44,11 +45,15 @@ from ansys.tools.common.launcher.interface import (
 from ansys.tools.common.path import get_latest_ansys_installation
 
 from .common import ServerKey
+from .startup import BinaryProbeCache
+from .transport import (
+    TransportProfileConfig,
+    TransportProfileLauncherMixin,
+    transport_profile_field,
+)
 
 __all__ = ["DirectLaunchConfig"]
 
-_GRPC_MAX_MESSAGE_LENGTH = 256 * 1024**2  # 256 MB
-
 
 def _get_default_binary_path() -> str:
     try:
@@ -124,8 +129,28 @@ class DirectLaunchConfig:
     Only used if ``transport_mode`` is ``"mtls"``.
     """
 
+    transport_profile: TransportProfileConfig = transport_profile_field()
+    """Settings of the gRPC channels, as a :class:`.TransportProfile` or a dictionary of its fields."""
+
+
+# Whether the server executable supports the secure transport modes.
+_PATCHED_SERVER_CACHE = BinaryProbeCache("patched_server_probe")
+
+
+def _is_patched_server(binary_path: str) -> bool:
+    return (
+        "allow-remote-host"
+        in subprocess.check_output(  # nosec B603, B607: documented in 'security_considerations.rst'
+            [
+                binary_path,
+                "--help",
+            ],
+            text=True,
+        )
+    )
+
 
-class DirectLauncher(LauncherProtocol[DirectLaunchConfig]):
+class DirectLauncher(TransportProfileLauncherMixin, LauncherProtocol[DirectLaunchConfig]):
     CONFIG_MODEL = DirectLaunchConfig
     SERVER_SPEC = {ServerKey.MAIN: ServerType.GRPC}
 
@@ -136,6 +161,7 @@ class DirectLauncher(LauncherProtocol[DirectLaunchConfig]):
         self._stderr: TextIO
         self._url: str
         self._transport_options: TransportOptionsType
+        self._launch_timings: dict[str, float] = {}
 
     def start(self) -> None:
         stdout_file = self._config.stdout_file
@@ -151,17 +177,13 @@ class DirectLauncher(LauncherProtocol[DirectLaunchConfig]):
         else:
             if self._config.transport_mode == "wnua":
                 raise RuntimeError("WNUA transport mode is only supported on Windows.")
-        # Determine if the patched or unpatched version of the server is used
-        is_patched_server = (
-            "allow-remote-host"
-            in subprocess.check_output(  # nosec B603, B607: documented in 'security_considerations.rst'
-                [
-                    self._config.binary_path,
-                    "--help",
-                ],
-                text=True,
-            )
+        # Determine if the patched or unpatched version of the server is used.
+        # The result is cached, since running the executable is slow.
+        probe_start_time = time.perf_counter()
+        is_patched_server = _PATCHED_SERVER_CACHE.get(
+            self._config.binary_path, lambda: _is_patched_server(self._config.binary_path)
         )
+        self._launch_timings = {"capability_probe": time.perf_counter() - probe_start_time}
         if not is_patched_server and self._config.transport_mode != "insecure":
             raise RuntimeError(
                 f"The {self._config.transport_mode} transport mode requires a patched version "
@@ -224,6 +246,7 @@ class DirectLauncher(LauncherProtocol[DirectLaunchConfig]):
                     port=port,
                 )
 
+        process_start_time = time.perf_counter()
         self._stdout = open(stdout_file, mode="w", encoding="utf-8")
         self._stderr = open(stderr_file, mode="w", encoding="utf-8")
         self._process = subprocess.Popen(  # nosec B603: documented in 'security_considerations.rst'
@@ -235,6 +258,7 @@ class DirectLauncher(LauncherProtocol[DirectLaunchConfig]):
             stderr=self._stderr,
             text=True,
         )
+        self._launch_timings["process_start"] = time.perf_counter() - process_start_time
 
     def stop(self, *, timeout: float | None = None) -> None:
         if self._process is None:
@@ -250,9 +274,14 @@ class DirectLauncher(LauncherProtocol[DirectLaunchConfig]):
         self._stderr.close()
 
     def check(self, timeout: float | None = None) -> bool:
-        channel = self._transport_options.create_channel()
-        return check_grpc_health(channel=channel, timeout=timeout)
+        with self._transport_options.create_channel() as channel:
+            return check_grpc_health(channel=channel, timeout=timeout)
 
     @property
     def transport_options(self) -> dict[str, TransportOptionsType]:
         return {ServerKey.MAIN: self._transport_options}
+
+    @property
+    def launch_timings(self) -> dict[str, float]:
+        """Time in seconds spent in the steps of the last start."""
+        return dict(self._launch_timings)
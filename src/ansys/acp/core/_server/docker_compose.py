@@ -25,7 +25,9 @@ from collections.abc import Iterator
 import contextlib
 import copy
 import dataclasses
+import hashlib
 import importlib.resources
+import json
 import math
 import os
 import pathlib
@@ -47,14 +49,26 @@ from ansys.tools.common.launcher.interface import (
     ServerType,
 )
 
+from .._log import LOGGER
 from .common import ServerKey
+from .startup import JsonCacheFile
+from .transport import (
+    TransportProfileConfig,
+    TransportProfileLauncherMixin,
+    transport_profile_field,
+)
 
-__all__ = ["DockerComposeLaunchConfig"]
+__all__ = ["DockerComposeLaunchConfig", "remove_docker_compose_stack"]
 
 TransportOptionsType = (
     InsecureOptions | MTLSOptions
 )  # UDS and WNUA are not supported for docker-compose
 
+# Ports and configuration of the stacks which are kept running for reuse,
+# by docker compose project name.
+_REUSABLE_STACKS = JsonCacheFile("docker_compose_stacks")
+_REUSE_CHECK_TIMEOUT_S = 5.0
+
 
 def _get_default_license_server() -> str:
     try:
@@ -153,15 +167,64 @@ class DockerComposeLaunchConfig:
     Only used if ``transport_mode`` is ``"mtls"``.
     """
 
+    transport_profile: TransportProfileConfig = transport_profile_field()
+    """Settings of the gRPC channels, as a :class:`.TransportProfile` or a dictionary of its fields."""
+
+    project_name: str | None = dataclasses.field(
+        default=None,
+        metadata={
+            METADATA_KEY_DOC: (
+                "Docker compose project name of a reusable stack. If set, a running stack "
+                "with this name and the same configuration is reused instead of starting "
+                "a new one, and the stack is kept running when ACP is stopped."
+            ),
+            METADATA_KEY_NOPROMPT: True,
+        },
+    )
+    """Docker compose project name of a reusable stack.
+
+    If ``None``, a new stack with a unique project name is started, and
+    removed when ACP is stopped.
+
+    If set, the stack is started under this project name and kept running
+    when ACP is stopped. A later launch with the same project name attaches
+    to the running stack if it is healthy and was started with the same
+    configuration. Otherwise, the stack is replaced by a new one. Restarting
+    ACP also replaces the stack. To remove the stack, use
+    :func:`.remove_docker_compose_stack`.
+    """
+
+    clear_on_reuse: bool = dataclasses.field(
+        default=True,
+        metadata={
+            METADATA_KEY_DOC: (
+                "If true, close all models left open on a reused stack. "
+                "Only used if project_name is set."
+            ),
+            METADATA_KEY_NOPROMPT: True,
+        },
+    )
+    """If true, close all models left open on a reused stack.
+
+    Only used if ``project_name`` is set.
+    """
+
 
-class DockerComposeLauncher(LauncherProtocol[DockerComposeLaunchConfig]):
+class DockerComposeLauncher(
+    TransportProfileLauncherMixin, LauncherProtocol[DockerComposeLaunchConfig]
+):
     CONFIG_MODEL = DockerComposeLaunchConfig
     SERVER_SPEC = {ServerKey.MAIN: ServerType.GRPC, ServerKey.FILE_TRANSFER: ServerType.GRPC}
 
     def __init__(self, *, config: DockerComposeLaunchConfig):
-        self._compose_name = f"pyacp_compose_{uuid.uuid4().hex}"
         self._config = config
+        if config.project_name is not None:
+            self._compose_name = config.project_name
+        else:
+            self._compose_name = f"pyacp_compose_{uuid.uuid4().hex}"
         self._transport_options: dict[str, TransportOptionsType] = {}
+        self._is_reused = False
+        self._has_started = False
 
         try:
             import ansys.tools.filetransfer  # noqa
@@ -177,16 +240,19 @@ class DockerComposeLauncher(LauncherProtocol[DockerComposeLaunchConfig]):
             if self._config.certs_dir is None:
                 self._config.certs_dir = pathlib.Path.cwd() / "certs"
 
-        self._env = copy.deepcopy(os.environ)
-        self._env.update(
-            IMAGE_NAME_ACP=self._config.image_name_acp,
-            IMAGE_NAME_FILETRANSFER=self._config.image_name_filetransfer,
-            ANSYSLMD_LICENSE_FILE=self._config.license_server,
-        )
-        self._env.update(self._config.environment_variables)
+        # Environment variables defined by the configuration, which determine
+        # whether a running stack can be reused.
+        self._config_env = {
+            "IMAGE_NAME_ACP": self._config.image_name_acp,
+            "IMAGE_NAME_FILETRANSFER": self._config.image_name_filetransfer,
+            "ANSYSLMD_LICENSE_FILE": self._config.license_server,
+        }
+        self._config_env.update(self._config.environment_variables)
         if self._config.transport_mode == "mtls":
             assert self._config.certs_dir is not None
-            self._env["CERTS_DIR"] = str(pathlib.Path(self._config.certs_dir).resolve())
+            self._config_env["CERTS_DIR"] = str(pathlib.Path(self._config.certs_dir).resolve())
+        self._env = copy.deepcopy(os.environ)
+        self._env.update(self._config_env)
 
         self._keep_volume = config.keep_volume
 
@@ -224,44 +290,111 @@ class DockerComposeLauncher(LauncherProtocol[DockerComposeLaunchConfig]):
             with importlib.resources.path(__package__, compose_filename) as compose_file:
                 yield compose_file
 
+    def _get_transport_options(
+        self, port_acp: int, port_ft: int
+    ) -> dict[str, TransportOptionsType]:
+        if self._config.transport_mode == "mtls":
+            assert self._config.certs_dir is not None
+            return {
+                ServerKey.MAIN: MTLSOptions(
+                    host="localhost",
+                    port=port_acp,
+                    certs_dir=pathlib.Path(self._config.certs_dir),
+                    allow_remote_host=False,
+                ),
+                ServerKey.FILE_TRANSFER: MTLSOptions(
+                    host="localhost",
+                    port=port_ft,
+                    certs_dir=pathlib.Path(self._config.certs_dir),
+                    allow_remote_host=False,
+                ),
+            }
+        elif self._config.transport_mode == "insecure":
+            return {
+                ServerKey.MAIN: InsecureOptions(
+                    host="localhost",
+                    port=port_acp,
+                    allow_remote_host=False,
+                ),
+                ServerKey.FILE_TRANSFER: InsecureOptions(
+                    host="localhost",
+                    port=port_ft,
+                    allow_remote_host=False,
+                ),
+            }
+        else:
+            raise ValueError(
+                f"Unsupported transport mode '{self._config.transport_mode}'. "
+                "Only 'mtls' and 'insecure' are supported."
+            )
+
+    def _get_config_hash(self, compose_file: pathlib.Path) -> str:
+        """Get a hash of the configuration which determines the started services."""
+        hasher = hashlib.sha256(compose_file.read_bytes())
+        hasher.update(
+            json.dumps(
+                {"transport_mode": self._config.transport_mode, "environment": self._config_env},
+                sort_keys=True,
+            ).encode("utf-8")
+        )
+        return hasher.hexdigest()
+
+    def _is_stack_running(self, compose_file: pathlib.Path) -> bool:
+        proc_res = subprocess.run(  # nosec B603: documented in 'security_considerations.rst'
+            self._compose_cmds
+            + ["-f", str(compose_file.resolve()), "--project-name", self._compose_name, "ps", "-q"],
+            env=self._env,
+            capture_output=True,
+            text=True,
+        )
+        return proc_res.returncode == 0 and bool(proc_res.stdout.strip())
+
+    def _lock_registry(self) -> contextlib.AbstractContextManager[object]:
+        """Lock the registry of reusable stacks, for other threads and processes."""
+        if self._config.project_name is None:
+            return contextlib.nullcontext()
+        return _REUSABLE_STACKS.locked()
+
+    def _attach_to_running_stack(self, compose_file: pathlib.Path, config_hash: str) -> bool:
+        """Use the running stack of the project, if it matches the configuration."""
+        # The registry must be locked by the caller.
+        entry = _REUSABLE_STACKS.load().get(self._compose_name)
+        if not isinstance(entry, dict) or entry.get("config_hash") != config_hash:
+            return False
+        if not self._is_stack_running(compose_file):
+            return False
+        self._transport_options = self._get_transport_options(
+            entry["port_acp"], entry["port_filetransfer"]
+        )
+        if not self.check(timeout=_REUSE_CHECK_TIMEOUT_S):
+            self._transport_options = {}
+            return False
+        return True
+
     def start(self) -> None:
-        with self._get_compose_file() as compose_file:
-            port_acp, port_ft = find_free_ports(2)
+        self._is_reused = False
+        reuse_stack = self._config.project_name is not None
+        # Other processes may launch the same project. The registry stays
+        # locked until the stack is started, so that only one of them
+        # replaces the stack, and the others attach to it.
+        with self._lock_registry(), self._get_compose_file() as compose_file:
+            if reuse_stack:
+                config_hash = self._get_config_hash(compose_file)
+                # Starting again after a stop is a restart, which replaces
+                # the stack instead of attaching to it.
+                if not self._has_started and self._attach_to_running_stack(
+                    compose_file, config_hash
+                ):
+                    LOGGER.info(f"Reusing the running docker compose stack '{self._compose_name}'.")
+                    self._is_reused = True
+                    self._has_started = True
+                    return
+                # Remove a stack which is outdated or unhealthy, before
+                # starting a new one under the same project name.
+                self._compose_down(compose_file, volumes=not self._keep_volume, check=False)
 
-            if self._config.transport_mode == "mtls":
-                assert self._config.certs_dir is not None
-                self._transport_options = {
-                    ServerKey.MAIN: MTLSOptions(
-                        host="localhost",
-                        port=port_acp,
-                        certs_dir=pathlib.Path(self._config.certs_dir),
-                        allow_remote_host=False,
-                    ),
-                    ServerKey.FILE_TRANSFER: MTLSOptions(
-                        host="localhost",
-                        port=port_ft,
-                        certs_dir=pathlib.Path(self._config.certs_dir),
-                        allow_remote_host=False,
-                    ),
-                }
-            elif self._config.transport_mode == "insecure":
-                self._transport_options = {
-                    ServerKey.MAIN: InsecureOptions(
-                        host="localhost",
-                        port=port_acp,
-                        allow_remote_host=False,
-                    ),
-                    ServerKey.FILE_TRANSFER: InsecureOptions(
-                        host="localhost",
-                        port=port_ft,
-                        allow_remote_host=False,
-                    ),
-                }
-            else:
-                raise ValueError(
-                    f"Unsupported transport mode '{self._config.transport_mode}'. "
-                    "Only 'mtls' and 'insecure' are supported."
-                )
+            port_acp, port_ft = find_free_ports(2)
+            self._transport_options = self._get_transport_options(port_acp, port_ft)
 
             env = collections.ChainMap(
                 {"PORT_ACP": str(port_acp), "PORT_FILETRANSFER": str(port_ft)}, self._env
@@ -287,36 +420,96 @@ class DockerComposeLauncher(LauncherProtocol[DockerComposeLaunchConfig]):
             )
             if proc_res.returncode != 0:
                 raise RuntimeError(f"Docker compose failed to start:\n{proc_res.stderr}")
+            self._has_started = True
+
+            if reuse_stack:
+                _REUSABLE_STACKS.load()[self._compose_name] = {
+                    "config_hash": config_hash,
+                    "port_acp": port_acp,
+                    "port_filetransfer": port_ft,
+                }
+                _REUSABLE_STACKS.store()
+
+    def _compose_down(
+        self,
+        compose_file: pathlib.Path,
+        *,
+        volumes: bool,
+        check: bool = True,
+        timeout: float | None = None,
+    ) -> None:
+        cmd = self._compose_cmds + [
+            "-f",
+            str(compose_file),
+            "--project-name",
+            self._compose_name,
+            "down",
+        ]
+        if timeout is not None:
+            # --timeout must be an integer, so we round up.
+            cmd.extend(["--timeout", str(math.ceil(timeout))])
+        if volumes:
+            cmd.append("--volumes")
+        subprocess.run(  # nosec B603: documented in 'security_considerations.rst'
+            cmd,
+            env=self._env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=check,
+        )
 
     def stop(self, *, timeout: float | None = None) -> None:
+        if self._config.project_name is not None:
+            # Reusable stacks are kept running, for the next launch to attach to.
+            return
+        self.down(timeout=timeout)
+
+    def down(self, *, timeout: float | None = None) -> None:
+        """Remove the docker compose stack, even if it is reusable."""
         # The compose file needs to be passed for all commands with docker-compose 1.X.
         # With docker-compose 2.X, this no longer seems to be necessary.
-        with self._get_compose_file() as compose_file:
-            cmd = self._compose_cmds + [
-                "-f",
-                str(compose_file),
-                "--project-name",
-                self._compose_name,
-                "down",
-            ]
-            if timeout is not None:
-                # --timeout must be an integer, so we round up.
-                cmd.extend(["--timeout", str(math.ceil(timeout))])
-            if not self._keep_volume:
-                cmd.append("--volumes")
-            subprocess.check_call(  # nosec B603: documented in 'security_considerations.rst'
-                cmd,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            )
+        with self._lock_registry(), self._get_compose_file() as compose_file:
+            self._compose_down(compose_file, volumes=not self._keep_volume, timeout=timeout)
+            if (
+                self._config.project_name is not None
+                and _REUSABLE_STACKS.load().pop(self._compose_name, None) is not None
+            ):
+                _REUSABLE_STACKS.store()
 
     def check(self, timeout: float | None = None) -> bool:
         for transport_options in self.transport_options.values():
-            channel = transport_options.create_channel()
-            if not check_grpc_health(channel=channel, timeout=timeout):
-                return False
+            with transport_options.create_channel() as channel:
+                if not check_grpc_health(channel=channel, timeout=timeout):
+                    return False
         return True
 
+    @property
+    def needs_clear(self) -> bool:
+        """Whether models left open on a reused stack should be closed."""
+        return self._is_reused and self._config.clear_on_reuse
+
     @property
     def transport_options(self) -> dict[str, TransportOptionsType]:  # type: ignore[override]
         return self._transport_options
+
+
+def remove_docker_compose_stack(
+    config: DockerComposeLaunchConfig, *, timeout: float | None = None
+) -> None:
+    """Remove a reusable docker compose stack.
+
+    Stacks launched with a ``project_name`` are kept running when ACP is
+    stopped. This function removes the stack, and its volume unless
+    ``keep_volume`` is set.
+
+    Parameters
+    ----------
+    config :
+        Configuration the stack was launched with. Its ``project_name``
+        must be set.
+    timeout :
+        Time in seconds after which the services are forcefully stopped.
+    """
+    if config.project_name is None:
+        raise ValueError("The 'project_name' of the configuration must be set.")
+    DockerComposeLauncher(config=config).down(timeout=timeout)
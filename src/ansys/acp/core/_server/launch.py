@@ -23,6 +23,7 @@
 from __future__ import annotations
 
 import os
+import time
 
 from packaging import version
 
@@ -41,6 +42,7 @@ from .common import ControllableServerProtocol, LaunchMode, ServerKey
 from .connect import ConnectLaunchConfig, ConnectLocalLaunchConfig
 from .direct import DirectLaunchConfig
 from .docker_compose import DockerComposeLaunchConfig
+from .transport import TransportProfile, get_transport_profile
 
 __all__ = ["launch_acp"]
 
@@ -98,9 +100,11 @@ def launch_acp(
         instantiate objects on the server.
     """
     launch_mode_evaluated = get_launch_mode_for(product_name="ACP", launch_mode=launch_mode)
+    launch_start_time = time.perf_counter()
     server_instance: ControllableServerProtocol = launch_product(
         product_name="ACP", config=config, launch_mode=launch_mode_evaluated
     )
+    launch_time = time.perf_counter() - launch_start_time
     # The fallback launch mode for ACP is the direct launch mode.
     if launch_mode_evaluated in (
         LaunchMode.DIRECT,
@@ -110,8 +114,11 @@ def launch_acp(
         filetransfer_strategy: FileTransferStrategy = LocalFileTransferStrategy(os.getcwd())
         is_remote = False
     elif launch_mode_evaluated in (LaunchMode.DOCKER_COMPOSE, LaunchMode.CONNECT):
+        transport_profile = get_transport_profile(server_instance) or TransportProfile()
         filetransfer_strategy = RemoteFileTransferStrategy(
             channel_getter=lambda: server_instance.channels[ServerKey.FILE_TRANSFER],
+            compression=transport_profile.file_transfer_compression,
+            compression_threshold=transport_profile.file_transfer_compression_threshold,
         )
         is_remote = True
     else:
@@ -124,8 +131,8 @@ def launch_acp(
         ),
         is_remote=is_remote,
     )
+    acp._wait_after_launch(launch_time, timeout)
     if timeout is not None:
-        acp._server.wait(timeout=timeout)
         # We can only check the server version after the server has started;
         # if the timeout is set to 'None', we skip this check.
         MIN_VERSION = "24.2"
@@ -134,4 +141,8 @@ def launch_acp(
                 f"ACP version {acp.server_version} is not supported. "
                 f"Please use ACP version {MIN_VERSION} or later."
             )
+    # When attaching to a running server, close the models left open by
+    # its previous user.
+    if getattr(getattr(server_instance, "_launcher", None), "needs_clear", False):
+        acp.clear()
     return acp
@@ -0,0 +1,389 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Pool of ACP instances for evaluating models in parallel."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, Sequence
+import concurrent.futures
+import contextlib
+import functools
+import queue
+import threading
+import time
+import typing
+from typing import Any, TypeVar
+
+from .._log import LOGGER
+from .._utils.typing_helper import PATH as _PATH
+from .acp_instance import ACPInstance
+from .common import ControllableServerProtocol, LaunchMode
+from .connect import ConnectLaunchConfig, ConnectLocalLaunchConfig
+from .direct import DirectLaunchConfig
+from .docker_compose import DockerComposeLaunchConfig
+from .launch import launch_acp
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    from .._tree_objects import Model
+    from .._tree_objects._snapshot import ModelCheckpoint
+
+__all__ = ["ACPInstancePool"]
+
+_LaunchConfig = (
+    DirectLaunchConfig | DockerComposeLaunchConfig | ConnectLaunchConfig | ConnectLocalLaunchConfig
+)
+
+T = TypeVar("T")
+
+_ModelFactory = Callable[[ACPInstance[ControllableServerProtocol]], "Model"]
+
+
+class ACPInstancePool:
+    """Pool of ACP instances which are leased to worker threads.
+
+    A single ACP server processes the requests for its models one at a time.
+    To evaluate multiple variants of a model in parallel, the pool launches
+    several servers, and lends them out to worker threads with :meth:`lease`
+    or :meth:`lease_model`.
+
+    A baseline model can be loaded onto all instances with :meth:`load_model`.
+    Leased models are reset to the baseline state when they are returned to
+    the pool, such that each lease starts from the same model.
+
+    Before an instance is leased, its health is checked. Instances which do
+    not respond are restarted, if the launch method supports it.
+
+    .. warning::
+
+        Do not execute this class with untrusted input parameters.
+        See the :ref:`security guide<security_launch_acp>` for details.
+
+    Parameters
+    ----------
+    size :
+        Number of ACP instances in the pool.
+    config :
+        The configuration used for launching ACP. Either a single configuration,
+        which is used for all instances, or a sequence of ``size`` configurations.
+        Use a sequence to connect to multiple existing servers with the
+        ``connect`` launch mode. If unspecified, the default for the given
+        launch mode is used.
+    launch_mode :
+        Specifies which ACP launcher is used. See :func:`.launch_acp`.
+    timeout :
+        Timeout to wait until each ACP instance responds.
+    auto_transfer_files :
+        Determines whether input and output files are automatically
+        transferred to the servers. See :func:`.launch_acp`.
+    health_check_interval :
+        Minimum time in seconds between two health checks of the same
+        instance. If ``None``, instances are not checked before being leased.
+
+    Examples
+    --------
+    Evaluate the price of a model for different fabric thicknesses, using
+    four ACP instances:
+
+    .. code-block:: python
+
+        import concurrent.futures
+        import ansys.acp.core as pyacp
+
+
+        def evaluate(thickness):
+            with pool.lease_model() as model:
+                model.fabrics["Fabric.1"].thickness = thickness
+                model.update()
+                return model.elemental_data.price
+
+
+        with pyacp.ACPInstancePool(size=4) as pool:
+            pool.load_model("model.acph5")
+            with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+                prices = list(executor.map(evaluate, [0.1, 0.2, 0.3, 0.4]))
+    """
+
+    def __init__(
+        self,
+        size: int,
+        config: _LaunchConfig | Sequence[_LaunchConfig] | None = None,
+        *,
+        launch_mode: LaunchMode | None = None,
+        timeout: float = 30.0,
+        auto_transfer_files: bool = True,
+        health_check_interval: float | None = 10.0,
+    ) -> None:
+        if size < 1:
+            raise ValueError("The pool size must be at least 1.")
+        if isinstance(config, Sequence):
+            if len(config) != size:
+                raise ValueError(
+                    f"The number of launch configurations ({len(config)}) does not "
+                    f"match the pool size ({size})."
+                )
+            configs: list[_LaunchConfig | None] = list(config)
+        else:
+            configs = [config] * size
+        self._timeout = timeout
+        self._health_check_interval = health_check_interval
+
+        self._instances = tuple(
+            _run_concurrently(
+                [
+                    functools.partial(
+                        launch_acp,
+                        config=instance_config,
+                        launch_mode=launch_mode,
+                        timeout=timeout,
+                        auto_transfer_files=auto_transfer_files,
+                    )
+                    for instance_config in configs
+                ],
+                on_partial_failure=self._stop_instances,
+            )
+        )
+        self._available: queue.Queue[ACPInstance[ControllableServerProtocol]] = queue.Queue()
+        for instance in self._instances:
+            self._available.put(instance)
+        self._last_health_check: dict[int, float] = {
+            id(instance): time.monotonic() for instance in self._instances
+        }
+        self._lock = threading.Lock()
+        self._baseline_factory: _ModelFactory | None = None
+        self._baseline_models: dict[int, tuple[Model, ModelCheckpoint]] = {}
+        self._closed = False
+
+    @property
+    def instances(self) -> tuple[ACPInstance[ControllableServerProtocol], ...]:
+        """ACP instances in the pool."""
+        return self._instances
+
+    def __len__(self) -> int:
+        return len(self._instances)
+
+    def __enter__(self) -> ACPInstancePool:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def load_model(self, path: _PATH, **kwargs: Any) -> None:
+        """Load the baseline model onto all instances.
+
+        The model is loaded once on each instance, in parallel. Afterwards,
+        the model can be leased with :meth:`lease_model`. Calling this
+        method again replaces the baseline model.
+
+        This method must not be called while instances are leased.
+
+        Parameters
+        ----------
+        path :
+            Path of the model file. See :meth:`.ACPInstance.import_model`.
+        kwargs :
+            Additional arguments passed to :meth:`.ACPInstance.import_model`.
+        """
+        self._load_baseline_models(functools.partial(_import_model, path=path, kwargs=dict(kwargs)))
+
+    def _load_baseline_models(self, model_factory: _ModelFactory) -> None:
+        """Create the baseline model on all instances with the given factory function."""
+        self._check_not_closed()
+        if self._available.qsize() != len(self._instances):
+            raise RuntimeError("Cannot load a model while instances of the pool are leased.")
+        baseline_models = _run_concurrently(
+            [
+                functools.partial(_load_baseline_model, instance, model_factory)
+                for instance in self._instances
+            ],
+            on_partial_failure=_discard_baseline_models,
+        )
+        with self._lock:
+            previous_models = self._baseline_models
+            self._baseline_factory = model_factory
+            self._baseline_models = {
+                id(instance): baseline_model
+                for instance, baseline_model in zip(self._instances, baseline_models)
+            }
+        _discard_baseline_models(list(previous_models.values()))
+
+    @contextlib.contextmanager
+    def lease(
+        self, timeout: float | None = None
+    ) -> Iterator[ACPInstance[ControllableServerProtocol]]:
+        """Lease an ACP instance for exclusive use by the calling thread.
+
+        The instance is returned to the pool when the context manager exits.
+        If all instances are in use, this method blocks until one becomes
+        available.
+
+        Parameters
+        ----------
+        timeout :
+            Maximum time in seconds to wait for an instance to become available.
+            If ``None``, wait indefinitely.
+
+        Raises
+        ------
+        TimeoutError
+            If no instance became available within ``timeout`` seconds.
+        """
+        self._check_not_closed()
+        try:
+            instance = self._available.get(timeout=timeout)
+        except queue.Empty as exc:
+            raise TimeoutError(
+                f"No ACP instance became available within {timeout} seconds."
+            ) from exc
+        try:
+            self._ensure_healthy(instance)
+            yield instance
+        finally:
+            self._available.put(instance)
+
+    @contextlib.contextmanager
+    def lease_model(self, timeout: float | None = None) -> Iterator[Model]:
+        """Lease the baseline model on one of the ACP instances.
+
+        The model must first be loaded with :meth:`load_model`. When the
+        context manager exits, modifications of the model are reverted
+        to the baseline state, and the instance is returned to the pool.
+
+        Parameters
+        ----------
+        timeout :
+            Maximum time in seconds to wait for an instance to become available.
+            If ``None``, wait indefinitely.
+        """
+        with self.lease(timeout=timeout) as instance:
+            try:
+                model, _ = self._baseline_models[id(instance)]
+            except KeyError as exc:
+                raise RuntimeError(
+                    "No baseline model is loaded. Use 'load_model' to load a model first."
+                ) from exc
+            try:
+                yield model
+            finally:
+                self._reset_baseline_model(instance)
+
+    def close(self) -> None:
+        """Stop all ACP instances in the pool.
+
+        Instances which were connected to with the ``connect`` launch mode
+        are left running.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._stop_instances(self._instances)
+
+    def _check_not_closed(self) -> None:
+        if self._closed:
+            raise RuntimeError("The ACP instance pool is closed.")
+
+    def _ensure_healthy(self, instance: ACPInstance[ControllableServerProtocol]) -> None:
+        if self._health_check_interval is None:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_health_check[id(instance)] < self._health_check_interval:
+                return
+        if not instance.check(timeout=self._timeout):
+            LOGGER.warning("ACP instance in the pool is not responding, restarting it.")
+            instance.restart(start_timeout=self._timeout)
+            if self._baseline_factory is not None:
+                self._baseline_models[id(instance)] = _load_baseline_model(
+                    instance, self._baseline_factory
+                )
+        with self._lock:
+            self._last_health_check[id(instance)] = time.monotonic()
+
+    def _reset_baseline_model(self, instance: ACPInstance[ControllableServerProtocol]) -> None:
+        model, checkpoint = self._baseline_models[id(instance)]
+        try:
+            model.restore(checkpoint)
+        except Exception:
+            # The model could not be reset, for example because the lease
+            # deleted it. Load the baseline model again.
+            LOGGER.debug("Failed to restore the baseline model, reloading it.", exc_info=True)
+            assert self._baseline_factory is not None
+            _discard_model(model)
+            self._baseline_models[id(instance)] = _load_baseline_model(
+                instance, self._baseline_factory
+            )
+
+    @staticmethod
+    def _stop_instances(instances: Sequence[ACPInstance[ControllableServerProtocol]]) -> None:
+        for instance in instances:
+            try:
+                instance.stop()
+            except Exception:
+                LOGGER.warning("Failed to stop an ACP instance of the pool.", exc_info=True)
+
+
+def _import_model(
+    instance: ACPInstance[ControllableServerProtocol], *, path: _PATH, kwargs: dict[str, Any]
+) -> Model:
+    return instance.import_model(path, **kwargs)
+
+
+def _load_baseline_model(
+    instance: ACPInstance[ControllableServerProtocol], model_factory: _ModelFactory
+) -> tuple[Model, ModelCheckpoint]:
+    model = model_factory(instance)
+    return model, model.checkpoint()
+
+
+def _discard_model(model: Model) -> None:
+    """Close the model on its server, if it still exists."""
+    try:
+        model.delete()
+    except Exception:
+        LOGGER.debug("Failed to close a baseline model of the pool.", exc_info=True)
+
+
+def _discard_baseline_models(baseline_models: list[tuple[Model, ModelCheckpoint]]) -> None:
+    for model, _ in baseline_models:
+        _discard_model(model)
+
+
+def _run_concurrently(
+    functions: Sequence[Callable[[], T]],
+    on_partial_failure: Callable[[list[T]], None] | None = None,
+) -> list[T]:
+    """Run the functions in parallel threads, and return their results.
+
+    If any of the functions fails, the results of the successful functions
+    are passed to ``on_partial_failure``, and the first error is raised.
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(functions)) as executor:
+        futures = [executor.submit(function) for function in functions]
+        concurrent.futures.wait(futures)
+    errors = [future.exception() for future in futures if future.exception() is not None]
+    if errors:
+        if on_partial_failure is not None:
+            on_partial_failure(
+                [future.result() for future in futures if future.exception() is None]
+            )
+        raise errors[0]  # type: ignore
+    return [future.result() for future in futures]
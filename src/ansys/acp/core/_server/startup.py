@@ -0,0 +1,252 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Helpers for starting the ACP server, and measuring the startup time."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, Mapping
+import contextlib
+import dataclasses
+import json
+import os
+import pathlib
+import shutil
+import sys
+import threading
+import time
+from typing import Any
+
+from ansys.tools.common.exceptions import ProductInstanceError
+
+from .._log import LOGGER
+
+__all__ = ["LaunchTimings"]
+
+_INITIAL_POLL_INTERVAL_S = 0.01
+_MAX_POLL_INTERVAL_S = 0.5
+_POLL_INTERVAL_MULTIPLIER = 1.5
+
+_CACHE_DIR_ENV_VAR_NAME = "PYACP_CACHE_DIR"
+
+
+@dataclasses.dataclass(frozen=True)
+class LaunchTimings:
+    """Time spent in the steps of launching an ACP server.
+
+    All times are in seconds.
+    """
+
+    launch: float
+    """Time until the launcher returned, including the start of the server process."""
+
+    wait: float | None
+    """Time spent waiting for the server to respond, or ``None`` if it was not waited for."""
+
+    details: Mapping[str, float] = dataclasses.field(default_factory=dict)
+    """Times of the steps within the launch, as reported by the launcher.
+
+    For example, the direct launcher reports ``"capability_probe"`` and
+    ``"process_start"``. The probe is fast if its result was cached.
+    """
+
+    @property
+    def total(self) -> float:
+        """Total time of the launch, including the wait."""
+        return self.launch + (self.wait or 0.0)
+
+
+def wait_until_running(check: Callable[[float], bool], timeout: float) -> None:
+    """Wait until ``check`` reports that the server is running.
+
+    The server is polled frequently at first, since it typically starts
+    within a short time. The interval between checks then grows, to avoid
+    loading the server while it starts.
+
+    Parameters
+    ----------
+    check :
+        Function which checks whether the server is running. It is called
+        with the maximum time in seconds the check may take.
+    timeout :
+        Time in seconds after which an exception is raised.
+
+    Raises
+    ------
+    ansys.tools.common.exceptions.ProductInstanceError
+        If the server still has not responded after ``timeout`` seconds.
+    """
+    deadline = time.monotonic() + timeout
+    interval = _INITIAL_POLL_INTERVAL_S
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining < 0:
+            break
+        if check(max(remaining, _INITIAL_POLL_INTERVAL_S)):
+            return
+        remaining = deadline - time.monotonic()
+        if remaining < 0:
+            break
+        time.sleep(min(interval, remaining))
+        interval = min(interval * _POLL_INTERVAL_MULTIPLIER, _MAX_POLL_INTERVAL_S)
+    raise ProductInstanceError(f"The product is not running after {timeout}s.")
+
+
+def _get_cache_dir() -> pathlib.Path:
+    if _CACHE_DIR_ENV_VAR_NAME in os.environ:
+        return pathlib.Path(os.environ[_CACHE_DIR_ENV_VAR_NAME])
+    if os.name == "nt":
+        base_dir = os.environ.get("LOCALAPPDATA", str(pathlib.Path.home() / "AppData" / "Local"))
+    else:
+        base_dir = os.environ.get("XDG_CACHE_HOME", str(pathlib.Path.home() / ".cache"))
+    return pathlib.Path(base_dir) / "pyacp"
+
+
+@contextlib.contextmanager
+def _exclusive_file_lock(path: pathlib.Path) -> Iterator[None]:
+    """Hold an exclusive lock on a file, which is shared between processes."""
+    with open(path, "a+b") as file:
+        if sys.platform == "win32":
+            import msvcrt
+
+            file.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    # The lock is only awaited for 10 seconds at a time.
+                    continue
+            try:
+                yield
+            finally:
+                file.seek(0)
+                msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+
+
+class JsonCacheFile:
+    """JSON object stored in a file in the PyACP cache directory.
+
+    Errors reading or writing the file are ignored, the cached entries
+    then only last for the current process.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self.lock = threading.Lock()
+        self._entries: dict[str, Any] | None = None
+
+    @property
+    def _path(self) -> pathlib.Path:
+        return _get_cache_dir() / f"{self._name}.json"
+
+    @contextlib.contextmanager
+    def locked(self) -> Iterator[dict[str, Any]]:
+        """Lock the file for other threads and processes, and get its current entries.
+
+        Use this instead of ``lock`` if the entries are shared with other
+        processes. Modified entries must be written with :meth:`store`
+        before the context exits. If the lock file cannot be created, the
+        entries are only locked for the current process.
+        """
+        with self.lock, contextlib.ExitStack() as stack:
+            path = self._path
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                stack.enter_context(_exclusive_file_lock(path.with_name(f"{path.name}.lock")))
+            except OSError:
+                LOGGER.debug("Could not lock the launch cache file.", exc_info=True)
+            # Other processes may have modified the file since it was read.
+            self._entries = None
+            yield self.load()
+
+    def load(self) -> dict[str, Any]:
+        """Get the cached entries, reading them from the file on first access."""
+        if self._entries is None:
+            try:
+                self._entries = json.loads(self._path.read_text(encoding="utf-8"))
+                if not isinstance(self._entries, dict):
+                    self._entries = {}
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def store(self) -> None:
+        """Write the cached entries to the file."""
+        path = self._path
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first, such that concurrent launches
+            # never read a partially written file.
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(self._entries), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError:
+            LOGGER.debug("Could not write the launch cache file.", exc_info=True)
+
+
+class BinaryProbeCache:
+    """Cache the results of probing server executables, on disk.
+
+    Results are stored per executable path, and are only used while the
+    size and modification time of the executable are unchanged. Errors
+    reading or writing the cache file are ignored, the cache then only
+    lasts for the current process.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._file = JsonCacheFile(name)
+
+    def get(self, binary_path: str, probe: Callable[[], bool]) -> bool:
+        """Get the cached probe result for the executable, or run the probe.
+
+        The ``binary_path`` may also be a command name, which is looked up on
+        the ``PATH``. If the executable cannot be found, the probe is run
+        without caching its result.
+        """
+        try:
+            resolved_path = pathlib.Path(shutil.which(binary_path) or binary_path).resolve()
+            stat = resolved_path.stat()
+        except OSError as exc:
+            LOGGER.debug(f"Not caching the probe result for '{binary_path}': {exc}")
+            return probe()
+        fingerprint = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        key = str(resolved_path)
+        with self._file.lock:
+            entry = self._file.load().get(key)
+            if isinstance(entry, dict) and all(
+                entry.get(name) == value for name, value in fingerprint.items()
+            ):
+                return bool(entry["result"])
+        result = probe()
+        with self._file.lock:
+            self._file.load()[key] = {**fingerprint, "result": result}
+            self._file.store()
+        return result
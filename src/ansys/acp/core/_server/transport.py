@@ -0,0 +1,490 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tuning of the gRPC channels used to communicate with the ACP server."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+import dataclasses
+import random
+import time
+from typing import Any, NamedTuple, TypeVar
+
+import grpc
+
+from ansys.tools.common.launcher.grpc_transport import TransportOptionsType
+from ansys.tools.common.launcher.interface import METADATA_KEY_DOC, METADATA_KEY_NOPROMPT
+
+from .._log import LOGGER
+
+__all__ = ["RetryPolicy", "TransportProfile"]
+
+T = TypeVar("T")
+
+_DEFAULT_MAX_MESSAGE_LENGTH = 256 * 1024**2  # 256 MB
+
+_COMPRESSION_ALGORITHMS = {
+    "none": grpc.Compression.NoCompression,
+    "gzip": grpc.Compression.Gzip,
+    "deflate": grpc.Compression.Deflate,
+}
+
+# Services whose calls transfer large amounts of data.
+_BULK_DATA_SERVICES = ("/ansys.api.acp.v0.mesh_query.MeshQueryService/",)
+
+# Methods which do not modify the server state, and can be repeated safely.
+_IDEMPOTENT_METHODS = (
+    "Get",
+    "List",
+    "GetServerInfo",
+    "GetMeshData",
+    "GetElementalData",
+    "GetNodalData",
+)
+
+
+def _method_name(method: str | bytes) -> str:
+    if isinstance(method, bytes):
+        method = method.decode()
+    return method.rsplit("/", 1)[-1]
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class RetryPolicy:
+    """Retry and deadline settings for calls to the ACP server.
+
+    Calls which do not modify the server state (``Get``, ``List``,
+    ``GetServerInfo``, and the mesh queries) are repeated when they fail
+    with one of the ``retryable_status_codes``. The time between attempts
+    grows exponentially, and is randomized to avoid retrying many calls
+    at the same time.
+
+    ``Put`` calls are only repeated if the object version on the server
+    shows that the failed call was not applied. Other calls are not repeated.
+    """
+
+    max_attempts: int = 5
+    """Maximum number of attempts of a call, including the first one."""
+
+    initial_backoff_s: float = 0.2
+    """Upper bound in seconds of the wait time before the first retry."""
+
+    max_backoff_s: float = 10.0
+    """Upper bound in seconds of the wait time between attempts."""
+
+    backoff_multiplier: float = 2.0
+    """Factor by which the upper bound of the wait time grows after each attempt."""
+
+    retryable_status_codes: tuple[str, ...] = ("UNAVAILABLE",)
+    """Names of the gRPC status codes for which a call is retried.
+
+    ``DEADLINE_EXCEEDED`` can be added if ``deadlines_s`` is set. Since the
+    server handles one request at a time, a call may exceed its deadline
+    only because it waits for a long-running operation to complete.
+    """
+
+    deadlines_s: Mapping[str, float | None] = dataclasses.field(default_factory=dict, hash=False)
+    """Default deadline in seconds of each attempt, by method name.
+
+    The deadline applies to calls which do not set a timeout explicitly.
+    Methods which are not listed, or mapped to ``None``, have no deadline.
+    By default, no method has a deadline.
+    """
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError("'max_attempts' must be at least 1.")
+        # Values from the configuration file are lists.
+        object.__setattr__(self, "retryable_status_codes", tuple(self.retryable_status_codes))
+        for name in self.retryable_status_codes:
+            if name not in grpc.StatusCode.__members__:
+                raise ValueError(f"Invalid gRPC status code '{name}' in 'retryable_status_codes'.")
+
+    @classmethod
+    def from_config(cls, value: RetryPolicy | Mapping[str, Any]) -> RetryPolicy:
+        """Create a retry policy from a launcher configuration value."""
+        if isinstance(value, RetryPolicy):
+            return value
+        return cls(**value)
+
+    def deadline_for(self, method: str | bytes) -> float | None:
+        """Get the default deadline in seconds of the given gRPC method."""
+        return self.deadlines_s.get(_method_name(method))
+
+    def is_idempotent(self, method: str | bytes) -> bool:
+        """Check whether calls to the given gRPC method can be repeated safely."""
+        return _method_name(method) in _IDEMPOTENT_METHODS
+
+    def should_retry(self, code: grpc.StatusCode | None, attempt: int) -> bool:
+        """Check whether a call is retried after its ``attempt``-th attempt failed."""
+        return (
+            attempt < self.max_attempts
+            and code is not None
+            and code.name in self.retryable_status_codes
+        )
+
+    def backoff_s(self, attempt: int) -> float:
+        """Get the wait time in seconds after the ``attempt``-th failed attempt."""
+        upper_bound = min(
+            self.max_backoff_s, self.initial_backoff_s * self.backoff_multiplier ** (attempt - 1)
+        )
+        return random.uniform(0, upper_bound)
+
+    def intercept_channel(self, channel: grpc.Channel) -> grpc.Channel:
+        """Wrap a channel such that its calls are retried according to the policy."""
+        return grpc.intercept_channel(channel, _RetryInterceptor(self))
+
+    def _wait_before_retry(
+        self, method: str | bytes, code: grpc.StatusCode | None, attempt: int
+    ) -> None:
+        delay = self.backoff_s(attempt)
+        status = code.name if code is not None else "UNKNOWN"
+        LOGGER.warning(
+            f"Call to '{_method_name(method)}' failed with status {status} "
+            f"(attempt {attempt} of {self.max_attempts}), retrying in {delay:.2f} s."
+        )
+        time.sleep(delay)
+
+    def call_unless_applied(
+        self,
+        method: str,
+        call: Callable[[], T],
+        get_applied_result: Callable[[], T | None],
+    ) -> T:
+        """Run a call which modifies the server state, with retries.
+
+        After a failed attempt, ``get_applied_result`` checks whether the
+        call was applied nonetheless. It returns the result of the call
+        in that case, and ``None`` otherwise. The call is only repeated if
+        it was not applied.
+
+        Parameters
+        ----------
+        method :
+            Name of the gRPC method, used in log messages.
+        call :
+            Function which makes the call.
+        get_applied_result :
+            Function which checks whether the call was applied.
+        """
+        attempt = 1
+        while True:
+            try:
+                return call()
+            except grpc.RpcError as exc:
+                code = exc.code() if isinstance(exc, grpc.Call) else None
+                if not self.should_retry(code, attempt):
+                    raise
+                result = get_applied_result()
+                if result is not None:
+                    return result
+                self._wait_before_retry(method, code, attempt)
+                attempt += 1
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class TransportProfile:
+    """Settings for the gRPC channels used to communicate with the ACP server.
+
+    All fields are plain values, such that the profile can be stored in the
+    launcher configuration file. A dictionary with the same keys can be used
+    wherever a profile is accepted.
+
+    Note that the compression settings apply to the requests sent by the
+    client. The server decides whether to compress its replies, among the
+    algorithms accepted by the client.
+    """
+
+    control_compression: str = "none"
+    """Compression of calls which transfer small amounts of data.
+
+    One of ``"none"``, ``"gzip"``, or ``"deflate"``.
+    """
+
+    bulk_data_compression: str = "none"
+    """Compression of calls which transfer mesh or field data.
+
+    One of ``"none"``, ``"gzip"``, or ``"deflate"``.
+    """
+
+    keepalive_time_ms: int | None = None
+    """Interval in milliseconds between HTTP/2 keepalive pings.
+
+    If ``None``, no keepalive pings are sent.
+    """
+
+    keepalive_timeout_ms: int | None = None
+    """Time in milliseconds after which an unanswered keepalive ping closes the connection."""
+
+    keepalive_permit_without_calls: bool = False
+    """Whether keepalive pings are sent while no call is in progress."""
+
+    max_send_message_length: int = _DEFAULT_MAX_MESSAGE_LENGTH
+    """Maximum size in bytes of a message sent to the server."""
+
+    max_receive_message_length: int = _DEFAULT_MAX_MESSAGE_LENGTH
+    """Maximum size in bytes of a message received from the server."""
+
+    http2_stream_window_size: int | None = None
+    """Initial HTTP/2 flow control window size in bytes of each call.
+
+    If ``None``, the gRPC default is used.
+    """
+
+    http2_bdp_probe: bool = True
+    """Whether the HTTP/2 window size is adapted to the bandwidth-delay product."""
+
+    file_transfer_compression: str = "none"
+    """Compression of file uploads to a remote server.
+
+    One of ``"none"``, ``"gzip"``, or ``"deflate"``. Text-based formats such
+    as CDB files compress well, but compressing costs time on fast networks.
+    """
+
+    file_transfer_compression_threshold: int = 1024**2
+    """Minimum size in bytes of the files whose upload is compressed."""
+
+    retry_policy: RetryPolicy | None = dataclasses.field(default_factory=RetryPolicy)
+    """Retry and deadline settings of the calls.
+
+    A dictionary of :class:`RetryPolicy` fields can be used instead of the
+    policy. If ``None``, calls are not retried and have no default deadline.
+    """
+
+    def __post_init__(self) -> None:
+        if self.retry_policy is not None:
+            object.__setattr__(self, "retry_policy", RetryPolicy.from_config(self.retry_policy))
+        for name in ("control_compression", "bulk_data_compression", "file_transfer_compression"):
+            value = getattr(self, name)
+            if value not in _COMPRESSION_ALGORITHMS:
+                raise ValueError(
+                    f"Invalid value '{value}' for '{name}'. Expected one of "
+                    f"{', '.join(repr(key) for key in _COMPRESSION_ALGORITHMS)}."
+                )
+
+    @classmethod
+    def from_config(cls, value: TransportProfile | Mapping[str, Any] | None) -> TransportProfile:
+        """Create a profile from a launcher configuration value.
+
+        Parameters
+        ----------
+        value :
+            Profile, dictionary of profile fields as stored in the configuration
+            file, or ``None`` for the default profile.
+        """
+        if value is None:
+            return cls()
+        if isinstance(value, TransportProfile):
+            return value
+        return cls(**value)
+
+    def channel_options(self) -> list[tuple[str, Any]]:
+        """gRPC channel arguments corresponding to the profile."""
+        options: list[tuple[str, Any]] = [
+            ("grpc.max_send_message_length", self.max_send_message_length),
+            ("grpc.max_receive_message_length", self.max_receive_message_length),
+            ("grpc.http2.bdp_probe", int(self.http2_bdp_probe)),
+        ]
+        if self.keepalive_time_ms is not None:
+            options.append(("grpc.keepalive_time_ms", self.keepalive_time_ms))
+        if self.keepalive_timeout_ms is not None:
+            options.append(("grpc.keepalive_timeout_ms", self.keepalive_timeout_ms))
+        if self.keepalive_permit_without_calls:
+            options.append(("grpc.keepalive_permit_without_calls", 1))
+        if self.http2_stream_window_size is not None:
+            options.append(("grpc.http2.lookahead_bytes", self.http2_stream_window_size))
+        return options
+
+    def compression_for(self, method: str) -> grpc.Compression:
+        """Get the compression algorithm used for the given gRPC method."""
+        if method.startswith(_BULK_DATA_SERVICES):
+            return _COMPRESSION_ALGORITHMS[self.bulk_data_compression]
+        return _COMPRESSION_ALGORITHMS[self.control_compression]
+
+    def create_channel(
+        self, transport_options: TransportOptionsType, *, dedicated_connection: bool = False
+    ) -> grpc.Channel:
+        """Create a channel with the settings of the profile.
+
+        Parameters
+        ----------
+        transport_options :
+            Options describing how to connect to the server.
+        dedicated_connection :
+            Whether the channel uses its own connection. By default, gRPC may
+            share the connection between channels with the same target and
+            settings.
+        """
+        grpc_options = self.channel_options()
+        if dedicated_connection:
+            grpc_options.append(("grpc.use_local_subchannel_pool", 1))
+        channel = transport_options.create_channel(grpc_options=grpc_options)
+        interceptors: list[Any] = []
+        if self.retry_policy is not None:
+            interceptors.append(_RetryInterceptor(self.retry_policy))
+        if not self.control_compression == self.bulk_data_compression == "none":
+            interceptors.append(_CompressionInterceptor(self.compression_for))
+        if not interceptors:
+            return channel
+        return grpc.intercept_channel(channel, *interceptors)
+
+
+def with_compression(channel: grpc.Channel, compression: str) -> grpc.Channel:
+    """Wrap a channel such that all its calls use the given compression."""
+    algorithm = _COMPRESSION_ALGORITHMS[compression]
+    return grpc.intercept_channel(channel, _CompressionInterceptor(lambda method: algorithm))
+
+
+TransportProfileConfig = TransportProfile | dict[str, Any] | None
+
+
+def transport_profile_field() -> Any:
+    """Create the ``transport_profile`` field of a launcher configuration.
+
+    The field holds either a :class:`TransportProfile`, or a dictionary of
+    its fields. If ``None``, the default settings are used.
+    """
+    return dataclasses.field(
+        default=None,
+        metadata={
+            METADATA_KEY_DOC: "Settings of the gRPC channels, as a dictionary of "
+            "'TransportProfile' fields. If unset, the default settings are used.",
+            METADATA_KEY_NOPROMPT: True,
+        },
+    )
+
+
+class TransportProfileLauncherMixin:
+    """Provide the transport profile of a launcher with a ``transport_profile_field``."""
+
+    _config: Any
+
+    @property
+    def transport_profile(self) -> TransportProfile | None:
+        if self._config.transport_profile is None:
+            return None
+        return TransportProfile.from_config(self._config.transport_profile)
+
+
+def get_transport_options(server: Any) -> dict[str, TransportOptionsType] | None:
+    """Get the transport options of a server, or ``None`` if they are unknown."""
+    transport_options = getattr(server, "transport_options", None)
+    if transport_options is None:
+        # Servers created by 'launch_acp' wrap the launcher, which knows the
+        # transport options of the running server.
+        transport_options = getattr(getattr(server, "_launcher", None), "transport_options", None)
+    return transport_options
+
+
+def get_transport_profile(server: Any) -> TransportProfile | None:
+    """Get the transport profile configured for a server, if any."""
+    profile = getattr(server, "transport_profile", None)
+    if profile is None:
+        profile = getattr(getattr(server, "_launcher", None), "transport_profile", None)
+    return profile
+
+
+class _ClientCallDetails(NamedTuple):
+    method: str
+    timeout: float | None
+    metadata: Any
+    credentials: grpc.CallCredentials | None
+    wait_for_ready: bool | None
+    compression: grpc.Compression | None
+
+
+class _CompressionInterceptor(
+    grpc.UnaryUnaryClientInterceptor,  # type: ignore[misc]
+    grpc.UnaryStreamClientInterceptor,  # type: ignore[misc]
+    grpc.StreamStreamClientInterceptor,  # type: ignore[misc]
+):
+    """Set the compression of each call, depending on its method."""
+
+    def __init__(self, compression_for: Callable[[str], grpc.Compression]) -> None:
+        self._compression_for = compression_for
+
+    def _with_compression(self, details: Any) -> _ClientCallDetails:
+        compression = details.compression
+        if compression is None:
+            compression = self._compression_for(details.method)
+        return _ClientCallDetails(
+            method=details.method,
+            timeout=details.timeout,
+            metadata=details.metadata,
+            credentials=details.credentials,
+            wait_for_ready=details.wait_for_ready,
+            compression=compression,
+        )
+
+    def intercept_unary_unary(
+        self, continuation: Any, client_call_details: Any, request: Any
+    ) -> Any:
+        return continuation(self._with_compression(client_call_details), request)
+
+    def intercept_unary_stream(
+        self, continuation: Any, client_call_details: Any, request: Any
+    ) -> Any:
+        return continuation(self._with_compression(client_call_details), request)
+
+    def intercept_stream_stream(
+        self, continuation: Any, client_call_details: Any, request_iterator: Any
+    ) -> Any:
+        return continuation(self._with_compression(client_call_details), request_iterator)
+
+
+class _RetryInterceptor(grpc.UnaryUnaryClientInterceptor):  # type: ignore[misc]
+    """Set default deadlines, and retry failed idempotent calls."""
+
+    def __init__(self, policy: RetryPolicy) -> None:
+        self._policy = policy
+
+    def _with_default_deadline(self, details: Any) -> Any:
+        if details.timeout is not None:
+            return details
+        timeout = self._policy.deadline_for(details.method)
+        if timeout is None:
+            return details
+        return _ClientCallDetails(
+            method=details.method,
+            timeout=timeout,
+            metadata=details.metadata,
+            credentials=details.credentials,
+            wait_for_ready=details.wait_for_ready,
+            compression=details.compression,
+        )
+
+    def intercept_unary_unary(
+        self, continuation: Any, client_call_details: Any, request: Any
+    ) -> Any:
+        details = self._with_default_deadline(client_call_details)
+        outcome = continuation(details, request)
+        if not self._policy.is_idempotent(details.method):
+            return outcome
+        attempt = 1
+        # Calls made with 'future' return before they complete, and are
+        # not retried, to avoid blocking the calling thread.
+        while outcome.done() and self._policy.should_retry(outcome.code(), attempt):
+            self._policy._wait_before_retry(details.method, outcome.code(), attempt)
+            attempt += 1
+            outcome = continuation(details, request)
+        return outcome
@@ -0,0 +1,111 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Storing many objects on the server without waiting for each response."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable
+from typing import Any, TypeVar, cast
+
+from grpc import Future
+
+from ._tree_objects._grpc_helpers.exceptions import wrap_grpc_errors
+from ._tree_objects.base import CreatableTreeObject, TreeObject
+
+__all__ = ["store_many"]
+
+ObjectT = TypeVar("ObjectT", bound=CreatableTreeObject)
+
+
+def store_many(
+    objects: Iterable[ObjectT], parent: TreeObject, *, max_in_flight: int = 64
+) -> list[ObjectT]:
+    """Store multiple objects on the server.
+
+    This function has the same effect as calling :meth:`store` on each of the
+    objects, but does not wait for each object to be created before sending
+    the next request. When creating many objects on a remote server, this
+    avoids paying the network round-trip time for each object.
+
+    All objects are validated before any request is sent to the server. If a
+    request fails, the remaining requests are still completed and the first
+    error is raised afterwards. Objects whose creation failed remain unstored.
+
+    Parameters
+    ----------
+    objects :
+        The unstored objects to store.
+    parent :
+        Parent object to store the objects under.
+    max_in_flight :
+        Maximum number of create requests which are sent to the server
+        without having received a response.
+
+    Returns
+    -------
+    :
+        The stored objects, in the same order as the input.
+    """
+    objects = list(objects)
+    if max_in_flight < 1:
+        raise ValueError("The 'max_in_flight' argument must be at least 1.")
+    if len({id(obj) for obj in objects}) != len(objects):
+        raise ValueError("The same object cannot be stored more than once.")
+    for obj in objects:
+        if obj._is_stored:
+            raise ValueError(f"The object {obj!r} is already stored.")
+
+    requests = [obj._get_create_request(parent) for obj in objects]
+    server_wrapper = parent._server_wrapper
+
+    pending: deque[tuple[CreatableTreeObject, Future]] = deque()
+    first_error: Exception | None = None
+
+    def _finish_oldest() -> None:
+        nonlocal first_error
+        obj, future = pending.popleft()
+        try:
+            with wrap_grpc_errors():
+                object_info = future.result()
+        except Exception as exc:
+            obj._server_wrapper_store = None
+            if first_error is None:
+                first_error = exc
+            return
+        obj._set_created(object_info)
+
+    for obj, request in zip(objects, requests):
+        if len(pending) >= max_in_flight:
+            _finish_oldest()
+        obj._server_wrapper_store = server_wrapper
+        # The stub protocol does not describe the '.future' method of
+        # gRPC multi-callables.
+        create = cast(Any, obj._get_stub().Create)
+        pending.append((obj, create.future(request)))
+    while pending:
+        _finish_oldest()
+
+    if first_error is not None:
+        raise first_error
+    return objects
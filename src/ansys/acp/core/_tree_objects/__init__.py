@@ -121,11 +121,14 @@ from .lookup_table_3d import LookUpTable3D
 from .lookup_table_3d_column import LookUpTable3DColumn
 from .material import Material
 from .model import (
+    ExportManifest,
+    ExportManifestEntry,
     FeFormat,
     HDF5CompositeCAEImportMode,
     HDF5CompositeCAEProjectionMode,
     IgnorableEntity,
     Model,
+    ModelCheckpoint,
     ModelElementalData,
     ModelNodalData,
     ShellMappingProperties,
@@ -217,6 +220,8 @@ __all__ = [
     "ElementSetElementalData",
     "ElementSetNodalData",
     "ElementTechnology",
+    "ExportManifest",
+    "ExportManifestEntry",
     "ExtrusionGuide",
     "ExtrusionGuideType",
     "ExtrusionMethod",
@@ -261,6 +266,7 @@ __all__ = [
     "MeshData",
     "MeshImportType",
     "Model",
+    "ModelCheckpoint",
     "ModelElementalData",
     "ModelingGroup",
     "ModelingPly",
@@ -459,7 +459,9 @@ def _mesh_data_property_impl(
     def getter(self: TreeObject) -> MeshDataT:
         if not self._is_stored:
             raise RuntimeError("Cannot get mesh data from an unstored object")
-        stub = mesh_query_pb2_grpc.MeshQueryServiceStub(self._channel)
+        stub = self._server_wrapper.get_stub(
+            mesh_query_pb2_grpc.MeshQueryServiceStub, bulk_data=True
+        )
         request_func = getattr(stub, request_name)
         response = request_func(
             request=request_type(
@@ -0,0 +1,101 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Wrapping of gRPC futures into standard library futures."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import concurrent.futures
+from typing import Any, Generic, TypeVar
+
+from .exceptions import wrap_grpc_errors
+
+__all__ = ["GrpcCallFuture", "await_grpc_call"]
+
+T = TypeVar("T")
+
+
+class GrpcCallFuture(concurrent.futures.Future[T], Generic[T]):
+    """Future representing the result of a non-blocking gRPC call.
+
+    The result of the gRPC call is converted with the given callback. gRPC
+    errors are converted to Python exceptions in the same way as for
+    blocking calls. Cancelling the future cancels the gRPC call.
+
+    Note that the future stays in the pending state (``running()`` returns
+    ``False``) until the call has finished.
+
+    Parameters
+    ----------
+    grpc_future :
+        The future returned by the ``.future`` method of a gRPC stub method.
+    on_success :
+        Callback which is run with the reply of the gRPC call when it
+        completes successfully. Its return value is the result of the future.
+    """
+
+    def __init__(self, grpc_future: Any, on_success: Callable[[Any], T]) -> None:
+        super().__init__()
+        self._grpc_future = grpc_future
+        self._on_success = on_success
+        grpc_future.add_done_callback(self._on_grpc_done)
+
+    def cancel(self) -> bool:
+        """Cancel the gRPC call.
+
+        Returns ``False`` if the call has already completed.
+        """
+        if not self._grpc_future.cancel():
+            return False
+        return super().cancel()
+
+    def _on_grpc_done(self, grpc_future: Any) -> None:
+        if grpc_future.cancelled():
+            super().cancel()
+            return
+        try:
+            with wrap_grpc_errors():
+                reply = grpc_future.result()
+            result = self._on_success(reply)
+        except Exception as exc:
+            self.set_exception(exc)
+        else:
+            self.set_result(result)
+
+
+async def await_grpc_call(grpc_future: Any, on_success: Callable[[Any], T]) -> T:
+    """Wait for a non-blocking gRPC call from a coroutine.
+
+    The event loop is not blocked while the call is running, and no thread is
+    used to wait for it. Cancelling the awaiting task cancels the gRPC call.
+
+    Parameters
+    ----------
+    grpc_future :
+        The future returned by the ``.future`` method of a gRPC stub method.
+    on_success :
+        Callback which is run with the reply of the gRPC call. Its return
+        value is the result of the coroutine.
+    """
+    return await asyncio.wrap_future(GrpcCallFuture(grpc_future, on_success))
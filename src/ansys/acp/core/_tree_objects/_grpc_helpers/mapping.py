@@ -22,13 +22,13 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterator
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
 import inspect
-from typing import Any, Concatenate, Generic, TypeVar
+from typing import Any, Concatenate, Generic, TypeVar, cast
 
 import grpc
 from grpc import Channel
-from packaging.version import parse as parse_version
 from typing_extensions import ParamSpec, Self
 
 from ansys.api.acp.v0.base_pb2 import CollectionPath, DeleteRequest, ListRequest
@@ -39,8 +39,15 @@ from .._object_cache import ObjectCacheMixin, constructor_with_cache
 from ..base import CreatableTreeObject, ServerWrapper, TreeObject, TreeObjectBase
 from ..enums import Status
 from .exceptions import wrap_grpc_errors
+from .futures import await_grpc_call
+from .linked_object_helpers import get_linked_paths
 from .property_helper import _exposed_grpc_mapping_property, _wrap_doc
-from .protocols import EditableAndReadableResourceStub, ObjectInfo, ReadableResourceStub
+from .protocols import (
+    EditableAndReadableResourceStub,
+    ListReply,
+    ObjectInfo,
+    ReadableResourceStub,
+)
 
 ValueT = TypeVar("ValueT", bound=TreeObjectBase)
 CreatableValueT = TypeVar("CreatableValueT", bound=CreatableTreeObject)
@@ -110,10 +117,8 @@ class Mapping(ObjectCacheMixin, Generic[ValueT]):
 
     def _get_objectinfo_list(self) -> list[ObjectInfo]:
         with wrap_grpc_errors():
-            res = self._stub.List(ListRequest(collection_path=self._collection_path)).objects
-        if len({obj.info.id for obj in res}) != len(res):
-            raise ValueError("Duplicate ID in Collection.")
-        return res
+            reply = self._stub.List(ListRequest(collection_path=self._collection_path))
+        return _objectinfo_list_from_reply(reply)
 
     def _get_objectinfo_by_id(self, key: str) -> ObjectInfo:
         for obj in self._get_objectinfo_list():
@@ -151,6 +156,18 @@ class Mapping(ObjectCacheMixin, Generic[ValueT]):
         """Return an iterator over the keys of the mapping."""
         return iter(self)
 
+    async def alist(self) -> list[ValueT]:
+        """Return the values of the mapping, without blocking the event loop."""
+        # The stub type does not describe the '.future' method of gRPC multi-callables.
+        list_method = cast(Any, self._stub.List)
+        object_infos = await await_grpc_call(
+            list_method.future(ListRequest(collection_path=self._collection_path)),
+            on_success=_objectinfo_list_from_reply,
+        )
+        return [
+            self._object_constructor(obj_info, self._server_wrapper) for obj_info in object_infos
+        ]
+
     def __contains__(self, key: str) -> bool:
         """Return True if the mapping contains the given key."""
         return key in list(self)
@@ -221,31 +238,119 @@ class MutableMapping(Mapping[CreatableValueT]):
                     resource_path=obj_info.info.resource_path, version=obj_info.info.version
                 )
             )
+        self._server_wrapper.mark_modified(self._collection_path)
 
     def clear(self) -> None:
         """Remove all items from the mapping."""
-        for obj_info in self._get_objectinfo_list():
-            with wrap_grpc_errors():
-                try:
-                    self._stub.Delete(
+        self._delete_from_infos(self._get_objectinfo_list())
+
+    def delete_many(
+        self, keys_or_objects: Iterable[str | CreatableValueT], *, max_in_flight: int = 64
+    ) -> None:
+        """Remove multiple items from the mapping.
+
+        The delete requests for objects which do not depend on each other are
+        sent to the server concurrently. Objects which link to other objects
+        in the same collection are deleted first.
+
+        Parameters
+        ----------
+        keys_or_objects :
+            Keys or stored objects of the items to remove.
+        max_in_flight :
+            Maximum number of delete requests which are sent to the server
+            without having received a response.
+        """
+        info_by_path = {
+            obj_info.info.resource_path.value: obj_info for obj_info in self._get_objectinfo_list()
+        }
+        to_delete: dict[str, ObjectInfo] = {}
+        for item in keys_or_objects:
+            if isinstance(item, str):
+                resource_path_value = _rp_join(self._collection_path.value, item)
+            else:
+                resource_path_value = item._resource_path.value
+            try:
+                to_delete[resource_path_value] = info_by_path[resource_path_value]
+            except KeyError as exc:
+                raise KeyError(f"No object '{item}' found in the collection.") from exc
+        self._delete_from_infos(list(to_delete.values()), max_in_flight=max_in_flight)
+
+    def _delete_from_infos(self, object_infos: list[ObjectInfo], max_in_flight: int = 64) -> None:
+        """Delete the given objects, retrying on version conflicts.
+
+        Deleting an object may change the version of objects which link to
+        it. Such version conflicts are collected, and retried after
+        refreshing all object versions with a single 'List' request.
+        """
+        if max_in_flight < 1:
+            raise ValueError("The 'max_in_flight' argument must be at least 1.")
+        while object_infos:
+            conflicting_paths = set()
+            for batch in _order_for_deletion(object_infos):
+                conflicting_paths.update(self._delete_batch(batch, max_in_flight=max_in_flight))
+            if not conflicting_paths:
+                return
+            if len(conflicting_paths) == len(object_infos):
+                # None of the objects could be deleted, retrying would not change this.
+                raise RuntimeError(
+                    "The objects could not be deleted due to version conflicts: "
+                    + ", ".join(repr(path) for path in sorted(conflicting_paths))
+                )
+            object_infos = [
+                obj_info
+                for obj_info in self._get_objectinfo_list()
+                if obj_info.info.resource_path.value in conflicting_paths
+            ]
+
+    def _delete_batch(self, object_infos: list[ObjectInfo], max_in_flight: int) -> set[str]:
+        """Concurrently delete objects which do not depend on each other.
+
+        Returns the resource paths of the objects which could not be deleted
+        due to a version conflict.
+        """
+        # The stub protocol does not describe the '.future' method of
+        # gRPC multi-callables.
+        delete = cast(Any, self._stub.Delete)
+        pending: deque[tuple[ObjectInfo, grpc.Future]] = deque()
+        conflicting_paths: set[str] = set()
+        first_error: Exception | None = None
+
+        def _finish_oldest() -> None:
+            nonlocal first_error
+            obj_info, future = pending.popleft()
+            try:
+                with wrap_grpc_errors():
+                    try:
+                        future.result()
+                    except grpc.RpcError as exc:
+                        if exc.code() != grpc.StatusCode.FAILED_PRECONDITION:
+                            raise
+                        conflicting_paths.add(obj_info.info.resource_path.value)
+            except Exception as exc:
+                if first_error is None:
+                    first_error = exc
+
+        for obj_info in object_infos:
+            if len(pending) >= max_in_flight:
+                _finish_oldest()
+            pending.append(
+                (
+                    obj_info,
+                    delete.future(
                         DeleteRequest(
-                            resource_path=obj_info.info.resource_path, version=obj_info.info.version
+                            resource_path=obj_info.info.resource_path,
+                            version=obj_info.info.version,
                         )
-                    )
-                except grpc.RpcError as e:
-                    # The object version may have changed since the 'List' call,
-                    # since the object may become outdated when other objects are deleted.
-                    # In this case, we need to get the object info again and delete it.
-                    if e.code() == grpc.StatusCode.FAILED_PRECONDITION:
-                        obj_info = self._get_objectinfo_by_id(obj_info.info.id)
-                        self._stub.Delete(
-                            DeleteRequest(
-                                resource_path=obj_info.info.resource_path,
-                                version=obj_info.info.version,
-                            )
-                        )
-                    else:
-                        raise e
+                    ),
+                )
+            )
+        while pending:
+            _finish_oldest()
+        self._server_wrapper.mark_modified(self._collection_path)
+        if first_error is not None:
+            raise first_error
+        return conflicting_paths
 
     def pop(self, key: str) -> CreatableValueT:
         """Remove and return the value for key."""
@@ -264,6 +369,42 @@ class MutableMapping(Mapping[CreatableValueT]):
         return new_obj
 
 
+def _objectinfo_list_from_reply(reply: ListReply) -> list[ObjectInfo]:
+    object_infos = reply.objects
+    if len({obj.info.id for obj in object_infos}) != len(object_infos):
+        raise ValueError("Duplicate ID in Collection.")
+    return object_infos
+
+
+def _order_for_deletion(object_infos: list[ObjectInfo]) -> list[list[ObjectInfo]]:
+    """Split the objects into batches which can be deleted concurrently.
+
+    Objects which are linked to by other objects in the list are placed in a
+    later batch than the objects linking to them, since deleting them would
+    change the version of the linking objects.
+    """
+    info_by_path = {obj_info.info.resource_path.value: obj_info for obj_info in object_infos}
+    linked_paths = {
+        path: {
+            linked_path.value
+            for linked_path in get_linked_paths(obj_info.properties)
+            if linked_path.value in info_by_path and linked_path.value != path
+        }
+        for path, obj_info in info_by_path.items()
+    }
+    batches = []
+    remaining = set(info_by_path)
+    while remaining:
+        referenced = set().union(*(linked_paths[path] for path in remaining))
+        batch_paths = remaining - referenced
+        if not batch_paths:
+            # Cyclic links, no ordering can avoid version conflicts.
+            batch_paths = remaining
+        batches.append([info_by_path[path] for path in info_by_path if path in batch_paths])
+        remaining -= batch_paths
+    return batches
+
+
 ParentT = TypeVar("ParentT", bound=TreeObject)
 
 
@@ -277,13 +418,13 @@ def get_read_only_collection_property(
     """Define a read-only mapping of child tree objects."""
 
     def collection_property(self: ParentT) -> Mapping[ValueT]:
-        if supported_since is not None and self._server_version is not None:
-            if self._server_version < parse_version(supported_since):
-                raise RuntimeError(
-                    f"Accessing '{object_class.__name__}' objects on '{type(self).__name__}' "
-                    f"requires version {supported_since} of the ACP gRPC server. The current server version is "
-                    f"{self._server_version}."
-                )
+        capabilities = self._server_wrapper.capabilities
+        if not capabilities.supports(supported_since):
+            raise RuntimeError(
+                f"Accessing '{object_class.__name__}' objects on '{type(self).__name__}' "
+                f"requires version {supported_since} of the ACP gRPC server. The current server version is "
+                f"{capabilities.version}."
+            )
         if requires_uptodate and hasattr(self, "status") and not self.status == Status.UPTODATE:
             raise RuntimeError(
                 f"The object {self.name} must be up-to-date to access {object_class.__name__}."
@@ -294,7 +435,7 @@ def get_read_only_collection_property(
                 value=_rp_join(self._resource_path.value, object_class._COLLECTION_LABEL)
             ),
             object_constructor=object_class._from_object_info,
-            stub=stub_class(channel=self._server_wrapper.channel),
+            stub=self._server_wrapper.get_stub(stub_class),
         )
 
     return _wrap_doc(
@@ -343,13 +484,13 @@ def define_mutable_mapping(
     """Define a mutable mapping of child tree objects."""
 
     def collection_property(self: ParentT) -> MutableMapping[CreatableValueT]:
-        if self._server_version is not None:
-            if self._server_version < parse_version(object_class._SUPPORTED_SINCE):
-                raise RuntimeError(
-                    f"The '{object_class.__name__}' object is only supported since version "
-                    f"{object_class._SUPPORTED_SINCE} of the ACP gRPC server. The current server version is "
-                    f"{self._server_version}."
-                )
+        capabilities = self._server_wrapper.capabilities
+        if not capabilities.supports_object_type(object_class):
+            raise RuntimeError(
+                f"The '{object_class.__name__}' object is only supported since version "
+                f"{object_class._SUPPORTED_SINCE} of the ACP gRPC server. The current server version is "
+                f"{capabilities.version}."
+            )
 
         return MutableMapping._initialize_with_cache(
             server_wrapper=self._server_wrapper,
@@ -357,7 +498,7 @@ def define_mutable_mapping(
                 value=_rp_join(self._resource_path.value, object_class._COLLECTION_LABEL)
             ),
             object_constructor=object_class._from_object_info,
-            stub=stub_class(channel=self._server_wrapper.channel),
+            stub=self._server_wrapper.get_stub(stub_class),
         )
 
     return _wrap_doc(
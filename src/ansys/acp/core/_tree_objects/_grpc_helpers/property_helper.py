@@ -29,9 +29,11 @@ automatically synchronized with the backend via gRPC.
 from __future__ import annotations
 
 from collections.abc import Callable
+import contextlib
+from contextlib import AbstractContextManager
 from functools import reduce
 import sys
-from typing import TYPE_CHECKING, Any, TypeVar
+from typing import TYPE_CHECKING, Any, TypeVar, cast
 
 from google.protobuf.message import Message
 
@@ -86,6 +88,19 @@ else:
 
 T = TypeVar("T", bound=type[GrpcObjectBase])
 
+_NO_LOCK = contextlib.nullcontext()
+
+
+def object_lock(obj: Any) -> AbstractContextManager[Any]:
+    """Get the lock guarding the data of a tree object.
+
+    Attributes of tree objects use the lock of the tree object they belong to.
+    Objects which do not have a lock, such as unstored attributes, are not guarded.
+    """
+    while (parent := getattr(obj, "_parent_object", None)) is not None:
+        obj = parent
+    return cast(AbstractContextManager[Any], getattr(obj, "_lock", _NO_LOCK))
+
 
 def mark_grpc_properties(cls: T) -> T:
     """Class decorator to collect properties marked as exposed via gRPC.
@@ -146,8 +161,9 @@ def grpc_linked_object_getter(
     def inner(self: Readable) -> CreatableFromResourcePath | None:
         if not self._is_stored:
             raise RuntimeError(f"Cannot get linked object '{name}' from unstored object")
-        self._get()
-        object_resource_path = _get_data_attribute(self._pb_object, name)
+        with object_lock(self):
+            self._get()
+            object_resource_path = _get_data_attribute(self._pb_object, name)
 
         return tree_object_from_resource_path(
             object_resource_path, server_wrapper=self._server_wrapper
@@ -198,11 +214,12 @@ def grpc_data_getter(
         ),
     )
     def inner(self: Readable) -> Any:
-        self._get_if_stored()
-        pb_attribute = getter_func(self._pb_object, name, check_optional)
-        if check_optional and pb_attribute is None:
-            return None
-        return from_protobuf(pb_attribute)
+        with object_lock(self):
+            self._get_if_stored()
+            pb_attribute = getter_func(self._pb_object, name, check_optional)
+            if check_optional and pb_attribute is None:
+                return None
+            return from_protobuf(pb_attribute)
 
     return inner
 
@@ -257,16 +274,17 @@ def grpc_data_setter(
         ),
     )
     def inner(self: Editable, value: _SET_T) -> None:
-        self._get_if_stored()
-        current_value = _get_data_attribute(self._pb_object, name, check_optional=True)
         value_pb = to_protobuf(value)
-        try:
-            needs_updating = current_value != value_pb
-        except TypeError:
-            needs_updating = True
-        if needs_updating:
-            setter_func(self._pb_object, name, value_pb)
-            self._put_if_stored()
+        with object_lock(self):
+            self._get_if_stored()
+            current_value = _get_data_attribute(self._pb_object, name, check_optional=True)
+            try:
+                needs_updating = current_value != value_pb
+            except TypeError:
+                needs_updating = True
+            if needs_updating:
+                setter_func(self._pb_object, name, value_pb)
+                self._put_if_stored()
 
     return inner
 
@@ -22,19 +22,83 @@
 
 from collections.abc import Callable
 from functools import wraps
-from typing import Concatenate, TypeAlias, TypeVar
+from typing import Any, Concatenate, TypeAlias, TypeVar
 
+from packaging.version import Version
 from packaging.version import parse as parse_version
 from typing_extensions import ParamSpec
 
 from .protocols import Readable
 
+__all__ = ["ServerCapabilities", "supported_since"]
+
 T = TypeVar("T", bound=Readable)
 P = ParamSpec("P")
 R = TypeVar("R")
 _WRAPPED_T: TypeAlias = Callable[Concatenate[T, P], R]
 
 
+class ServerCapabilities:
+    """Features supported by the ACP server a client is connected to.
+
+    The object types supported by the server are determined once, when the
+    capabilities are created. Checks for other version requirements are
+    memoized, such that repeated checks do not need to parse and compare
+    versions.
+
+    Parameters
+    ----------
+    version :
+        Version of the ACP server.
+    """
+
+    def __init__(self, version: Version) -> None:
+        from ..object_registry import object_registry
+
+        self._version = version
+        self._supports_since: dict[str, bool] = {}
+        self._object_types = frozenset(
+            cls
+            for cls in object_registry.values()
+            if self.supports(getattr(cls, "_SUPPORTED_SINCE", None))
+        )
+
+    @property
+    def version(self) -> Version:
+        """Version of the ACP server."""
+        return self._version
+
+    @property
+    def object_types(self) -> frozenset[type[Any]]:
+        """Registered tree object types which are supported by the server."""
+        return self._object_types
+
+    def supports(self, version: str | None) -> bool:
+        """Check whether a feature added in the given server version is supported.
+
+        Parameters
+        ----------
+        version :
+            Server version in which the feature was added. If ``None``, the
+            feature is supported by all server versions.
+        """
+        if version is None:
+            return True
+        try:
+            return self._supports_since[version]
+        except KeyError:
+            # Concurrent calls may compute the result twice, which is harmless.
+            is_supported = self._version >= parse_version(version)
+            self._supports_since[version] = is_supported
+            return is_supported
+
+    def supports_object_type(self, object_class: type[Any]) -> bool:
+        """Check whether the server supports the given tree object type."""
+        if object_class in self._object_types:
+            return True
+        return self.supports(object_class._SUPPORTED_SINCE)
+
+
 def supported_since(
     version: str | None, err_msg_tpl: str | None = None
 ) -> Callable[[_WRAPPED_T[T, P, R]], _WRAPPED_T[T, P, R]]:
@@ -63,10 +127,11 @@ def supported_since(
     def decorator(func: _WRAPPED_T[T, P, R]) -> _WRAPPED_T[T, P, R]:
         @wraps(func)
         def inner(self: T, /, *args: P.args, **kwargs: P.kwargs) -> R:
-            server_version = self._server_version
             # If the object is not stored, we cannot check the server version.
-            if server_version is not None:
-                if server_version < required_version:
+            if self._is_stored:
+                capabilities = self._server_wrapper.capabilities
+                if not capabilities.supports(version):
+                    server_version = capabilities.version
                     if err_msg_tpl is None:
                         err_msg = (
                             f"The '{func.__name__}' method is only supported since version {version} "
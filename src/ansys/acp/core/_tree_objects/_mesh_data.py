@@ -22,12 +22,13 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Coroutine
 import dataclasses
 import typing
+from typing import Any, cast
 
 import numpy as np
 import numpy.typing as npt
-from packaging.version import parse as parse_version
 
 if typing.TYPE_CHECKING:  # pragma: no cover
     from pyvista.core.pointset import UnstructuredGrid
@@ -37,6 +38,7 @@ from ansys.api.acp.v0 import base_pb2, mesh_query_pb2, mesh_query_pb2_grpc
 from .._utils.array_conversions import to_numpy
 from .._utils.property_protocols import ReadOnlyProperty
 from .._utils.pyvista_import_check import requires_pyvista
+from ._grpc_helpers.futures import await_grpc_call
 from .base import TreeObject
 
 __all__ = [
@@ -44,6 +46,9 @@ __all__ = [
     "full_mesh_property",
     "shell_mesh_property",
     "solid_mesh_property",
+    "full_mesh_async_method",
+    "shell_mesh_async_method",
+    "solid_mesh_async_method",
 ]
 
 
@@ -76,44 +81,69 @@ class MeshData:
         )
 
 
+def _get_mesh_request(
+    self: TreeObject, element_scoping: mesh_query_pb2.ElementScopingType.ValueType
+) -> base_pb2.GetRequest | mesh_query_pb2.GetMeshDataRequest:
+    if not self._server_wrapper.capabilities.supports("25.1"):
+        from .model import Model
+
+        if not isinstance(self, Model):
+            raise RuntimeError(
+                "Mesh attributes for object types other than 'Model' are only supported "
+                "for server versions 25.1 and later."
+            )
+        if element_scoping != mesh_query_pb2.ElementScopingType.ALL:
+            raise RuntimeError(
+                "Element scoping is only supported for server versions 25.1 and later."
+            )
+        return base_pb2.GetRequest(resource_path=self._resource_path)
+    return mesh_query_pb2.GetMeshDataRequest(
+        resource_path=self._resource_path, element_scoping=element_scoping
+    )
+
+
+def _mesh_data_from_reply(reply: mesh_query_pb2.MeshData) -> MeshData:
+    return MeshData(
+        node_labels=to_numpy(reply.node_labels),
+        node_coordinates=to_numpy(reply.node_coordinates),
+        element_labels=to_numpy(reply.element_labels),
+        element_types=to_numpy(reply.element_types),
+        element_nodes=to_numpy(reply.element_nodes),
+        element_nodes_offsets=to_numpy(reply.element_nodes_offsets),
+    )
+
+
 def _mesh_property_impl(
     element_scoping: mesh_query_pb2.ElementScopingType.ValueType, doc: str
 ) -> ReadOnlyProperty[MeshData]:
     def getter(self: TreeObject) -> MeshData:
-        mesh_query_stub = mesh_query_pb2_grpc.MeshQueryServiceStub(self._channel)
-        assert self._server_version is not None
-        if self._server_version < parse_version("25.1"):
-            from .model import Model
-
-            if not isinstance(self, Model):
-                raise RuntimeError(
-                    "Mesh attributes for object types other than 'Model' are only supported "
-                    "for server versions 25.1 and later."
-                )
-            if element_scoping != mesh_query_pb2.ElementScopingType.ALL:
-                raise RuntimeError(
-                    "Element scoping is only supported for server versions 25.1 and later."
-                )
-            request: base_pb2.GetRequest | mesh_query_pb2.GetMeshDataRequest = base_pb2.GetRequest(
-                resource_path=self._resource_path
-            )
-        else:
-            request = mesh_query_pb2.GetMeshDataRequest(
-                resource_path=self._resource_path, element_scoping=element_scoping
-            )
-        reply = mesh_query_stub.GetMeshData(request)
-        return MeshData(
-            node_labels=to_numpy(reply.node_labels),
-            node_coordinates=to_numpy(reply.node_coordinates),
-            element_labels=to_numpy(reply.element_labels),
-            element_types=to_numpy(reply.element_types),
-            element_nodes=to_numpy(reply.element_nodes),
-            element_nodes_offsets=to_numpy(reply.element_nodes_offsets),
+        mesh_query_stub = self._server_wrapper.get_stub(
+            mesh_query_pb2_grpc.MeshQueryServiceStub, bulk_data=True
         )
+        reply = mesh_query_stub.GetMeshData(_get_mesh_request(self, element_scoping))
+        return _mesh_data_from_reply(reply)
 
     return property(getter, doc=doc)
 
 
+def _async_mesh_method_impl(
+    element_scoping: mesh_query_pb2.ElementScopingType.ValueType, doc: str
+) -> Callable[[TreeObject], Coroutine[Any, Any, MeshData]]:
+    async def method(self: TreeObject) -> MeshData:
+        mesh_query_stub = self._server_wrapper.get_stub(
+            mesh_query_pb2_grpc.MeshQueryServiceStub, bulk_data=True
+        )
+        # The stub type does not describe the '.future' method of gRPC multi-callables.
+        get_mesh_data = cast(Any, mesh_query_stub.GetMeshData)
+        return await await_grpc_call(
+            get_mesh_data.future(_get_mesh_request(self, element_scoping)),
+            on_success=_mesh_data_from_reply,
+        )
+
+    method.__doc__ = doc
+    return method
+
+
 full_mesh_property = _mesh_property_impl(
     mesh_query_pb2.ElementScopingType.ALL, doc="Full mesh associated with the object."
 )
@@ -123,3 +153,15 @@ shell_mesh_property = _mesh_property_impl(
 solid_mesh_property = _mesh_property_impl(
     mesh_query_pb2.ElementScopingType.SOLID, doc="Solid mesh associated with the object."
 )
+full_mesh_async_method = _async_mesh_method_impl(
+    mesh_query_pb2.ElementScopingType.ALL,
+    doc="Fetch the full mesh associated with the object, without blocking the event loop.",
+)
+shell_mesh_async_method = _async_mesh_method_impl(
+    mesh_query_pb2.ElementScopingType.SHELL,
+    doc="Fetch the shell mesh associated with the object, without blocking the event loop.",
+)
+solid_mesh_async_method = _async_mesh_method_impl(
+    mesh_query_pb2.ElementScopingType.SOLID,
+    doc="Fetch the solid mesh associated with the object, without blocking the event loop.",
+)
@@ -21,8 +21,10 @@
 # SOFTWARE.
 
 from collections.abc import Callable, Iterable
+import os
+import threading
 from typing import Any, Concatenate, TypeAlias, TypeVar
-from weakref import WeakValueDictionary
+from weakref import WeakSet, WeakValueDictionary
 
 from typing_extensions import ParamSpec, Self
 
@@ -34,6 +36,10 @@ __all__ = ["ObjectCacheMixin", "constructor_with_cache"]
 # So for now, we alias it to 'Any'
 _CACHE_KEY_T: TypeAlias = Any
 
+# Guards all object caches. Only the lookup and insertion hold the lock,
+# since constructors may issue requests and take the locks of other objects.
+_CACHE_LOCK = threading.Lock()
+
 
 class ObjectCacheMixin:
     """Mixin class to add an instance cache.
@@ -49,6 +55,7 @@ class ObjectCacheMixin:
 
     def __init_subclass__(cls: type[Self]) -> None:
         cls._OBJECT_CACHE = WeakValueDictionary()
+        _CACHED_CLASSES.add(cls)
         super().__init_subclass__()
 
     @staticmethod
@@ -56,6 +63,27 @@ class ObjectCacheMixin:
         raise NotImplementedError("The _cache_key_valid implementation is missing")
 
 
+_CACHED_CLASSES: WeakSet[type[ObjectCacheMixin]] = WeakSet()
+
+
+def _reset_after_fork() -> None:
+    """Clear the object caches in a forked child process.
+
+    The cached objects are bound to the connections of the parent process,
+    which cannot be used after a fork. Objects unpickled in the child must
+    instead use the connection created by the child.
+    """
+    global _CACHE_LOCK
+    # The lock may have been held by another thread of the parent while forking.
+    _CACHE_LOCK = threading.Lock()
+    for cls in _CACHED_CLASSES:
+        cls._OBJECT_CACHE = WeakValueDictionary()
+
+
+if hasattr(os, "register_at_fork"):  # Not available on Windows
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
 T = TypeVar("T", bound=ObjectCacheMixin, covariant=True)
 P = ParamSpec("P")
 
@@ -78,17 +106,24 @@ def constructor_with_cache(
     def decorator(func: _WRAPPED_T[T, P]) -> _WRAPPED_T[T, P]:
         def inner(cls: type[T], /, *args: P.args, **kwargs: P.kwargs) -> T:
             key = key_getter(*args, **kwargs)
-            if cls._cache_key_valid(key):
-                try:
-                    return cls._OBJECT_CACHE[key]
-                except KeyError:
-                    pass
+            key_valid = cls._cache_key_valid(key)
+            if key_valid:
+                with _CACHE_LOCK:
+                    try:
+                        return cls._OBJECT_CACHE[key]
+                    except KeyError:
+                        pass
             else:
                 if raise_on_invalid_key:
                     raise ValueError(f"Cache key '{key}' is invalid.")
             instance = func(cls, *args, **kwargs)
-            cls._OBJECT_CACHE[key] = instance
-            return instance
+            with _CACHE_LOCK:
+                if key_valid:
+                    # Another thread may have created an instance for the same
+                    # key in the meantime. It is returned, to keep them unique.
+                    return cls._OBJECT_CACHE.setdefault(key, instance)
+                cls._OBJECT_CACHE[key] = instance
+                return instance
 
         return inner
 
@@ -0,0 +1,403 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""In-memory snapshots of the definition objects in a model."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+import dataclasses
+import hashlib
+import typing
+from typing import Any
+
+from google.protobuf.message import Message
+import grpc
+
+from ansys.api.acp.v0.base_pb2 import GetRequest, ResourcePath
+
+from .._utils.resource_paths import join as _rp_join
+from .._utils.resource_paths import to_parts
+from ._grpc_helpers.exceptions import wrap_grpc_errors
+from ._grpc_helpers.linked_object_helpers import get_linked_paths
+from ._grpc_helpers.mapping import Mapping, _order_for_deletion
+from ._grpc_helpers.polymorphic_from_pb import tree_object_from_resource_path
+from ._grpc_helpers.protocols import ObjectInfo
+from .base import CreatableTreeObject, TreeObject
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    from .model import Model
+
+__all__ = ["ModelCheckpoint"]
+
+# Properties which are changed by the server, for example when updating the model.
+# They are not part of the object definition.
+_VOLATILE_PROPERTY_NAMES = ("status",)
+
+# Look-up table columns which are created automatically with their look-up table.
+_AUTO_CREATED_COLUMN_ID = "Location"
+_LOOKUP_TABLE_COLUMN_LABELS = ("lookup_table_1d_columns", "lookup_table_3d_columns")
+
+
+@dataclasses.dataclass(frozen=True)
+class ModelCheckpoint:
+    """In-memory snapshot of the definition objects of a model.
+
+    Checkpoints are created with :meth:`.Model.checkpoint`, and can be applied
+    to a model with :meth:`.Model.restore`.
+
+    The objects are stored as serialized protobuf messages. Resource paths,
+    including links between objects, are stored relative to the model. This
+    allows restoring a checkpoint on a different model, for example a copy
+    of the model loaded on another server.
+
+    Objects which are generated by the server, such as analysis plies, are
+    not included in the checkpoint.
+
+    Parameters
+    ----------
+    object_infos :
+        Relative resource paths and serialized ``ObjectInfo`` messages of the objects.
+    """
+
+    object_infos: tuple[tuple[str, bytes], ...]
+
+    def __len__(self) -> int:
+        return len(self.object_infos)
+
+    def _parse(self) -> dict[str, ObjectInfo]:
+        res = {}
+        for relative_path, serialized_info in self.object_infos:
+            object_info = _object_class(relative_path)._OBJECT_INFO_TYPE()
+            object_info.ParseFromString(serialized_info)
+            res[relative_path] = object_info
+        return res
+
+
+def _object_class(relative_path: str) -> Any:
+    from .model import Model
+    from .object_registry import object_registry
+
+    if not relative_path:
+        return Model
+    return object_registry[relative_path.split("/")[::2][-1]]
+
+
+def _walk_definition_objects(root: TreeObject) -> Iterator[tuple[TreeObject, ObjectInfo]]:
+    """Yield all definition objects in the subtree of the root object.
+
+    The root object is included. The object information is obtained with one
+    'List' request per collection, and returned alongside the object.
+    """
+    root._get()
+    stack: list[tuple[TreeObject, ObjectInfo]] = [(root, root._pb_object)]
+    while stack:
+        tree_object, object_info = stack.pop()
+        yield tree_object, object_info
+        children = []
+        for mapping in _iter_child_mappings(tree_object):
+            for child_info in mapping._get_objectinfo_list():
+                children.append(
+                    (mapping._object_constructor(child_info, mapping._server_wrapper), child_info)
+                )
+        stack.extend(reversed(children))
+
+
+def _iter_child_mappings(tree_object: TreeObject) -> Iterator[Mapping[Any]]:
+    for attr_name in tree_object._GRPC_PROPERTIES:
+        descriptor = getattr(type(tree_object), attr_name, None)
+        # Only the mutable mappings contain definition objects. The read-only
+        # mappings contain objects generated by the server.
+        if getattr(descriptor, "_read_only", True):
+            continue
+        try:
+            mapping = getattr(tree_object, attr_name)
+        except RuntimeError:
+            # The collection is not supported by the server version.
+            continue
+        if isinstance(mapping, Mapping):
+            yield mapping
+
+
+def _relative_path(path: str, model_path: str) -> str:
+    if not path:
+        return ""
+    if path == model_path:
+        return ""
+    if not path.startswith(model_path + "/"):
+        raise ValueError(f"The resource path '{path}' is not located in the model '{model_path}'.")
+    return path[len(model_path) + 1 :]
+
+
+def _normalized_object_info(object_info: ObjectInfo, model_path: str) -> ObjectInfo:
+    """Get a copy of the object info, in a form which only depends on its definition.
+
+    The resource path, version and volatile properties are removed, and links
+    are converted to paths relative to the model.
+    """
+    normalized = type(object_info)()
+    normalized.CopyFrom(object_info)  # type: ignore
+    normalized.info.ClearField("resource_path")
+    normalized.info.ClearField("version")
+    for name in _VOLATILE_PROPERTY_NAMES:
+        if name in normalized.properties.DESCRIPTOR.fields_by_name:
+            normalized.properties.ClearField(name)
+    for linked_path in get_linked_paths(normalized.properties):
+        linked_path.value = _relative_path(linked_path.value, model_path)
+    return normalized
+
+
+def _serialize(object_info: ObjectInfo) -> bytes:
+    return typing.cast(Message, object_info).SerializeToString(deterministic=True)
+
+
+def create_checkpoint(model: Model) -> ModelCheckpoint:
+    """Create a checkpoint of the definition objects of a model."""
+    model_path = model._resource_path.value
+    return ModelCheckpoint(
+        object_infos=tuple(
+            (
+                _relative_path(object_info.info.resource_path.value, model_path),
+                _serialize(_normalized_object_info(object_info, model_path)),
+            )
+            for _, object_info in _walk_definition_objects(model)
+        )
+    )
+
+
+def _parent_path(relative_path: str) -> str:
+    return _rp_join(*to_parts(relative_path)[:-2]) if relative_path else ""
+
+
+def _content_hash(serialized_info: bytes) -> bytes:
+    return hashlib.sha256(serialized_info).digest()
+
+
+def _subtree_hashes(serialized_infos: dict[str, bytes]) -> dict[str, bytes]:
+    """Compute the Merkle tree hashes of all objects.
+
+    The subtree hash of an object combines its content hash with the relative
+    paths and subtree hashes of its children. Two subtrees with the same hash
+    are (with overwhelming probability) identical.
+    """
+    children: dict[str, list[str]] = {path: [] for path in serialized_infos}
+    for path in serialized_infos:
+        if path:
+            children.setdefault(_parent_path(path), []).append(path)
+    subtree_hashes: dict[str, bytes] = {}
+    # Handle the deepest objects first, such that the hashes of all children
+    # are known when the parent hash is computed.
+    for path in sorted(serialized_infos, key=lambda path: -len(to_parts(path))):
+        hasher = hashlib.sha256(_content_hash(serialized_infos[path]))
+        for child_path in sorted(children[path]):
+            hasher.update(child_path.encode())
+            hasher.update(subtree_hashes[child_path])
+        subtree_hashes[path] = hasher.digest()
+    return subtree_hashes
+
+
+def _serialized_properties(object_info: ObjectInfo) -> bytes:
+    """Serialize the properties of an object, in a form which only depends on its definition.
+
+    Volatile properties are removed, and links are converted to paths relative
+    to the model containing the linked object.
+    """
+    properties = type(object_info.properties)()
+    properties.CopyFrom(object_info.properties)
+    for name in _VOLATILE_PROPERTY_NAMES:
+        if name in properties.DESCRIPTOR.fields_by_name:
+            properties.ClearField(name)
+    for linked_path in get_linked_paths(properties):
+        linked_path.value = _rp_join(*to_parts(linked_path.value)[2:])
+    return properties.SerializeToString(deterministic=True)
+
+
+def object_content_hash(object_info: ObjectInfo) -> bytes:
+    """Compute the hash of the properties of an object."""
+    return _content_hash(_serialized_properties(object_info))
+
+
+def object_subtree_hash(root: TreeObject) -> bytes:
+    """Compute the Merkle tree hash of the properties of an object and its children."""
+    model_path = _rp_join(*to_parts(root._resource_path.value)[:2])
+    serialized_properties = {
+        _relative_path(object_info.info.resource_path.value, model_path): _serialized_properties(
+            object_info
+        )
+        for _, object_info in _walk_definition_objects(root)
+    }
+    return _subtree_hashes(serialized_properties)[
+        _relative_path(root._resource_path.value, model_path)
+    ]
+
+
+def _dependencies(relative_path: str, object_info: ObjectInfo) -> list[str]:
+    """Get the objects which need to exist before the given object can be created."""
+    dependencies = [_parent_path(relative_path)]
+    dependencies.extend(path.value for path in get_linked_paths(object_info.properties))
+    parts = to_parts(relative_path)
+    if len(parts) >= 2 and parts[-2] in _LOOKUP_TABLE_COLUMN_LABELS:
+        # The 'Location' column defines the length of the other columns.
+        if parts[-1] != _AUTO_CREATED_COLUMN_ID:
+            dependencies.append(_rp_join(*parts[:-1], _AUTO_CREATED_COLUMN_ID))
+    return dependencies
+
+
+def _dependency_order(object_infos: dict[str, ObjectInfo]) -> list[str]:
+    """Sort the paths such that dependencies come before the objects depending on them."""
+    ordered: list[str] = []
+    visited: set[str] = set()
+    for start_path in object_infos:
+        stack = [(start_path, False)]
+        while stack:
+            path, dependencies_handled = stack.pop()
+            if dependencies_handled:
+                ordered.append(path)
+                continue
+            if path in visited:
+                continue
+            visited.add(path)
+            stack.append((path, True))
+            for dependency in _dependencies(path, object_infos[path]):
+                if dependency in object_infos and dependency not in visited:
+                    stack.append((dependency, False))
+    return ordered
+
+
+def restore_checkpoint(model: Model, checkpoint: ModelCheckpoint) -> None:
+    """Apply the minimal changes to bring the model into the state of the checkpoint."""
+    model_path = model._resource_path.value
+    server_wrapper = model._server_wrapper
+
+    current_objects: dict[str, TreeObject] = {}
+    current_infos: dict[str, ObjectInfo] = {}
+    for tree_object, object_info in _walk_definition_objects(model):
+        relative_path = _relative_path(object_info.info.resource_path.value, model_path)
+        current_objects[relative_path] = tree_object
+        current_infos[relative_path] = object_info
+    target_infos = checkpoint._parse()
+
+    # Objects which are re-created get a new resource path. The mapping from
+    # the old to the new relative path is used to update links and parent paths.
+    path_mapping: dict[str, str] = {}
+
+    def _to_absolute(relative_path: str) -> str:
+        relative_path = path_mapping.get(relative_path, relative_path)
+        return _rp_join(model_path, relative_path) if relative_path else model_path
+
+    def _absolute_target_info(relative_path: str) -> ObjectInfo:
+        object_info = type(target_infos[relative_path])()
+        object_info.CopyFrom(target_infos[relative_path])  # type: ignore
+        for linked_path in get_linked_paths(object_info.properties):
+            if linked_path.value:
+                linked_path.value = _to_absolute(linked_path.value)
+        return object_info
+
+    changed_location_columns = set()
+    for relative_path in _dependency_order(target_infos):
+        target_info = _absolute_target_info(relative_path)
+        if relative_path in current_infos:
+            if _serialize(
+                _normalized_object_info(current_infos[relative_path], model_path)
+            ) == _serialize(target_infos[relative_path]) and not (
+                _parent_path(relative_path) in changed_location_columns
+            ):
+                continue
+            _put(current_objects[relative_path], current_infos[relative_path], target_info)
+            if to_parts(relative_path)[-1] == _AUTO_CREATED_COLUMN_ID:
+                # Changing the length of the 'Location' column changes the other columns.
+                changed_location_columns.add(_parent_path(relative_path))
+            continue
+
+        parent_path = _to_absolute(_parent_path(relative_path))
+        object_class = _object_class(relative_path)
+        parts = to_parts(relative_path)
+        if parts[-2] in _LOOKUP_TABLE_COLUMN_LABELS and parts[-1] == _AUTO_CREATED_COLUMN_ID:
+            # The column was created automatically with its (re-created) look-up table.
+            new_path = _rp_join(parent_path, parts[-2], parts[-1])
+            column = tree_object_from_resource_path(
+                ResourcePath(value=new_path), server_wrapper=server_wrapper
+            )
+            assert isinstance(column, TreeObject)
+            column._get()
+            _put(column, column._pb_object, target_info)
+            changed_location_columns.add(_parent_path(relative_path))
+        else:
+            parent = tree_object_from_resource_path(
+                ResourcePath(value=parent_path), server_wrapper=server_wrapper
+            )
+            assert isinstance(parent, TreeObject)
+            new_object_info = object_class._OBJECT_INFO_TYPE()
+            new_object_info.info.name = target_info.info.name
+            new_object_info.properties.CopyFrom(target_info.properties)
+            new_object: CreatableTreeObject = object_class._from_object_info(
+                object_info=new_object_info
+            )
+            new_object.store(parent=parent)
+            new_path = new_object._resource_path.value
+        path_mapping[relative_path] = _relative_path(new_path, model_path)
+
+    deleted_paths = {
+        relative_path for relative_path in current_infos if relative_path not in target_infos
+    }
+    # Children are deleted together with their parent.
+    deleted_infos = [
+        current_infos[relative_path]
+        for relative_path in deleted_paths
+        if not any(
+            _rp_join(*to_parts(relative_path)[:i]) in deleted_paths
+            for i in range(2, len(to_parts(relative_path)), 2)
+        )
+    ]
+    for batch in _order_for_deletion(deleted_infos):
+        for object_info in batch:
+            tree_object = current_objects[
+                _relative_path(object_info.info.resource_path.value, model_path)
+            ]
+            # The version may have changed due to the previous modifications.
+            tree_object._get()
+            tree_object.delete()
+
+
+def _put(tree_object: TreeObject, current_info: ObjectInfo, target_info: ObjectInfo) -> None:
+    new_info = type(current_info)()
+    new_info.CopyFrom(current_info)  # type: ignore
+    new_info.info.name = target_info.info.name
+    new_info.properties.CopyFrom(target_info.properties)
+    for name in _VOLATILE_PROPERTY_NAMES:
+        if name in current_info.properties.DESCRIPTOR.fields_by_name:
+            setattr(new_info.properties, name, getattr(current_info.properties, name))
+
+    stub = tree_object._get_stub()
+    with wrap_grpc_errors():
+        try:
+            reply = stub.Put(new_info)
+        except grpc.RpcError as exc:
+            if exc.code() != grpc.StatusCode.FAILED_PRECONDITION:
+                raise
+            # The version was changed by a previous modification.
+            new_info.info.version = stub.Get(
+                GetRequest(resource_path=new_info.info.resource_path)
+            ).info.version
+            reply = stub.Put(new_info)
+    tree_object._pb_object = reply
+    tree_object._server_wrapper.mark_modified(tree_object._resource_path)
@@ -26,7 +26,7 @@ import typing
 
 from ansys.api.acp.v0 import solid_model_export_pb2
 
-from .._utils.typing_helper import PATH as _PATH
+from .._utils.typing_helper import PATH_OR_BINARY_IO as _PATH_OR_BINARY_IO
 from ._grpc_helpers.exceptions import wrap_grpc_errors
 from .base import CreatableTreeObject
 from .enums import (
@@ -38,25 +38,37 @@ from .enums import (
 
 __all__ = ["SolidModelExportMixin"]
 
+# File name suffixes of the temporary files used for exports to streams.
+_EXPORT_SUFFIXES = {
+    "ansys:h5": ".h5",
+    "ansys:cdb": ".cdb",
+    "step": ".step",
+    "iges": ".iges",
+    "stl": ".stl",
+}
+
 
 class SolidModelExportMixin(CreatableTreeObject):
     """Mixin class for adding export functionality to the solid model and imported solid model classes."""
 
-    def export(self, path: _PATH, *, format: SolidModelExportFormat) -> None:
+    def export(self, path: _PATH_OR_BINARY_IO, *, format: SolidModelExportFormat) -> None:
         """Export the solid model to a file.
 
         Parameters
         ----------
         path :
-            Path to the file where the solid model is saved.
+            Path to the file where the solid model is saved, or binary
+            file-like object to which the file content is written.
         format :
             Format of the exported file. Available formats are ``"ansys:h5"``
             and ``"ansys:cdb"``.
 
         """
-        with self._server_wrapper.auto_download(path) as export_path:
+        with self._server_wrapper.auto_download(
+            path, suffix=_EXPORT_SUFFIXES.get(format, "")
+        ) as export_path:
             with wrap_grpc_errors():
-                self._get_stub().ExportToFile(  # type: ignore
+                self._get_bulk_data_stub(type(self._get_stub())).ExportToFile(  # type: ignore
                     solid_model_export_pb2.ExportToFileRequest(
                         resource_path=self._resource_path,
                         path=export_path,
@@ -64,21 +76,24 @@ class SolidModelExportMixin(CreatableTreeObject):
                     )
                 )
 
-    def export_skin(self, path: _PATH, *, format: SolidModelSkinExportFormat) -> None:
+    def export_skin(self, path: _PATH_OR_BINARY_IO, *, format: SolidModelSkinExportFormat) -> None:
         """Export the skin of the solid model to a file.
 
         Parameters
         ----------
         path :
-            Path to the file where the solid model skin is saved.
+            Path to the file where the solid model skin is saved, or binary
+            file-like object to which the file content is written.
         format :
             Format of the exported file. Available formats are ``"ansys:cdb"``,
             ``"step"``, ``"iges"``, and ``"stl"``.
 
         """
-        with self._server_wrapper.auto_download(path) as export_path:
+        with self._server_wrapper.auto_download(
+            path, suffix=_EXPORT_SUFFIXES.get(format, "")
+        ) as export_path:
             with wrap_grpc_errors():
-                self._get_stub().ExportSkin(  # type: ignore
+                self._get_bulk_data_stub(type(self._get_stub())).ExportSkin(  # type: ignore
                     solid_model_export_pb2.ExportSkinRequest(
                         resource_path=self._resource_path,
                         path=export_path,
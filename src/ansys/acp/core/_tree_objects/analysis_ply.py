@@ -43,7 +43,14 @@ from ._grpc_helpers.property_helper import (
     grpc_link_property_read_only,
     mark_grpc_properties,
 )
-from ._mesh_data import full_mesh_property, shell_mesh_property, solid_mesh_property
+from ._mesh_data import (
+    full_mesh_async_method,
+    full_mesh_property,
+    shell_mesh_async_method,
+    shell_mesh_property,
+    solid_mesh_async_method,
+    solid_mesh_property,
+)
 from .base import IdTreeObject, ReadOnlyTreeObject
 from .enums import status_type_from_pb
 from .object_registry import register
@@ -111,7 +118,7 @@ class AnalysisPly(ReadOnlyTreeObject, IdTreeObject):
     _SUPPORTED_SINCE = "24.2"
 
     def _create_stub(self) -> analysis_ply_pb2_grpc.ObjectServiceStub:
-        return analysis_ply_pb2_grpc.ObjectServiceStub(self._channel)
+        return self._server_wrapper.get_stub(analysis_ply_pb2_grpc.ObjectServiceStub)
 
     status = grpc_data_property_read_only("properties.status", from_protobuf=status_type_from_pb)
     material = grpc_link_property_read_only("properties.material")
@@ -122,7 +129,10 @@ class AnalysisPly(ReadOnlyTreeObject, IdTreeObject):
     )
 
     mesh = full_mesh_property
+    amesh = full_mesh_async_method
     shell_mesh = shell_mesh_property
+    ashell_mesh = shell_mesh_async_method
     solid_mesh = solid_mesh_property
+    asolid_mesh = solid_mesh_async_method
     elemental_data = elemental_data_property(AnalysisPlyElementalData)
     nodal_data = nodal_data_property(AnalysisPlyNodalData)
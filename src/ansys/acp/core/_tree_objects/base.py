@@ -25,12 +25,17 @@
 from __future__ import annotations
 
 from abc import abstractmethod
-from collections.abc import Callable, Iterable, Iterator
+from collections.abc import Callable, Iterable, Iterator, Sequence
 import contextlib
-from dataclasses import dataclass
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import cached_property
+import os
+import threading
 import typing
 from typing import Any, Generic, TypeVar, cast
 
+from google.protobuf.message import Message
 from grpc import Channel
 from packaging.version import Version
 from packaging.version import parse as parse_version
@@ -38,14 +43,16 @@ from typing_extensions import Self
 
 from ansys.api.acp.v0.base_pb2 import CollectionPath, DeleteRequest, GetRequest, ResourcePath
 
-from .._server.acp_instance import ACPInstance, FileTransferHandler
+from .._server.transport import RetryPolicy
+from .._utils.modification_tracker import ModificationTracker
 from .._utils.path_to_str import path_to_str_checked
 from .._utils.property_protocols import ReadOnlyProperty, ReadWriteProperty
 from .._utils.resource_paths import common_path
 from .._utils.resource_paths import join as _rp_join
 from .._utils.resource_paths import to_parts
-from .._utils.typing_helper import PATH
+from .._utils.typing_helper import PATH, PATH_OR_BINARY_IO
 from ._grpc_helpers.exceptions import wrap_grpc_errors
+from ._grpc_helpers.futures import await_grpc_call
 from ._grpc_helpers.linked_object_helpers import get_linked_paths, unlink_objects
 from ._grpc_helpers.polymorphic_from_pb import (
     CreatableFromResourcePath,
@@ -68,14 +75,20 @@ from ._grpc_helpers.protocols import (
     Readable,
     ReadableResourceStub,
 )
+from ._grpc_helpers.supported_since import ServerCapabilities
 from ._object_cache import ObjectCacheMixin, constructor_with_cache
 
+if typing.TYPE_CHECKING:  # pragma: no cover
+    # Only imported for type checking, since the ACP instance module
+    # imports this package.
+    from .._server.acp_instance import ACPInstance, FileTransferHandler
+
 
 @mark_grpc_properties
 class TreeObjectBase(ObjectCacheMixin, GrpcObjectBase):
     """Base class for ACP tree objects."""
 
-    __slots__: Iterable[str] = ("_server_wrapper_store", "_pb_object")
+    __slots__: Iterable[str] = ("_server_wrapper_store", "_pb_object", "_lock", "_use_local_data")
 
     _COLLECTION_LABEL: str
     _OBJECT_INFO_TYPE: type[ObjectInfo]
@@ -87,6 +100,12 @@ class TreeObjectBase(ObjectCacheMixin, GrpcObjectBase):
     def __init__(self: TreeObjectBase, name: str = "") -> None:
         self._server_wrapper_store: ServerWrapper | None = None
         self._pb_object: ObjectInfo = self._OBJECT_INFO_TYPE()
+        # Guards the local copy of the object data ('_pb_object'), such that
+        # reading or modifying a property is atomic with respect to other threads.
+        self._lock = threading.RLock()
+        # While set, '_pb_object' is used as-is instead of being synchronized
+        # with the server on property access.
+        self._use_local_data = False
         # We don't want to invoke gRPC requests for setting the name
         # during object construction, so we set the name directly on
         # the protobuf object.
@@ -109,6 +128,65 @@ class TreeObjectBase(ObjectCacheMixin, GrpcObjectBase):
     def __hash__(self) -> int:
         return id(self)
 
+    @abstractmethod
+    def _get_stub(self) -> ReadableResourceStub: ...
+
+    def _get_bulk_data_stub(self, stub_class: Callable[[Channel], StubT]) -> StubT:
+        """Get a stub of the object's service on the bulk data channel."""
+        return self._server_wrapper.get_stub(stub_class, bulk_data=True)
+
+    async def aget(self, *property_names: str) -> dict[str, Any]:
+        """Fetch the object from the server, without blocking the event loop.
+
+        The object data is retrieved with a single non-blocking request, and
+        the given properties are then read from the retrieved data.
+
+        Parameters
+        ----------
+        property_names :
+            Names of the properties to read.
+
+        Returns
+        -------
+        :
+            Dictionary mapping the property names to their values.
+        """
+        if self._is_stored:
+            # The stub type does not describe the '.future' method of gRPC multi-callables.
+            get_method = cast(Any, self._get_stub().Get)
+            object_info = await await_grpc_call(
+                get_method.future(GetRequest(resource_path=self._resource_path)),
+                on_success=lambda reply: reply,
+            )
+        with self._lock:
+            if self._is_stored:
+                self._pb_object = object_info
+            use_local_data = self._use_local_data
+            self._use_local_data = True
+            try:
+                return {name: getattr(self, name) for name in property_names}
+            finally:
+                self._use_local_data = use_local_data
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Stored objects are pickled as a handle consisting of their type,
+        # resource path, and the connection to the server. Unstored objects
+        # are pickled with their (serialized) data.
+        if not self._is_stored:
+            return (
+                _unstored_tree_object_from_data,
+                (type(self), cast(Message, self._pb_object).SerializeToString()),
+            )
+        acp_instance = self._server_wrapper.acp_instance
+        if acp_instance is None:
+            raise TypeError(
+                f"Cannot pickle '{type(self).__name__}', since its ACP instance is unknown."
+            )
+        return (
+            _tree_object_from_handle,
+            (type(self), self._resource_path.value, acp_instance),
+        )
+
     @classmethod
     @constructor_with_cache(
         key_getter=lambda object_info, *args, **kwargs: object_info.info.resource_path.value,
@@ -183,6 +261,24 @@ class TreeObjectBase(ObjectCacheMixin, GrpcObjectBase):
     name = grpc_data_property_read_only("info.name", doc="The name of the object.")
 
 
+def _unstored_tree_object_from_data(cls: type[TreeObjectBase], serialized_data: bytes) -> Any:
+    object_info = cls._OBJECT_INFO_TYPE()
+    cast(Message, object_info).ParseFromString(serialized_data)
+    return cls._from_object_info(object_info=object_info)
+
+
+def _tree_object_from_handle(
+    cls: type[TreeObjectBase], resource_path: str, acp_instance: ACPInstance[Any]
+) -> Any:
+    # The ACP instance is unpickled into a cached per-process connection, so
+    # the server wrapper is shared by all objects of that instance.
+    server_wrapper = ServerWrapper.from_acp_instance(acp_instance)
+    return cls._from_resource_path(ResourcePath(value=resource_path), server_wrapper)
+
+
+_SERVER_WRAPPER_LOCK = threading.Lock()
+
+
 StubT = TypeVar("StubT")
 
 
@@ -197,15 +293,72 @@ class ServerWrapper:
     channel: Channel
     version: Version
     filetransfer_handler: FileTransferHandler
+    modification_tracker: ModificationTracker = field(
+        default_factory=ModificationTracker, compare=False
+    )
+    acp_instance: ACPInstance[Any] | None = field(default=None, compare=False)
+    bulk_data_channel: Channel | None = field(default=None, compare=False)
+    retry_policy: RetryPolicy | None = field(default=None, compare=False)
+    _stubs: dict[tuple[Callable[[Channel], Any], bool], Any] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     @classmethod
     def from_acp_instance(cls, acp_instance: ACPInstance[Any]) -> ServerWrapper:
-        """Convert an ACP instance into the wrapper needed by tree objects."""
-        return cls(
-            channel=acp_instance._channel,
-            version=parse_version(acp_instance.server_version),
-            filetransfer_handler=acp_instance._filetransfer_handler,
-        )
+        """Convert an ACP instance into the wrapper needed by tree objects.
+
+        The wrapper is created once per connection of the ACP instance, and
+        reused until the instance is restarted.
+        """
+        with _SERVER_WRAPPER_LOCK:
+            server_wrapper = acp_instance._server_wrapper_cache
+            channel = acp_instance._channel
+            if server_wrapper is None or server_wrapper.channel is not channel:
+                server_wrapper = cls(
+                    channel=channel,
+                    version=parse_version(acp_instance.server_version),
+                    filetransfer_handler=acp_instance._filetransfer_handler,
+                    modification_tracker=acp_instance._modification_tracker,
+                    acp_instance=acp_instance,
+                    bulk_data_channel=acp_instance._bulk_data_channel,
+                    retry_policy=acp_instance._retry_policy,
+                )
+                acp_instance._server_wrapper_cache = server_wrapper
+            return server_wrapper
+
+    @cached_property
+    def capabilities(self) -> ServerCapabilities:
+        """Features supported by the server version."""
+        return ServerCapabilities(self.version)
+
+    def get_stub(self, stub_class: Callable[[Channel], StubT], *, bulk_data: bool = False) -> StubT:
+        """Get a stub for the given gRPC service on the server channel.
+
+        The stub is created on first use, and shared by all objects on
+        this connection.
+
+        Parameters
+        ----------
+        stub_class :
+            Stub class of the gRPC service.
+        bulk_data :
+            Whether the stub is used for calls which transfer large amounts of
+            data, or run for a long time. These use the bulk data channel if
+            it exists, such that they do not delay other calls.
+        """
+        key = (stub_class, bulk_data)
+        try:
+            return cast(StubT, self._stubs[key])
+        except KeyError:
+            channel = self.channel
+            if bulk_data and self.bulk_data_channel is not None:
+                channel = self.bulk_data_channel
+            # Concurrent calls may create the stub twice, but only one is kept.
+            return cast(StubT, self._stubs.setdefault(key, stub_class(channel)))
+
+    def mark_modified(self, resource_path: ResourcePath | CollectionPath) -> None:
+        """Mark the model containing the given object or collection as modified."""
+        self.modification_tracker.mark_modified(resource_path.value)
 
     def auto_upload(self, local_path: PATH | None, allow_none: bool = False) -> str:
         """Handle auto-transfer of a file to the server."""
@@ -217,12 +370,82 @@ class ServerWrapper:
             self.filetransfer_handler.upload_file_if_autotransfer(local_path)
         )
 
+    def auto_upload_many(self, local_paths: Sequence[PATH]) -> list[str]:
+        """Handle auto-transfer of multiple files to the server, in parallel."""
+        return [
+            path_to_str_checked(remote_path)
+            for remote_path in self.filetransfer_handler.upload_many_if_autotransfer(local_paths)
+        ]
+
     @contextlib.contextmanager
-    def auto_download(self, local_path: PATH) -> Iterator[str]:
-        """Handle auto-transfer of a file from the server."""
-        export_path = self.filetransfer_handler.to_export_path(local_path)
-        yield path_to_str_checked(export_path)
-        self.filetransfer_handler.download_file_if_autotransfer(export_path, local_path)
+    def auto_download(self, local_path: PATH_OR_BINARY_IO, *, suffix: str = "") -> Iterator[str]:
+        """Handle auto-transfer of a file from the server.
+
+        If ``local_path`` is a binary file-like object, the export is written
+        to a temporary file with the given ``suffix``, and its content is
+        streamed to the object without creating a local copy of the file.
+        On a remote server, the temporary file is not removed. Streaming is
+        not supported for a remote server without auto-transfer.
+
+        Inside a :func:`deferred_downloads` context, the download is passed to the
+        context's callback instead of being run immediately.
+        """
+        export_path: PATH
+        if isinstance(local_path, (str, os.PathLike)):
+            export_path = self.filetransfer_handler.to_export_path(local_path)
+            yield path_to_str_checked(export_path)
+
+            def _download() -> None:
+                self.filetransfer_handler.download_file_if_autotransfer(export_path, local_path)
+
+        else:
+            stream = local_path
+            export_path = self.filetransfer_handler.to_stream_export_path(suffix)
+            yield path_to_str_checked(export_path)
+
+            def _download() -> None:
+                self.filetransfer_handler.download_to_stream_if_autotransfer(export_path, stream)
+
+        submit_download = _SUBMIT_DOWNLOAD.get()
+        if submit_download is None:
+            _download()
+        else:
+            submit_download(_download)
+
+
+_SUBMIT_DOWNLOAD: ContextVar[Callable[[Callable[[], None]], None] | None] = ContextVar(
+    "_SUBMIT_DOWNLOAD", default=None
+)
+
+
+def after_downloads(func: Callable[[], None]) -> None:
+    """Run a function once the downloads of the current exports have completed.
+
+    Inside a :func:`deferred_downloads` context, the function is passed to the
+    context's callback after the downloads. Otherwise, it is run immediately.
+    """
+    submit_download = _SUBMIT_DOWNLOAD.get()
+    if submit_download is None:
+        func()
+    else:
+        submit_download(func)
+
+
+@contextlib.contextmanager
+def deferred_downloads(submit_download: Callable[[Callable[[], None]], None]) -> Iterator[None]:
+    """Defer the file downloads of exports run in this context.
+
+    Parameters
+    ----------
+    submit_download :
+        Callback which receives the function executing the download, instead
+        of the download being run immediately.
+    """
+    token = _SUBMIT_DOWNLOAD.set(submit_download)
+    try:
+        yield
+    finally:
+        _SUBMIT_DOWNLOAD.reset(token)
 
 
 class StubStore(Generic[StubT]):
@@ -244,7 +467,7 @@ class StubStore(Generic[StubT]):
 class TreeObject(TreeObjectBase):
     """Base class for ACP objects which can be modified or deleted."""
 
-    __slots__: Iterable[str] = ("_stub_store",)
+    __slots__: Iterable[str] = ("_stub_store", "_hash_cache")
     name: ReadWriteProperty[str, str] = grpc_data_property(
         "info.name", doc="The name of the object."
     )
@@ -255,6 +478,9 @@ class TreeObject(TreeObjectBase):
     def __init__(self: TreeObject, name: str = "") -> None:
         super().__init__(name=name)
         self._stub_store = StubStore(self._create_stub)
+        # Memoized hashes, stored with the modification generation at which
+        # they were computed.
+        self._hash_cache: dict[str, tuple[int, str]] = {}
 
     def delete(self) -> None:
         """Delete the object."""
@@ -265,28 +491,143 @@ class TreeObject(TreeObjectBase):
                     version=self._pb_object.info.version,
                 )
             )
+        self._server_wrapper.mark_modified(self._resource_path)
 
     def _get(self) -> None:
-        with wrap_grpc_errors():
-            self._pb_object = self._get_stub().Get(
-                GetRequest(resource_path=self._pb_object.info.resource_path)
-            )
+        with self._lock:
+            if self._use_local_data:
+                return
+            with wrap_grpc_errors():
+                self._pb_object = self._get_stub().Get(
+                    GetRequest(resource_path=self._pb_object.info.resource_path)
+                )
 
     def _get_if_stored(self) -> None:
         if self._is_stored:
             self._get()
 
     def _put(self) -> None:
-        with wrap_grpc_errors():
-            self._pb_object = self._get_stub().Put(self._pb_object)
+        with self._lock:
+            if self._use_local_data:
+                return
+            stub = self._get_stub()
+            retry_policy = self._server_wrapper.retry_policy
+            with wrap_grpc_errors():
+                if retry_policy is None:
+                    self._pb_object = stub.Put(self._pb_object)
+                else:
+                    self._pb_object = retry_policy.call_unless_applied(
+                        "Put",
+                        lambda: stub.Put(self._pb_object),
+                        self._get_if_put_applied,
+                    )
+        self._server_wrapper.mark_modified(self._resource_path)
+
+    def _get_if_put_applied(self) -> ObjectInfo | None:
+        """Get the object from the server if a failed 'Put' was applied nonetheless.
+
+        The server increments the object version on each modification, so
+        an unchanged version shows that the 'Put' was not applied.
+        """
+        current = self._get_stub().Get(GetRequest(resource_path=self._pb_object.info.resource_path))
+        if current.info.version == self._pb_object.info.version:
+            return None
+        return current
 
     def _put_if_stored(self) -> None:
         if self._is_stored:
             self._put()
 
+    @contextlib.contextmanager
+    def _batch_edit(self) -> Iterator[None]:
+        """Combine multiple property edits into a single 'Put' request.
+
+        Within the context manager, the object is not re-fetched from or
+        sent to the server. The modified object is sent when the context
+        manager exits without error.
+        """
+        if not self._is_stored or self._use_local_data:
+            yield
+            return
+        # Other threads accessing the object wait until the batch is sent.
+        with self._lock:
+            self._get()
+            self._use_local_data = True
+            try:
+                yield
+            except BaseException:
+                self._use_local_data = False
+                # Discard the local modifications.
+                self._get()
+                raise
+            self._use_local_data = False
+            self._put()
+
     def _get_stub(self) -> EditableAndReadableResourceStub:
         return self._stub_store.get(self._is_stored)
 
+    def content_hash(self) -> str:
+        """Compute a hash of the object's properties.
+
+        The hash is computed from the deterministically serialized properties
+        of the object. Links to other objects are represented by their path
+        relative to the model, such that the hash does not depend on which
+        model the object belongs to. The object name and server-computed
+        status are not included.
+
+        The hash is memoized until the model is modified through this client.
+        Modifications made by other clients are not detected.
+
+        Returns
+        -------
+        :
+            Hexadecimal SHA-256 hash.
+        """
+        from ._snapshot import object_content_hash
+
+        if not self._is_stored:
+            return object_content_hash(self._pb_object).hex()
+
+        def _compute() -> bytes:
+            self._get()
+            return object_content_hash(self._pb_object)
+
+        return self._memoized_hash("content", _compute)
+
+    def subtree_hash(self) -> str:
+        """Compute a hash of the properties of the object and all its children.
+
+        The hash combines the :meth:`content_hash` of the object with the
+        resource paths and subtree hashes of its children (Merkle tree).
+        Objects which are generated by the server, such as analysis plies,
+        are not included.
+
+        The hash is memoized until the model is modified through this client.
+        Modifications made by other clients are not detected.
+
+        Returns
+        -------
+        :
+            Hexadecimal SHA-256 hash.
+        """
+        from ._snapshot import object_subtree_hash
+
+        if not self._is_stored:
+            raise RuntimeError("Cannot compute the subtree hash of an unstored object.")
+        return self._memoized_hash("subtree", lambda: object_subtree_hash(self))
+
+    def _memoized_hash(self, kind: str, compute: Callable[[], bytes]) -> str:
+        tracker = self._server_wrapper.modification_tracker
+        generation = tracker.generation(self._resource_path.value)
+        cached = self._hash_cache.get(kind)
+        if cached is not None and cached[0] == generation:
+            return cached[1]
+        hash_value = compute().hex()
+        # Only store the hash if the model was not modified during the computation.
+        if tracker.generation(self._resource_path.value) == generation:
+            self._hash_cache[kind] = (generation, hash_value)
+        return hash_value
+
 
 @mark_grpc_properties
 class ReadOnlyTreeObject(TreeObjectBase):
@@ -303,10 +644,13 @@ class ReadOnlyTreeObject(TreeObjectBase):
         return self._stub_store.get(self._is_stored)
 
     def _get(self) -> None:
-        with wrap_grpc_errors():
-            self._pb_object = self._get_stub().Get(
-                GetRequest(resource_path=self._pb_object.info.resource_path)
-            )
+        with self._lock:
+            if self._use_local_data:
+                return
+            with wrap_grpc_errors():
+                self._pb_object = self._get_stub().Get(
+                    GetRequest(resource_path=self._pb_object.info.resource_path)
+                )
 
     def _get_if_stored(self) -> None:
         if self._is_stored:
@@ -351,13 +695,23 @@ class CreatableTreeObject(TreeObject):
         parent :
             Parent object to store the object under.
         """
+        request = self._get_create_request(parent)
         self._server_wrapper_store = parent._server_wrapper
-        assert self._server_version is not None
-        if self._server_version < parse_version(self._SUPPORTED_SINCE):
+        with wrap_grpc_errors():
+            object_info = self._get_stub().Create(request)
+        self._set_created(object_info)
+
+    def _get_create_request(self, parent: TreeObject) -> CreateRequest:
+        """Validate storing the object under ``parent``, and build the create request.
+
+        This method does not modify the object or make any requests to the server.
+        """
+        capabilities = parent._server_wrapper.capabilities
+        if not capabilities.supports_object_type(type(self)):
             raise RuntimeError(
                 f"The '{type(self).__name__}' object is only supported since version "
                 f"{self._SUPPORTED_SINCE} of the ACP gRPC server. The current server version is "
-                f"{self._server_version}."
+                f"{capabilities.version}."
             )
 
         collection_path = CollectionPath(
@@ -386,17 +740,20 @@ class CreatableTreeObject(TreeObject):
                 + "\n]"
             )
 
-        request = self._CREATE_REQUEST_TYPE(
+        return self._CREATE_REQUEST_TYPE(
             collection_path=collection_path,
             name=self._pb_object.info.name,
             properties=self._pb_object.properties,
         )
-        with wrap_grpc_errors():
-            self._pb_object = self._get_stub().Create(request)
+
+    def _set_created(self: Self, object_info: ObjectInfo) -> None:
+        """Update the object with the reply of a successful create request."""
+        self._pb_object = object_info
         resource_path_value = self._resource_path.value
         if not resource_path_value:
             raise ValueError("The resource path must not be empty.")
         self._OBJECT_CACHE[resource_path_value] = self
+        self._server_wrapper.mark_modified(self._resource_path)
 
 
 @mark_grpc_properties
@@ -41,7 +41,12 @@ from ._grpc_helpers.property_helper import (
     grpc_data_property_read_only,
     mark_grpc_properties,
 )
-from ._mesh_data import full_mesh_property, shell_mesh_property
+from ._mesh_data import (
+    full_mesh_async_method,
+    full_mesh_property,
+    shell_mesh_async_method,
+    shell_mesh_property,
+)
 from .base import CreatableTreeObject, IdTreeObject
 from .enums import status_type_from_pb
 from .linked_selection_rule import LinkedSelectionRule
@@ -106,7 +111,7 @@ class BooleanSelectionRule(CreatableTreeObject, IdTreeObject):
         self.include_rule = include_rule
 
     def _create_stub(self) -> boolean_selection_rule_pb2_grpc.ObjectServiceStub:
-        return boolean_selection_rule_pb2_grpc.ObjectServiceStub(self._channel)
+        return self._server_wrapper.get_stub(boolean_selection_rule_pb2_grpc.ObjectServiceStub)
 
     status = grpc_data_property_read_only("properties.status", from_protobuf=status_type_from_pb)
 
@@ -122,7 +127,9 @@ class BooleanSelectionRule(CreatableTreeObject, IdTreeObject):
     include_rule: ReadWriteProperty[bool, bool] = grpc_data_property("properties.include_rule_type")
 
     mesh = full_mesh_property
+    amesh = full_mesh_async_method
     shell_mesh = shell_mesh_property
+    ashell_mesh = shell_mesh_async_method
     # selection rules don't have solid mesh data
 
     elemental_data = elemental_data_property(BooleanSelectionRuleElementalData)
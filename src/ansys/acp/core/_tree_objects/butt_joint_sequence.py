@@ -205,7 +205,7 @@ class ButtJointSequence(CreatableTreeObject, IdTreeObject):
         self.secondary_plies = secondary_plies
 
     def _create_stub(self) -> butt_joint_sequence_pb2_grpc.ObjectServiceStub:
-        return butt_joint_sequence_pb2_grpc.ObjectServiceStub(self._channel)
+        return self._server_wrapper.get_stub(butt_joint_sequence_pb2_grpc.ObjectServiceStub)
 
     status = grpc_data_property_read_only("properties.status", from_protobuf=status_type_from_pb)
     active: ReadWriteProperty[bool, bool] = grpc_data_property("properties.active")
@@ -52,7 +52,7 @@ class CADComponent(ReadOnlyTreeObject, IdTreeObject):
     _SUPPORTED_SINCE = "24.2"
 
     def _create_stub(self) -> cad_component_pb2_grpc.ObjectServiceStub:
-        return cad_component_pb2_grpc.ObjectServiceStub(self._channel)
+        return self._server_wrapper.get_stub(cad_component_pb2_grpc.ObjectServiceStub)
 
     status = grpc_data_property_read_only("properties.status", from_protobuf=status_type_from_pb)
     path: ReadOnlyProperty[str] = grpc_data_property_read_only("properties.path")
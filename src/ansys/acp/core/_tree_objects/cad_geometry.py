@@ -138,7 +138,7 @@ class CADGeometry(CreatableTreeObject, IdTreeObject):
         self.offset = offset
 
     def _create_stub(self) -> cad_geometry_pb2_grpc.ObjectServiceStub:
-        return cad_geometry_pb2_grpc.ObjectServiceStub(self._channel)
+        return self._server_wrapper.get_stub(cad_geometry_pb2_grpc.ObjectServiceStub)
 
     status = grpc_data_property_read_only("properties.status", from_protobuf=status_type_from_pb)
     locked: ReadOnlyProperty[bool] = grpc_data_property_read_only("properties.locked")
@@ -195,3 +195,4 @@ class CADGeometry(CreatableTreeObject, IdTreeObject):
                     resource_path=self._resource_path,
                 ),
             )
+        self._server_wrapper.mark_modified(self._resource_path)
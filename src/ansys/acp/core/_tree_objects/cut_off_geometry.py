@@ -91,7 +91,7 @@ class CutOffGeometry(CreatableTreeObject, IdTreeObject):
         self.relative_merge_tolerance = relative_merge_tolerance
 
     def _create_stub(self) -> cut_off_geometry_pb2_grpc.ObjectServiceStub:
-        return cut_off_geometry_pb2_grpc.ObjectServiceStub(self._channel)
+        return self._server_wrapper.get_stub(cut_off_geometry_pb2_grpc.ObjectServiceStub)
 
     status = grpc_data_property_read_only("properties.status", from_protobuf=status_type_from_pb)
     active: ReadWriteProperty[bool, bool] = grpc_data_property("properties.active")
@@ -41,7 +41,12 @@ from ._grpc_helpers.property_helper import (
     grpc_link_property,
     mark_grpc_properties,
 )
-from ._mesh_data import full_mesh_property, shell_mesh_property
+from ._mesh_data import (
+    full_mesh_async_method,
+    full_mesh_property,
+    shell_mesh_async_method,
+    shell_mesh_property,
+)
 from .base import CreatableTreeObject, IdTreeObject
 from .edge_set import EdgeSet
 from .enums import (
@@ -139,7 +144,7 @@ class CutOffSelectionRule(CreatableTreeObject, IdTreeObject):
         self.ply_tapering = ply_tapering
 
     def _create_stub(self) -> cutoff_selection_rule_pb2_grpc.ObjectServiceStub:
-        return cutoff_selection_rule_pb2_grpc.ObjectServiceStub(self._channel)
+        return self._server_wrapper.get_stub(cutoff_selection_rule_pb2_grpc.ObjectServiceStub)
 
     status = grpc_data_property_read_only("properties.status", from_protobuf=status_type_from_pb)
 
@@ -162,7 +167,9 @@ class CutOffSelectionRule(CreatableTreeObject, IdTreeObject):
     ply_tapering: ReadWriteProperty[bool, bool] = grpc_data_property("properties.ply_tapering")
 
     mesh = full_mesh_property
+    amesh = full_mesh_async_method
     shell_mesh = shell_mesh_property
+    ashell_mesh = shell_mesh_async_method
     # selection rules don't have solid mesh data
     elemental_data = elemental_data_property(CutOffSelectionRuleElementalData)
     nodal_data = nodal_data_property(CutOffSelectionRuleNodalData)
@@ -97,7 +97,7 @@ class EdgeSet(CreatableTreeObject, IdTreeObject):
         self.origin = origin
 
     def _create_stub(self) -> edge_set_pb2_grpc.ObjectServiceStub:
-        return edge_set_pb2_grpc.ObjectServiceStub(self._channel)
+        return self._server_wrapper.get_stub(edge_set_pb2_grpc.ObjectServiceStub)
 
     status = grpc_data_property_read_only("properties.status", from_protobuf=status_type_from_pb)
     locked: ReadOnlyProperty[bool] = grpc_data_property_read_only("properties.locked")
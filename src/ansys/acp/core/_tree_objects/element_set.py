@@ -41,7 +41,12 @@ from ._grpc_helpers.property_helper import (
     grpc_data_property_read_only,
     mark_grpc_properties,
 )
-from ._mesh_data import full_mesh_property, shell_mesh_property
+from ._mesh_data import (
+    full_mesh_async_method,
+    full_mesh_property,
+    shell_mesh_async_method,
+    shell_mesh_property,
+)
 from .base import CreatableTreeObject, IdTreeObject
 from .enums import status_type_from_pb
 from .object_registry import register
@@ -103,7 +108,7 @@ class ElementSet(CreatableTreeObject, IdTreeObject):
         self.element_labels = element_labels
 
     def _create_stub(self) -> element_set_pb2_grpc.ObjectServiceStub:
-        return element_set_pb2_grpc.ObjectServiceStub(self._channel)
+        return self._server_wrapper.get_stub(element_set_pb2_grpc.ObjectServiceStub)
 
     status = grpc_data_property_read_only("properties.status", from_protobuf=status_type_from_pb)
     locked: ReadOnlyProperty[bool] = grpc_data_property_read_only("properties.locked")
@@ -115,6 +120,8 @@ class ElementSet(CreatableTreeObject, IdTreeObject):
     )
 
     mesh = full_mesh_property
+    amesh = full_mesh_async_method
     shell_mesh = shell_mesh_property
+    ashell_mesh = shell_mesh_async_method
     elemental_data = elemental_data_property(ElementSetElementalData)
     nodal_data = nodal_data_property(ElementSetNodalData)
@@ -124,7 +124,7 @@ class ExtrusionGuide(CreatableTreeObject, IdTreeObject):
         self.use_curvature_correction = use_curvature_correction
 
     def _create_stub(self) -> extrusion_guide_pb2_grpc.ObjectServiceStub:
-        return extrusion_guide_pb2_grpc.ObjectServiceStub(self._channel)
+        return self._server_wrapper.get_stub(extrusion_guide_pb2_grpc.ObjectServiceStub)
 
     status = grpc_data_property_read_only("properties.status", from_protobuf=status_type_from_pb)
 
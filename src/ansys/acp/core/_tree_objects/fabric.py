@@ -121,7 +121,7 @@ class Fabric(CreatableTreeObject, IdTreeObject):
         self.draping_ud_coefficient = draping_ud_coefficient
 
     def _create_stub(self) -> fabric_pb2_grpc.ObjectServiceStub:
-        return fabric_pb2_grpc.ObjectServiceStub(self._channel)
+        return self._server_wrapper.get_stub(fabric_pb2_grpc.ObjectServiceStub)
 
     status = grpc_data_property_read_only("properties.status", from_protobuf=status_type_from_pb)
     area_weight: ReadOnlyProperty[float] = grpc_data_property_read_only("properties.area_weight")
@@ -121,7 +121,7 @@ class FieldDefinition(CreatableTreeObject, IdTreeObject):
         self.full_mapping = full_mapping
 
     def _create_stub(self) -> field_definition_pb2_grpc.ObjectServiceStub:
-        return field_definition_pb2_grpc.ObjectServiceStub(self._channel)
+        return self._server_wrapper.get_stub(field_definition_pb2_grpc.ObjectServiceStub)
 
     status = grpc_data_property_read_only("properties.status", from_protobuf=status_type_from_pb)
     active: ReadWriteProperty[bool, bool] = grpc_data_property("properties.active")
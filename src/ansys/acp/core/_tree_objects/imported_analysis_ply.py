@@ -32,7 +32,7 @@ from ._grpc_helpers.property_helper import (
     grpc_link_property_read_only,
     mark_grpc_properties,
 )
-from ._mesh_data import solid_mesh_property
+from ._mesh_data import solid_mesh_async_method, solid_mesh_property
 from .base import IdTreeObject, ReadOnlyTreeObject
 from .enums import status_type_from_pb
 from .object_registry import register
@@ -68,7 +68,7 @@ class ImportedAnalysisPly(ReadOnlyTreeObject, IdTreeObject):
     _SUPPORTED_SINCE = "25.1"
 
     def _create_stub(self) -> imported_analysis_ply_pb2_grpc.ObjectServiceStub:
-        return imported_analysis_ply_pb2_grpc.ObjectServiceStub(self._channel)
+        return self._server_wrapper.get_stub(imported_analysis_ply_pb2_grpc.ObjectServiceStub)
 
     status = grpc_data_property_read_only("properties.status", from_protobuf=status_type_from_pb)
     material = grpc_link_property_read_only("properties.material")
@@ -79,3 +79,4 @@ class ImportedAnalysisPly(ReadOnlyTreeObject, IdTreeObject):
     )
 
     solid_mesh = solid_mesh_property
+    asolid_mesh = solid_mesh_async_method
@@ -61,7 +61,7 @@ class ImportedModelingGroup(CreatableTreeObject, IdTreeObject):
         super().__init__(name=name)
 
     def _create_stub(self) -> imported_modeling_group_pb2_grpc.ObjectServiceStub:
-        return imported_modeling_group_pb2_grpc.ObjectServiceStub(self._channel)
+        return self._server_wrapper.get_stub(imported_modeling_group_pb2_grpc.ObjectServiceStub)
 
     create_imported_modeling_ply = define_create_method(
         ImportedModelingPly,
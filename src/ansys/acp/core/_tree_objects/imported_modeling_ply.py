@@ -178,7 +178,7 @@ class ImportedModelingPly(CreatableTreeObject, IdTreeObject):
         self.thickness_field_type = thickness_field_type
 
     def _create_stub(self) -> imported_modeling_ply_pb2_grpc.ObjectServiceStub:
-        return imported_modeling_ply_pb2_grpc.ObjectServiceStub(self._channel)
+        return self._server_wrapper.get_stub(imported_modeling_ply_pb2_grpc.ObjectServiceStub)
 
     status = grpc_data_property_read_only("properties.status", from_protobuf=status_type_from_pb)
     active: ReadWriteProperty[bool, bool] = grpc_data_property("properties.active")
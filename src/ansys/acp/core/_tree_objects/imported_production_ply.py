@@ -72,7 +72,7 @@ class ImportedProductionPly(ReadOnlyTreeObject, IdTreeObject):
     _SUPPORTED_SINCE = "25.1"
 
     def _create_stub(self) -> imported_production_ply_pb2_grpc.ObjectServiceStub:
-        return imported_production_ply_pb2_grpc.ObjectServiceStub(self._channel)
+        return self._server_wrapper.get_stub(imported_production_ply_pb2_grpc.ObjectServiceStub)
 
     status = grpc_data_property_read_only("properties.status", from_protobuf=status_type_from_pb)
     material = grpc_link_property_read_only("properties.material")
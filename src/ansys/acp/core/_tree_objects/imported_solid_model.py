@@ -59,7 +59,7 @@ from ._grpc_helpers.property_helper import (
     grpc_link_property,
     mark_grpc_properties,
 )
-from ._mesh_data import solid_mesh_property
+from ._mesh_data import solid_mesh_async_method, solid_mesh_property
 from ._solid_model_export import SolidModelExportMixin
 from .analysis_ply import AnalysisPly
 from .base import (
@@ -301,7 +301,7 @@ class ImportedSolidModel(SolidModelExportMixin, CreatableTreeObject, IdTreeObjec
         self.export_settings = export_settings
 
     def _create_stub(self) -> imported_solid_model_pb2_grpc.ObjectServiceStub:
-        return imported_solid_model_pb2_grpc.ObjectServiceStub(self._channel)
+        return self._server_wrapper.get_stub(imported_solid_model_pb2_grpc.ObjectServiceStub)
 
     status = grpc_data_property_read_only("properties.status", from_protobuf=status_type_from_pb)
     locked: ReadOnlyProperty[bool] = grpc_data_property_read_only("properties.locked")
@@ -387,12 +387,17 @@ class ImportedSolidModel(SolidModelExportMixin, CreatableTreeObject, IdTreeObjec
             self._get_stub().Refresh(  # type: ignore
                 imported_solid_model_pb2.RefreshRequest(resource_path=self._resource_path)
             )
+        self._server_wrapper.mark_modified(self._resource_path)
 
     def import_initial_mesh(self) -> None:
         """Import the solid mesh and its element sets."""
         with wrap_grpc_errors():
-            self._get_stub().ImportInitialMesh(  # type: ignore
+            self._get_bulk_data_stub(
+                imported_solid_model_pb2_grpc.ObjectServiceStub
+            ).ImportInitialMesh(
                 imported_solid_model_pb2.ImportInitialMeshRequest(resource_path=self._resource_path)
             )
+        self._server_wrapper.mark_modified(self._resource_path)
 
     solid_mesh = solid_mesh_property
+    asolid_mesh = solid_mesh_async_method
@@ -44,7 +44,12 @@ from ._grpc_helpers.property_helper import (
     grpc_data_property_read_only,
     mark_grpc_properties,
 )
-from ._mesh_data import full_mesh_property, shell_mesh_property
+from ._mesh_data import (
+    full_mesh_async_method,
+    full_mesh_property,
+    shell_mesh_async_method,
+    shell_mesh_property,
+)
 from .base import CreatableTreeObject, IdTreeObject
 from .element_set import ElementSet
 from .enums import status_type_from_pb
@@ -114,7 +119,7 @@ class InterfaceLayer(CreatableTreeObject, IdTreeObject):
         self.open_area_sets = open_area_sets
 
     def _create_stub(self) -> interface_layer_pb2_grpc.ObjectServiceStub:
-        return interface_layer_pb2_grpc.ObjectServiceStub(self._channel)
+        return self._server_wrapper.get_stub(interface_layer_pb2_grpc.ObjectServiceStub)
 
     status = grpc_data_property_read_only("properties.status", from_protobuf=status_type_from_pb)
     global_ply_nr: ReadWriteProperty[int, int] = grpc_data_property("properties.global_ply_nr")
@@ -127,7 +132,9 @@ class InterfaceLayer(CreatableTreeObject, IdTreeObject):
     )
 
     mesh = full_mesh_property
+    amesh = full_mesh_async_method
     shell_mesh = shell_mesh_property
+    ashell_mesh = shell_mesh_async_method
 
     elemental_data = elemental_data_property(InterfaceLayerElementalData)
     nodal_data = nodal_data_property(InterfaceLayerNodalData)
@@ -250,7 +250,7 @@ class LayupMappingObject(CreatableTreeObject, IdTreeObject):
         self.base_element_rosette_selection_method = base_element_rosette_selection_method
 
     def _create_stub(self) -> layup_mapping_object_pb2_grpc.ObjectServiceStub:
-        return layup_mapping_object_pb2_grpc.ObjectServiceStub(self._channel)
+        return self._server_wrapper.get_stub(layup_mapping_object_pb2_grpc.ObjectServiceStub)
 
     status = grpc_data_property_read_only("properties.status", from_protobuf=status_type_from_pb)
 
@@ -77,4 +77,4 @@ class LookUpTable1DColumn(LookUpTableColumnBase):
         )
 
     def _create_stub(self) -> lookup_table_1d_column_pb2_grpc.ObjectServiceStub:
-        return lookup_table_1d_column_pb2_grpc.ObjectServiceStub(self._channel)
+        return self._server_wrapper.get_stub(lookup_table_1d_column_pb2_grpc.ObjectServiceStub)
@@ -118,7 +118,7 @@ class LookUpTable3D(CreatableTreeObject, IdTreeObject):
         self.num_min_neighbors = num_min_neighbors
 
     def _create_stub(self) -> lookup_table_3d_pb2_grpc.ObjectServiceStub:
-        return lookup_table_3d_pb2_grpc.ObjectServiceStub(self._channel)
+        return self._server_wrapper.get_stub(lookup_table_3d_pb2_grpc.ObjectServiceStub)
 
     status = grpc_data_property_read_only("properties.status", from_protobuf=status_type_from_pb)
 
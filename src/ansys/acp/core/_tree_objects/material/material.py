@@ -201,7 +201,7 @@ class Material(CreatableTreeObject, IdTreeObject):
     )
 
     def _create_stub(self) -> material_pb2_grpc.ObjectServiceStub:
-        return material_pb2_grpc.ObjectServiceStub(self._channel)
+        return self._server_wrapper.get_stub(material_pb2_grpc.ObjectServiceStub)
 
     locked: ReadOnlyProperty[bool] = grpc_data_property_read_only("properties.locked")
     status = grpc_data_property_read_only("properties.status", from_protobuf=status_type_from_pb)
@@ -22,8 +22,13 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Sequence
+import asyncio
+from collections.abc import Callable, Iterable, Mapping, Sequence
+import concurrent.futures
 import dataclasses
+import pathlib
+import threading
+import time
 import typing
 from typing import Any, cast
 
@@ -69,9 +74,11 @@ from ansys.api.acp.v0 import (
 )
 from ansys.api.acp.v0.base_pb2 import CollectionPath
 
+from .._log import LOGGER
 from .._utils.property_protocols import ReadOnlyProperty, ReadWriteProperty
 from .._utils.resource_paths import join as rp_join
 from .._utils.typing_helper import PATH as _PATH
+from .._utils.typing_helper import PATH_OR_BINARY_IO as _PATH_OR_BINARY_IO
 from ._elemental_or_nodal_data import (
     ElementalData,
     NodalData,
@@ -82,6 +89,7 @@ from ._elemental_or_nodal_data import (
 )
 from ._grpc_helpers.enum_wrapper import wrap_to_string_enum
 from ._grpc_helpers.exceptions import wrap_grpc_errors
+from ._grpc_helpers.futures import GrpcCallFuture, await_grpc_call
 from ._grpc_helpers.mapping import define_create_method, define_mutable_mapping
 from ._grpc_helpers.property_helper import (
     _PROTOBUF_T,
@@ -92,8 +100,16 @@ from ._grpc_helpers.property_helper import (
 )
 from ._grpc_helpers.protocols import ObjectInfo
 from ._grpc_helpers.supported_since import supported_since
-from ._mesh_data import full_mesh_property, shell_mesh_property, solid_mesh_property
-from .base import ServerWrapper, TreeObject
+from ._mesh_data import (
+    full_mesh_async_method,
+    full_mesh_property,
+    shell_mesh_async_method,
+    shell_mesh_property,
+    solid_mesh_async_method,
+    solid_mesh_property,
+)
+from ._snapshot import ModelCheckpoint, create_checkpoint, restore_checkpoint
+from .base import ServerWrapper, TreeObject, after_downloads, deferred_downloads
 from .boolean_selection_rule import BooleanSelectionRule
 from .cad_geometry import CADGeometry
 from .cut_off_selection_rule import CutOffSelectionRule
@@ -104,6 +120,7 @@ from .enums import (
     ArrowType,
     OffsetType,
     PlyGeometryExportFormat,
+    Status,
     UnitSystemType,
     arrow_type_to_pb,
     offset_type_to_pb,
@@ -142,7 +159,10 @@ __all__ = [
     "HDF5CompositeCAEImportMode",
     "HDF5CompositeCAEProjectionMode",
     "IgnorableEntity",
+    "ExportManifest",
+    "ExportManifestEntry",
     "Model",
+    "ModelCheckpoint",
     "ModelElementalData",
     "ModelNodalData",
     "ShellMappingProperties",
@@ -180,6 +200,50 @@ HDF5CompositeCAEProjectionMode, hdf5_composite_cae_projection_mode_to_pb, _ = wr
     doc="Options for the projection mode of the HDF5 Composite CAE file.",
 )
 
+# Keys of the model operations recorded in the modification tracker
+_UPDATE_OPERATION = "update"
+_UPDATE_RELATIONS_ONLY_OPERATION = "update_relations_only"
+
+
+def _start_progress_polling(
+    future: concurrent.futures.Future[None],
+    *,
+    progress_callback: Callable[[int, int], None],
+    progress_objects: list[Any],
+    poll_interval: float,
+) -> None:
+    """Periodically report the number of up-to-date objects until the future is done."""
+    done_event = threading.Event()
+    future.add_done_callback(lambda _: done_event.set())
+
+    def _report_progress() -> None:
+        num_uptodate = sum(obj.status == Status.UPTODATE for obj in progress_objects)
+        progress_callback(num_uptodate, len(progress_objects))
+
+    def _poll() -> None:
+        while not done_event.wait(poll_interval):
+            try:
+                _report_progress()
+            except Exception:
+                # The server may not answer requests while it is updating.
+                LOGGER.debug("Polling the update progress failed.", exc_info=True)
+        if not future.cancelled() and future.exception() is None:
+            _report_progress()
+
+    threading.Thread(target=_poll, daemon=True).start()
+
+
+def _run_timed(funcs: Iterable[Callable[[], None]]) -> float:
+    """Run the functions, and return the elapsed time in seconds."""
+    start_time = time.perf_counter()
+    for func in funcs:
+        func()
+    return time.perf_counter() - start_time
+
+
+def _save_operation(local_path: pathlib.Path, save_cache: bool) -> tuple[Any, ...]:
+    return ("save", str(local_path), save_cache)
+
 
 @dataclasses.dataclass
 class ModelElementalData(ElementalData):
@@ -237,6 +301,46 @@ class SolidMappingProperties:
     offset_type: OffsetType = OffsetType.BOTTOM_OFFSET
 
 
+@dataclasses.dataclass(frozen=True)
+class ExportManifestEntry:
+    """Describes a file created by :meth:`.Model.export_bundle`.
+
+    Parameters
+    ----------
+    path :
+        Local path of the file.
+    size :
+        Size of the file, in bytes. ``None`` if the file is only accessible
+        on the server, that is when using a remote server without automatic
+        file transfer.
+    export_time :
+        Time in seconds spent to create the file on the server.
+    download_time :
+        Time in seconds spent to download the file from the server.
+    """
+
+    path: pathlib.Path
+    size: int | None
+    export_time: float
+    download_time: float
+
+
+@dataclasses.dataclass(frozen=True)
+class ExportManifest:
+    """Summary of the files created by :meth:`.Model.export_bundle`.
+
+    Parameters
+    ----------
+    entries :
+        Description of each exported file, in the order of the exports.
+    total_time :
+        Total time in seconds spent for the exports and downloads.
+    """
+
+    entries: tuple[ExportManifestEntry, ...]
+    total_time: float
+
+
 @mark_grpc_properties
 @register
 class Model(TreeObject):
@@ -295,7 +399,7 @@ class Model(TreeObject):
         return cast(model_pb2_grpc.ObjectServiceStub, super()._get_stub())
 
     def _create_stub(self) -> model_pb2_grpc.ObjectServiceStub:
-        return model_pb2_grpc.ObjectServiceStub(self._channel)
+        return self._server_wrapper.get_stub(model_pb2_grpc.ObjectServiceStub)
 
     # # TODO: document further properties, or autogenerate docstring from .proto files.
 
@@ -352,7 +456,9 @@ class Model(TreeObject):
         """
         request = model_pb2.LoadFromFileRequest(path=server_wrapper.auto_upload(path))
         with wrap_grpc_errors():
-            reply = model_pb2_grpc.ObjectServiceStub(server_wrapper.channel).LoadFromFile(request)
+            reply = server_wrapper.get_stub(
+                model_pb2_grpc.ObjectServiceStub, bulk_data=True
+            ).LoadFromFile(request)
         return cls._from_object_info(object_info=reply, server_wrapper=server_wrapper)
 
     @classmethod
@@ -402,56 +508,286 @@ class Model(TreeObject):
             unit_system=cast(Any, unit_system_type_to_pb(unit_system)),
         )
         with wrap_grpc_errors():
-            reply = model_pb2_grpc.ObjectServiceStub(server_wrapper.channel).LoadFromFEFile(request)
+            reply = server_wrapper.get_stub(
+                model_pb2_grpc.ObjectServiceStub, bulk_data=True
+            ).LoadFromFEFile(request)
         return cls._from_object_info(object_info=reply, server_wrapper=server_wrapper)
 
-    def update(self, *, relations_only: bool = False) -> None:
+    def update(self, *, relations_only: bool = False, force: bool = False) -> None:
         """Update the model.
 
+        If the model has not been modified through this client since the last
+        successful update, the update is skipped.
+
         Parameters
         ----------
         relations_only :
             Whether to update and propagate only the status of all objects.
+        force :
+            Whether to update the model even if it has not been modified since
+            the last update.
         """
+        if self._is_update_skipped(relations_only=relations_only, force=force):
+            return
+        start_generation = self._server_wrapper.modification_tracker.generation(
+            self._resource_path.value
+        )
         with wrap_grpc_errors():
-            self._get_stub().Update(
-                model_pb2.UpdateRequest(
-                    resource_path=self._resource_path, relations_only=relations_only
-                )
+            self._get_stub().Update(self._get_update_request(relations_only=relations_only))
+        self._record_update(relations_only=relations_only, start_generation=start_generation)
+
+    def update_async(
+        self,
+        *,
+        relations_only: bool = False,
+        force: bool = False,
+        timeout: float | None = None,
+        progress_callback: Callable[[int, int], None] | None = None,
+        progress_objects: Iterable[Any] | None = None,
+        poll_interval: float = 1.0,
+    ) -> concurrent.futures.Future[None]:
+        """Update the model without blocking.
+
+        Starts the model update, and returns a future which completes when the
+        update is done. Cancelling the future cancels the update request. As with
+        :meth:`update`, the update is skipped if the model has not been modified
+        since the last successful update.
+
+        Parameters
+        ----------
+        relations_only :
+            Whether to update and propagate only the status of all objects.
+        force :
+            Whether to update the model even if it has not been modified since
+            the last update.
+        timeout :
+            Time in seconds after which the update request is aborted. The future
+            then raises a ``TimeoutError``. If ``None``, there is no deadline.
+        progress_callback :
+            Function which is periodically called during the update, with the
+            number of up-to-date objects and the total number of objects in
+            ``progress_objects``. The progress is determined by polling the
+            ``status`` of the objects, which requires a server which answers
+            requests while the update is running.
+        progress_objects :
+            Objects whose status is polled to report progress. By default, all
+            modeling plies of the model are used. Ignored if ``progress_callback``
+            is not given.
+        poll_interval :
+            Time in seconds between two progress polls.
+
+        Returns
+        -------
+        :
+            Future representing the update. Its result is ``None``.
+        """
+        if self._is_update_skipped(relations_only=relations_only, force=force):
+            skipped_future: concurrent.futures.Future[None] = concurrent.futures.Future()
+            skipped_future.set_result(None)
+            return skipped_future
+
+        if progress_callback is not None and progress_objects is None:
+            progress_objects = [
+                ply
+                for modeling_group in self.modeling_groups.values()
+                for ply in modeling_group.modeling_plies.values()
+            ]
+
+        start_generation = self._server_wrapper.modification_tracker.generation(
+            self._resource_path.value
+        )
+        # The stub type does not describe the '.future' method of gRPC multi-callables.
+        update_method = cast(Any, self._get_stub().Update)
+        future: concurrent.futures.Future[None] = GrpcCallFuture(
+            update_method.future(
+                self._get_update_request(relations_only=relations_only), timeout=timeout
+            ),
+            on_success=lambda _: self._record_update(
+                relations_only=relations_only, start_generation=start_generation
+            ),
+        )
+
+        if progress_callback is not None:
+            assert progress_objects is not None
+            _start_progress_polling(
+                future,
+                progress_callback=progress_callback,
+                progress_objects=list(progress_objects),
+                poll_interval=poll_interval,
             )
+        return future
+
+    async def aupdate(
+        self,
+        *,
+        relations_only: bool = False,
+        force: bool = False,
+        timeout: float | None = None,
+    ) -> None:
+        """Update the model, without blocking the event loop.
+
+        This is the coroutine counterpart of :meth:`update_async`. Cancelling
+        the awaiting task cancels the update request.
+
+        Parameters
+        ----------
+        relations_only :
+            Whether to update and propagate only the status of all objects.
+        force :
+            Whether to update the model even if it has not been modified since
+            the last update.
+        timeout :
+            Time in seconds after which the update request is aborted. If
+            ``None``, there is no deadline.
+        """
+        await asyncio.wrap_future(
+            self.update_async(relations_only=relations_only, force=force, timeout=timeout)
+        )
+
+    def _is_update_skipped(self, *, relations_only: bool, force: bool) -> bool:
+        operation = _UPDATE_RELATIONS_ONLY_OPERATION if relations_only else _UPDATE_OPERATION
+        return not force and self._server_wrapper.modification_tracker.is_up_to_date(
+            self._resource_path.value, operation
+        )
+
+    def _get_update_request(self, *, relations_only: bool) -> model_pb2.UpdateRequest:
+        return model_pb2.UpdateRequest(
+            resource_path=self._resource_path, relations_only=relations_only
+        )
+
+    def _record_update(self, *, relations_only: bool, start_generation: int) -> None:
+        # The update changes the model state, for example the update results
+        # which are stored in the model file.
+        self._server_wrapper.modification_tracker.record_operation(
+            self._resource_path.value,
+            (
+                (_UPDATE_RELATIONS_ONLY_OPERATION,)
+                if relations_only
+                else (_UPDATE_OPERATION, _UPDATE_RELATIONS_ONLY_OPERATION)
+            ),
+            start_generation=start_generation,
+            modifies_model=True,
+        )
 
-    def save(self, path: _PATH, *, save_cache: bool = True) -> None:
+    def save(self, path: _PATH, *, save_cache: bool = True, force: bool = False) -> None:
         """
         Save ACP Model (.acph5).
 
+        If the model has not been modified through this client since it was last
+        saved to the same path, and the file is unchanged, saving is skipped.
+
         Parameters
         ----------
         path:
             File path.
         save_cache:
             Whether to store the update results such as Analysis Plies and solid models.
+        force:
+            Whether to save the model even if it has not been modified since
+            the last save.
         """
+        local_path = pathlib.Path(path).absolute()
+        if self._is_save_skipped(local_path, save_cache=save_cache, force=force):
+            return
+        start_generation = self._server_wrapper.modification_tracker.generation(
+            self._resource_path.value
+        )
         with self._server_wrapper.auto_download(path) as export_path:
             with wrap_grpc_errors():
-                self._get_stub().SaveToFile(
-                    model_pb2.SaveToFileRequest(
-                        resource_path=self._resource_path,
-                        path=export_path,
-                        save_cache=save_cache,
-                    )
+                self._get_bulk_data_stub(model_pb2_grpc.ObjectServiceStub).SaveToFile(
+                    self._get_save_request(export_path, save_cache=save_cache)
+                )
+        # Within 'export_bundle', the file is only written by the deferred download.
+        after_downloads(
+            lambda: self._record_save(
+                local_path, save_cache=save_cache, start_generation=start_generation
+            )
+        )
+
+    async def asave(self, path: _PATH, *, save_cache: bool = True, force: bool = False) -> None:
+        """Save ACP Model (.acph5), without blocking the event loop.
+
+        The save request is sent without blocking, and the file download (if
+        any) is run in the default executor of the event loop. As with
+        :meth:`save`, saving is skipped if the model is unchanged.
+
+        Parameters
+        ----------
+        path:
+            File path.
+        save_cache:
+            Whether to store the update results such as Analysis Plies and solid models.
+        force:
+            Whether to save the model even if it has not been modified since
+            the last save.
+        """
+        local_path = pathlib.Path(path).absolute()
+        if self._is_save_skipped(local_path, save_cache=save_cache, force=force):
+            return
+        start_generation = self._server_wrapper.modification_tracker.generation(
+            self._resource_path.value
+        )
+        downloads: list[Callable[[], None]] = []
+        with deferred_downloads(downloads.append):
+            with self._server_wrapper.auto_download(path) as export_path:
+                # The stub type does not describe the '.future' method of gRPC multi-callables.
+                save_method = cast(
+                    Any, self._get_bulk_data_stub(model_pb2_grpc.ObjectServiceStub).SaveToFile
+                )
+                await await_grpc_call(
+                    save_method.future(self._get_save_request(export_path, save_cache=save_cache)),
+                    on_success=lambda _: None,
                 )
+        loop = asyncio.get_running_loop()
+        for download in downloads:
+            await loop.run_in_executor(None, download)
+        self._record_save(local_path, save_cache=save_cache, start_generation=start_generation)
+
+    def _is_save_skipped(self, local_path: pathlib.Path, *, save_cache: bool, force: bool) -> bool:
+        return (
+            not force
+            and local_path.is_file()
+            and self._server_wrapper.modification_tracker.is_up_to_date(
+                self._resource_path.value,
+                _save_operation(local_path, save_cache),
+                # The modification time detects if the file was overwritten since.
+                state=local_path.stat().st_mtime_ns,
+            )
+        )
+
+    def _get_save_request(
+        self, export_path: str, *, save_cache: bool
+    ) -> model_pb2.SaveToFileRequest:
+        return model_pb2.SaveToFileRequest(
+            resource_path=self._resource_path,
+            path=export_path,
+            save_cache=save_cache,
+        )
 
-    def export_analysis_model(self, path: _PATH) -> None:
+    def _record_save(
+        self, local_path: pathlib.Path, *, save_cache: bool, start_generation: int
+    ) -> None:
+        if local_path.is_file():
+            self._server_wrapper.modification_tracker.record_operation(
+                self._resource_path.value,
+                (_save_operation(local_path, save_cache),),
+                start_generation=start_generation,
+                state=local_path.stat().st_mtime_ns,
+            )
+
+    def export_analysis_model(self, path: _PATH_OR_BINARY_IO) -> None:
         """Save the analysis model to a CDB file.
 
         Parameters
         ----------
         path:
             Target file path. E.g. /tmp/ACPAnalysisModel.cdb
+            Alternatively, a binary file-like object (for example
+            :class:`io.BytesIO`) to which the file content is written.
         """
-        with self._server_wrapper.auto_download(path) as export_path:
+        with self._server_wrapper.auto_download(path, suffix=".cdb") as export_path:
             with wrap_grpc_errors():
-                self._get_stub().SaveAnalysisModel(
+                self._get_bulk_data_stub(model_pb2_grpc.ObjectServiceStub).SaveAnalysisModel(
                     model_pb2.SaveAnalysisModelRequest(
                         resource_path=self._resource_path,
                         path=export_path,
@@ -461,7 +797,7 @@ class Model(TreeObject):
     @supported_since("25.1")
     def export_hdf5_composite_cae(
         self,
-        path: _PATH,
+        path: _PATH_OR_BINARY_IO,
         *,
         remove_midside_nodes: bool = True,
         layup_representation_3d: bool = False,
@@ -478,7 +814,8 @@ class Model(TreeObject):
         Parameters
         ----------
         path :
-            File path.
+            File path, or binary file-like object to which the file content
+            is written.
         remove_midside_nodes :
             If True, remove mid-side nodes from the exported mesh. This increases the
             overall performance.
@@ -504,9 +841,9 @@ class Model(TreeObject):
             file. This may be needed for compatibility with programs that don't fully
             support unicode when reading the file.
         """
-        with self._server_wrapper.auto_download(path) as export_path:
+        with self._server_wrapper.auto_download(path, suffix=".h5") as export_path:
             with wrap_grpc_errors():
-                self._get_stub().ExportHDF5CompositeCAE(
+                self._get_bulk_data_stub(model_pb2_grpc.ObjectServiceStub).ExportHDF5CompositeCAE(
                     model_pb2.ExportHDF5CompositeCAERequest(
                         resource_path=self._resource_path,
                         path=export_path,
@@ -587,7 +924,7 @@ class Model(TreeObject):
             }
 
         with wrap_grpc_errors():
-            self._get_stub().ImportHDF5CompositeCAE(
+            self._get_bulk_data_stub(model_pb2_grpc.ObjectServiceStub).ImportHDF5CompositeCAE(
                 model_pb2.ImportHDF5CompositeCAERequest(
                     resource_path=self._resource_path,
                     path=self._server_wrapper.auto_upload(path),
@@ -601,8 +938,9 @@ class Model(TreeObject):
                     **mapping_properties_kwargs,
                 )
             )
+        self._server_wrapper.mark_modified(self._resource_path)
 
-    def export_shell_composite_definitions(self, path: _PATH) -> None:
+    def export_shell_composite_definitions(self, path: _PATH_OR_BINARY_IO) -> None:
         """
         Export the lay-up of the shell as HDF5 used by DPF Composites or Mechanical.
 
@@ -610,10 +948,14 @@ class Model(TreeObject):
         ----------
         path:
             File path. Eg. /tmp/ACPCompositeDefinitions.h5
+            Alternatively, a binary file-like object to which the file content
+            is written.
         """
-        with self._server_wrapper.auto_download(path) as export_path:
+        with self._server_wrapper.auto_download(path, suffix=".h5") as export_path:
             with wrap_grpc_errors():
-                self._get_stub().SaveShellCompositeDefinitions(
+                self._get_bulk_data_stub(
+                    model_pb2_grpc.ObjectServiceStub
+                ).SaveShellCompositeDefinitions(
                     model_pb2.SaveShellCompositeDefinitionsRequest(
                         resource_path=self._resource_path, path=export_path
                     )
@@ -643,23 +985,29 @@ class Model(TreeObject):
         material_apdl_path:
             File path to the material APDL file.
         """
-        material_stub = material_pb2_grpc.ObjectServiceStub(self._channel)
+        material_stub = self._server_wrapper.get_stub(
+            material_pb2_grpc.ObjectServiceStub, bulk_data=True
+        )
         collection_path = CollectionPath(
             value=rp_join(self._resource_path.value, Material._COLLECTION_LABEL)
         )
 
+        local_paths = [matml_path]
+        if material_apdl_path is not None:
+            local_paths.append(material_apdl_path)
+        remote_paths = self._server_wrapper.auto_upload_many(local_paths)
+
         with wrap_grpc_errors():
             material_stub.ImportMaterialFiles(
                 material_pb2.ImportMaterialFilesRequest(
                     collection_path=collection_path,
-                    matml_path=self._server_wrapper.auto_upload(matml_path),
-                    material_apdl_path=self._server_wrapper.auto_upload(
-                        material_apdl_path, allow_none=True
-                    ),
+                    matml_path=remote_paths[0],
+                    material_apdl_path=remote_paths[1] if len(remote_paths) > 1 else "",
                 )
             )
+        self._server_wrapper.mark_modified(collection_path)
 
-    def export_materials(self, path: _PATH) -> None:
+    def export_materials(self, path: _PATH_OR_BINARY_IO) -> None:
         """
         Write materials to a XML (MatML) file.
 
@@ -670,12 +1018,16 @@ class Model(TreeObject):
         ----------
         path:
             File path. E.g. /tmp/acp_materials.xml
+            Alternatively, a binary file-like object to which the file content
+            is written.
         """
-        material_stub = material_pb2_grpc.ObjectServiceStub(self._channel)
+        material_stub = self._server_wrapper.get_stub(
+            material_pb2_grpc.ObjectServiceStub, bulk_data=True
+        )
         collection_path = CollectionPath(
             value=rp_join(self._resource_path.value, Material._COLLECTION_LABEL)
         )
-        with self._server_wrapper.auto_download(path) as export_path:
+        with self._server_wrapper.auto_download(path, suffix=".xml") as export_path:
             with wrap_grpc_errors():
                 material_stub.SaveToFile(
                     material_pb2.SaveToFileRequest(
@@ -740,7 +1092,9 @@ class Model(TreeObject):
             ]
         mp_resource_paths = [ply._resource_path for ply in modeling_plies]
 
-        modeling_ply_stub = modeling_ply_pb2_grpc.ObjectServiceStub(self._channel)
+        modeling_ply_stub = self._server_wrapper.get_stub(
+            modeling_ply_pb2_grpc.ObjectServiceStub, bulk_data=True
+        )
 
         if arrow_length is None:
             arrow_length = np.sqrt(self.average_element_size)
@@ -766,6 +1120,120 @@ class Model(TreeObject):
                     )
                 )
 
+    def export_bundle(self, exports: Mapping[_PATH, Callable[[_PATH], Any]]) -> ExportManifest:
+        """Run multiple exports, overlapping the exports with the file downloads.
+
+        The exports are run one after the other. When working with a remote
+        server, the exported files are downloaded in the background while the
+        next export runs.
+
+        Any export method (also of objects other than the model) which takes the
+        file path as its only required argument can be used, for example:
+
+        .. code-block:: python
+
+            model.export_bundle(
+                {
+                    "model.acph5": model.save,
+                    "analysis_model.cdb": model.export_analysis_model,
+                    "materials.xml": model.export_materials,
+                    "solid_model.h5": lambda path: solid_model.export(path, format="ansys:h5"),
+                }
+            )
+
+        Parameters
+        ----------
+        exports :
+            Mapping from the local file paths to the functions creating them.
+            Each function is called with its file path.
+
+        Returns
+        -------
+        :
+            Manifest describing the created files.
+        """
+        local_paths = [pathlib.Path(path) for path in exports]
+        export_paths = [
+            str(self._server_wrapper.filetransfer_handler.to_export_path(path))
+            for path in local_paths
+        ]
+        # Since the downloads are deferred, the exports must not overwrite each other
+        # on the server.
+        if len(set(export_paths)) != len(export_paths):
+            raise ValueError(
+                "The exports must be written to distinct file paths on the server. "
+                "When using a remote server, the file names must be unique."
+            )
+
+        start_time = time.perf_counter()
+        export_times = []
+        download_futures = []
+        filetransfer_handler = self._server_wrapper.filetransfer_handler
+        try:
+            for local_path, export_func in zip(local_paths, exports.values()):
+                downloads: list[Callable[[], None]] = []
+                export_start_time = time.perf_counter()
+                with deferred_downloads(downloads.append):
+                    export_func(local_path)
+                export_times.append(time.perf_counter() - export_start_time)
+                download_futures.append(filetransfer_handler.submit_transfer(_run_timed, downloads))
+        except BaseException:
+            # No files may be written after the error is raised, so pending
+            # downloads are cancelled and running ones are awaited.
+            for future in download_futures:
+                future.cancel()
+            concurrent.futures.wait(download_futures)
+            raise
+        download_times = [future.result() for future in download_futures]
+
+        exports_are_local = filetransfer_handler.exports_are_local
+        return ExportManifest(
+            entries=tuple(
+                ExportManifestEntry(
+                    path=local_path,
+                    size=local_path.stat().st_size if exports_are_local else None,
+                    export_time=export_time,
+                    download_time=download_time,
+                )
+                for local_path, export_time, download_time in zip(
+                    local_paths, export_times, download_times
+                )
+            ),
+            total_time=time.perf_counter() - start_time,
+        )
+
+    def checkpoint(self) -> ModelCheckpoint:
+        """Create an in-memory snapshot of the model definition.
+
+        The checkpoint contains the definition objects of the model, such as
+        materials, fabrics, and modeling plies, but not objects generated by
+        the server on update. It can be used to return to the current state
+        with :meth:`restore`, without saving and re-loading the model.
+
+        Returns
+        -------
+        :
+            Checkpoint of the current model state.
+        """
+        return create_checkpoint(self)
+
+    def restore(self, checkpoint: ModelCheckpoint) -> None:
+        """Restore the model definition from a checkpoint.
+
+        Only the differences between the current model state and the checkpoint
+        are applied: objects which have been added since the checkpoint are
+        deleted, modified objects are reset, and deleted objects are re-created.
+        Note that re-created objects may have a different ``id``.
+
+        Parameters
+        ----------
+        checkpoint :
+            Checkpoint created with :meth:`checkpoint`. It may also have been
+            created on a different model with the same mesh, for example the same
+            model loaded on another server.
+        """
+        restore_checkpoint(self, checkpoint)
+
     create_material = define_create_method(
         Material, func_name="create_material", parent_class_name="Model", module_name=__module__
     )
@@ -1007,7 +1475,10 @@ class Model(TreeObject):
     )
 
     mesh = full_mesh_property
+    amesh = full_mesh_async_method
     shell_mesh = shell_mesh_property
+    ashell_mesh = shell_mesh_async_method
     solid_mesh = solid_mesh_property
+    asolid_mesh = solid_mesh_async_method
     elemental_data = elemental_data_property(ModelElementalData)
     nodal_data = nodal_data_property(ModelNodalData)
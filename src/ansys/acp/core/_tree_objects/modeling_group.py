@@ -42,7 +42,12 @@ from ._elemental_or_nodal_data import (
 )
 from ._grpc_helpers.mapping import define_create_method, define_mutable_mapping
 from ._grpc_helpers.property_helper import mark_grpc_properties
-from ._mesh_data import full_mesh_property, shell_mesh_property
+from ._mesh_data import (
+    full_mesh_async_method,
+    full_mesh_property,
+    shell_mesh_async_method,
+    shell_mesh_property,
+)
 from .base import CreatableTreeObject, IdTreeObject
 from .butt_joint_sequence import ButtJointSequence
 from .interface_layer import InterfaceLayer
@@ -86,7 +91,7 @@ class ModelingGroup(CreatableTreeObject, IdTreeObject):
         super().__init__(name=name)
 
     def _create_stub(self) -> modeling_group_pb2_grpc.ObjectServiceStub:
-        return modeling_group_pb2_grpc.ObjectServiceStub(self._channel)
+        return self._server_wrapper.get_stub(modeling_group_pb2_grpc.ObjectServiceStub)
 
     create_modeling_ply = define_create_method(
         ModelingPly,
@@ -116,7 +121,9 @@ class ModelingGroup(CreatableTreeObject, IdTreeObject):
     )
 
     mesh = full_mesh_property
+    amesh = full_mesh_async_method
     shell_mesh = shell_mesh_property
+    ashell_mesh = shell_mesh_async_method
 
     elemental_data = elemental_data_property(ModelingGroupElementalData)
     nodal_data = nodal_data_property(ModelingGroupNodalData)
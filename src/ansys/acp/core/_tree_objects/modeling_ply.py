@@ -55,7 +55,12 @@ from ._grpc_helpers.property_helper import (
     grpc_link_property,
     mark_grpc_properties,
 )
-from ._mesh_data import full_mesh_property, shell_mesh_property
+from ._mesh_data import (
+    full_mesh_async_method,
+    full_mesh_property,
+    shell_mesh_async_method,
+    shell_mesh_property,
+)
 from .base import CreatableTreeObject, IdTreeObject
 from .edge_set import EdgeSet
 from .enums import (
@@ -360,7 +365,7 @@ class ModelingPly(CreatableTreeObject, IdTreeObject):
         self.taper_edges = taper_edges
 
     def _create_stub(self) -> modeling_ply_pb2_grpc.ObjectServiceStub:
-        return modeling_ply_pb2_grpc.ObjectServiceStub(self._channel)
+        return self._server_wrapper.get_stub(modeling_ply_pb2_grpc.ObjectServiceStub)
 
     status = grpc_data_property_read_only("properties.status", from_protobuf=status_type_from_pb)
 
@@ -451,7 +456,9 @@ class ModelingPly(CreatableTreeObject, IdTreeObject):
     )
 
     mesh = full_mesh_property
+    amesh = full_mesh_async_method
     shell_mesh = shell_mesh_property
+    ashell_mesh = shell_mesh_async_method
 
     elemental_data = elemental_data_property(ModelingPlyElementalData)
     nodal_data = nodal_data_property(ModelingPlyNodalData)
@@ -47,7 +47,12 @@ from ._grpc_helpers.property_helper import (
     grpc_link_property,
     mark_grpc_properties,
 )
-from ._mesh_data import full_mesh_property, shell_mesh_property
+from ._mesh_data import (
+    full_mesh_async_method,
+    full_mesh_property,
+    shell_mesh_async_method,
+    shell_mesh_property,
+)
 from .base import CreatableTreeObject, IdTreeObject
 from .boolean_selection_rule import BooleanSelectionRule
 from .cylindrical_selection_rule import CylindricalSelectionRule
@@ -200,7 +205,7 @@ class OrientedSelectionSet(CreatableTreeObject, IdTreeObject):
         self.reference_direction_field = reference_direction_field
 
     def _create_stub(self) -> oriented_selection_set_pb2_grpc.ObjectServiceStub:
-        return oriented_selection_set_pb2_grpc.ObjectServiceStub(self._channel)
+        return self._server_wrapper.get_stub(oriented_selection_set_pb2_grpc.ObjectServiceStub)
 
     status = grpc_data_property_read_only("properties.status", from_protobuf=status_type_from_pb)
 
@@ -275,7 +280,9 @@ class OrientedSelectionSet(CreatableTreeObject, IdTreeObject):
     )
 
     mesh = full_mesh_property
+    amesh = full_mesh_async_method
     shell_mesh = shell_mesh_property
+    ashell_mesh = shell_mesh_async_method
 
     elemental_data = elemental_data_property(OrientedSelectionSetElementalData)
     nodal_data = nodal_data_property(OrientedSelectionSetNodalData)
@@ -44,7 +44,12 @@ from ._grpc_helpers.property_helper import (
     grpc_link_property_read_only,
     mark_grpc_properties,
 )
-from ._mesh_data import full_mesh_property, shell_mesh_property
+from ._mesh_data import (
+    full_mesh_async_method,
+    full_mesh_property,
+    shell_mesh_async_method,
+    shell_mesh_property,
+)
 from .analysis_ply import AnalysisPly
 from .base import IdTreeObject, ReadOnlyTreeObject
 from .enums import status_type_from_pb
@@ -110,7 +115,7 @@ class ProductionPly(ReadOnlyTreeObject, IdTreeObject):
     _SUPPORTED_SINCE = "24.2"
 
     def _create_stub(self) -> production_ply_pb2_grpc.ObjectServiceStub:
-        return production_ply_pb2_grpc.ObjectServiceStub(self._channel)
+        return self._server_wrapper.get_stub(production_ply_pb2_grpc.ObjectServiceStub)
 
     status = grpc_data_property_read_only("properties.status", from_protobuf=status_type_from_pb)
     material = grpc_link_property_read_only("properties.material")
@@ -118,7 +123,9 @@ class ProductionPly(ReadOnlyTreeObject, IdTreeObject):
     thickness: ReadOnlyProperty[float] = grpc_data_property_read_only("properties.thickness")
 
     mesh = full_mesh_property
+    amesh = full_mesh_async_method
     shell_mesh = shell_mesh_property
+    ashell_mesh = shell_mesh_async_method
 
     elemental_data = elemental_data_property(ProductionPlyElementalData)
     nodal_data = nodal_data_property(ProductionPlyNodalData)
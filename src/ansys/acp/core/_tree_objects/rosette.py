@@ -89,7 +89,7 @@ class Rosette(CreatableTreeObject, IdTreeObject):
         self.edge_set = edge_set
 
     def _create_stub(self) -> rosette_pb2_grpc.ObjectServiceStub:
-        return rosette_pb2_grpc.ObjectServiceStub(self._channel)
+        return self._server_wrapper.get_stub(rosette_pb2_grpc.ObjectServiceStub)
 
     locked: ReadOnlyProperty[bool] = grpc_data_property_read_only("properties.locked")
     status = grpc_data_property_read_only("properties.status", from_protobuf=status_type_from_pb)
@@ -99,7 +99,7 @@ class SamplingPoint(CreatableTreeObject, IdTreeObject):
         self.consider_coupling_effect = consider_coupling_effect
 
     def _create_stub(self) -> sampling_point_pb2_grpc.ObjectServiceStub:
-        return sampling_point_pb2_grpc.ObjectServiceStub(self._channel)
+        return self._server_wrapper.get_stub(sampling_point_pb2_grpc.ObjectServiceStub)
 
     locked: ReadOnlyProperty[bool] = grpc_data_property_read_only("properties.locked")
     status = grpc_data_property_read_only("properties.status", from_protobuf=status_type_from_pb)
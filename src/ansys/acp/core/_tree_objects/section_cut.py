@@ -32,6 +32,7 @@ from .._utils.array_conversions import to_1D_double_array, to_tuple_from_1D_arra
 from .._utils.path_to_str import path_to_str_checked
 from .._utils.property_protocols import ReadOnlyProperty, ReadWriteProperty
 from .._utils.typing_helper import PATH as _PATH
+from .._utils.typing_helper import PATH_OR_BINARY_IO as _PATH_OR_BINARY_IO
 from ._grpc_helpers.exceptions import wrap_grpc_errors
 from ._grpc_helpers.linked_object_list import define_linked_object_list
 from ._grpc_helpers.property_helper import (
@@ -170,7 +171,7 @@ class SectionCut(CreatableTreeObject, IdTreeObject):
         self.number_of_interpolation_points = number_of_interpolation_points
 
     def _create_stub(self) -> section_cut_pb2_grpc.ObjectServiceStub:
-        return section_cut_pb2_grpc.ObjectServiceStub(self._channel)
+        return self._server_wrapper.get_stub(section_cut_pb2_grpc.ObjectServiceStub)
 
     # general properties
     status = grpc_data_property_read_only("properties.status", from_protobuf=status_type_from_pb)
@@ -235,7 +236,7 @@ class SectionCut(CreatableTreeObject, IdTreeObject):
 
     def export(
         self,
-        path: _PATH,
+        path: _PATH_OR_BINARY_IO,
         *,
         export_type: SectionCutCDBExportType = "mesh_only",
     ) -> None:
@@ -244,7 +245,8 @@ class SectionCut(CreatableTreeObject, IdTreeObject):
         Parameters
         ----------
         path :
-            Path to the file where the section cut is saved.
+            Path to the file where the section cut is saved, or binary
+            file-like object to which the file content is written.
         export_type :
             Determines what is exported to the CDB file. Options are:
 
@@ -256,9 +258,9 @@ class SectionCut(CreatableTreeObject, IdTreeObject):
               beam properties of the section cut.
 
         """
-        with self._server_wrapper.auto_download(path) as export_path:
+        with self._server_wrapper.auto_download(path, suffix=".cdb") as export_path:
             with wrap_grpc_errors():
-                self._get_stub().ExportToCDB(  # type: ignore
+                self._get_bulk_data_stub(section_cut_pb2_grpc.ObjectServiceStub).ExportToCDB(
                     section_cut_pb2.ExportToCDBRequest(
                         resource_path=self._resource_path,
                         path=export_path,
@@ -299,14 +301,16 @@ class SectionCut(CreatableTreeObject, IdTreeObject):
             expected_filenames.append("FAILMAT.in")
 
         with wrap_grpc_errors():
-            self._get_stub().ExportToBECAS(  # type: ignore
+            self._get_bulk_data_stub(section_cut_pb2_grpc.ObjectServiceStub).ExportToBECAS(
                 section_cut_pb2.ExportToBECASRequest(
                     resource_path=self._resource_path,
                     path=path_to_str_checked(export_path),
                     export_strength_limits=export_strength_limits,
                 )
             )
-        for filename in expected_filenames:
-            self._server_wrapper.filetransfer_handler.download_file_if_autotransfer(
-                export_path / filename, pathlib.Path(path) / filename
-            )
+        self._server_wrapper.filetransfer_handler.download_many_if_autotransfer(
+            [
+                (export_path / filename, pathlib.Path(path) / filename)
+                for filename in expected_filenames
+            ]
+        )
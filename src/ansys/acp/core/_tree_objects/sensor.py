@@ -101,7 +101,7 @@ class Sensor(CreatableTreeObject, IdTreeObject):
         self.sensor_type = sensor_type
 
     def _create_stub(self) -> sensor_pb2_grpc.ObjectServiceStub:
-        return sensor_pb2_grpc.ObjectServiceStub(self._channel)
+        return self._server_wrapper.get_stub(sensor_pb2_grpc.ObjectServiceStub)
 
     locked: ReadOnlyProperty[bool] = grpc_data_property_read_only("properties.locked")
     sensor_type = grpc_data_property(
@@ -92,7 +92,7 @@ class SnapToGeometry(CreatableTreeObject, IdTreeObject):
         self.oriented_selection_set = oriented_selection_set
 
     def _create_stub(self) -> snap_to_geometry_pb2_grpc.ObjectServiceStub:
-        return snap_to_geometry_pb2_grpc.ObjectServiceStub(self._channel)
+        return self._server_wrapper.get_stub(snap_to_geometry_pb2_grpc.ObjectServiceStub)
 
     status = grpc_data_property_read_only("properties.status", from_protobuf=status_type_from_pb)
     active: ReadWriteProperty[bool, bool] = grpc_data_property("properties.active")
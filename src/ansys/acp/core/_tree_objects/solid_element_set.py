@@ -31,7 +31,7 @@ from .._utils.array_conversions import to_tuple_from_1D_array
 from .._utils.property_protocols import ReadOnlyProperty
 from ._elemental_or_nodal_data import ElementalData, NodalData
 from ._grpc_helpers.property_helper import grpc_data_property_read_only, mark_grpc_properties
-from ._mesh_data import solid_mesh_property
+from ._mesh_data import solid_mesh_async_method, solid_mesh_property
 from .base import IdTreeObject, ReadOnlyTreeObject
 from .enums import status_type_from_pb
 from .object_registry import register
@@ -70,7 +70,7 @@ class SolidElementSet(ReadOnlyTreeObject, IdTreeObject):
     _SUPPORTED_SINCE = "25.1"
 
     def _create_stub(self) -> solid_element_set_pb2_grpc.ObjectServiceStub:
-        return solid_element_set_pb2_grpc.ObjectServiceStub(self._channel)
+        return self._server_wrapper.get_stub(solid_element_set_pb2_grpc.ObjectServiceStub)
 
     status = grpc_data_property_read_only("properties.status", from_protobuf=status_type_from_pb)
     locked: ReadOnlyProperty[bool] = grpc_data_property_read_only("properties.locked")
@@ -79,3 +79,4 @@ class SolidElementSet(ReadOnlyTreeObject, IdTreeObject):
     )
 
     solid_mesh = solid_mesh_property
+    asolid_mesh = solid_mesh_async_method
@@ -454,7 +454,7 @@ class SolidModel(SolidModelExportMixin, CreatableTreeObject, IdTreeObject):
         self.export_settings = export_settings
 
     def _create_stub(self) -> solid_model_pb2_grpc.ObjectServiceStub:
-        return solid_model_pb2_grpc.ObjectServiceStub(self._channel)
+        return self._server_wrapper.get_stub(solid_model_pb2_grpc.ObjectServiceStub)
 
     status = grpc_data_property_read_only("properties.status", from_protobuf=status_type_from_pb)
     locked: ReadOnlyProperty[bool] = grpc_data_property_read_only("properties.locked")
@@ -218,7 +218,7 @@ class Stackup(CreatableTreeObject, IdTreeObject):
         self.draping_ud_coefficient = draping_ud_coefficient
 
     def _create_stub(self) -> stackup_pb2_grpc.ObjectServiceStub:
-        return stackup_pb2_grpc.ObjectServiceStub(self._channel)
+        return self._server_wrapper.get_stub(stackup_pb2_grpc.ObjectServiceStub)
 
     locked: ReadOnlyProperty[bool] = grpc_data_property_read_only("properties.locked")
     status = grpc_data_property_read_only("properties.status", from_protobuf=status_type_from_pb)
@@ -193,7 +193,7 @@ class SubLaminate(CreatableTreeObject, IdTreeObject):
         self.materials = materials
 
     def _create_stub(self) -> sublaminate_pb2_grpc.ObjectServiceStub:
-        return sublaminate_pb2_grpc.ObjectServiceStub(self._channel)
+        return self._server_wrapper.get_stub(sublaminate_pb2_grpc.ObjectServiceStub)
 
     locked: ReadOnlyProperty[bool] = grpc_data_property_read_only("properties.locked")
     status = grpc_data_property_read_only("properties.status", from_protobuf=status_type_from_pb)
@@ -45,7 +45,12 @@ from ._grpc_helpers.property_helper import (
     grpc_link_property,
     mark_grpc_properties,
 )
-from ._mesh_data import full_mesh_property, shell_mesh_property
+from ._mesh_data import (
+    full_mesh_async_method,
+    full_mesh_property,
+    shell_mesh_async_method,
+    shell_mesh_property,
+)
 from .base import CreatableTreeObject, IdTreeObject
 from .edge_set import EdgeSet
 from .element_set import ElementSet
@@ -147,7 +152,9 @@ class VariableOffsetSelectionRule(CreatableTreeObject, IdTreeObject):
         self.distance_along_edge = distance_along_edge
 
     def _create_stub(self) -> variable_offset_selection_rule_pb2_grpc.ObjectServiceStub:
-        return variable_offset_selection_rule_pb2_grpc.ObjectServiceStub(self._channel)
+        return self._server_wrapper.get_stub(
+            variable_offset_selection_rule_pb2_grpc.ObjectServiceStub
+        )
 
     status = grpc_data_property_read_only("properties.status", from_protobuf=status_type_from_pb)
 
@@ -177,7 +184,9 @@ class VariableOffsetSelectionRule(CreatableTreeObject, IdTreeObject):
     )
 
     mesh = full_mesh_property
+    amesh = full_mesh_async_method
     shell_mesh = shell_mesh_property
+    ashell_mesh = shell_mesh_async_method
     # selection rules don't have solid mesh data
     elemental_data = elemental_data_property(VariableOffsetSelectionRuleElementalData)
     nodal_data = nodal_data_property(VariableOffsetSelectionRuleNodalData)
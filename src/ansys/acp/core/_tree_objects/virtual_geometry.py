@@ -178,7 +178,7 @@ class VirtualGeometry(CreatableTreeObject, IdTreeObject):
             self.sub_shapes = sub_shapes
 
     def _create_stub(self) -> virtual_geometry_pb2_grpc.ObjectServiceStub:
-        return virtual_geometry_pb2_grpc.ObjectServiceStub(self._channel)
+        return self._server_wrapper.get_stub(virtual_geometry_pb2_grpc.ObjectServiceStub)
 
     status = grpc_data_property_read_only("properties.status", from_protobuf=status_type_from_pb)
     dimension = grpc_data_property_read_only(
@@ -0,0 +1,120 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Client-side tracking of modifications to ACP models."""
+
+from __future__ import annotations
+
+from collections.abc import Hashable
+import threading
+
+from .resource_paths import join, to_parts
+
+__all__ = ["ModificationTracker"]
+
+
+class ModificationTracker:
+    """Track a modification generation for each model on a server.
+
+    The generation of a model is incremented whenever a modification of the
+    model (or any of its children) is made through this client. Operations
+    whose outcome only depends on the model state, such as updating or saving
+    the model, can record the generation at which they were run, and be
+    skipped if the generation has not changed since. Operations can also
+    record a state, for example the modification time of a file they wrote,
+    which must be unchanged for the operation to be up to date.
+
+    Modifications made by other clients connected to the same server are
+    not tracked.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._generations: dict[str, int] = {}
+        # Generation and state at which each operation was last run.
+        self._operation_generations: dict[tuple[str, Hashable], tuple[int, Hashable]] = {}
+
+    @staticmethod
+    def _model_key(resource_path: str) -> str:
+        # Resource paths of model contents start with 'models/<model_uuid>'.
+        return join(*to_parts(resource_path)[:2])
+
+    def generation(self, resource_path: str) -> int:
+        """Get the modification generation of the model containing the given object."""
+        with self._lock:
+            return self._generations.get(self._model_key(resource_path), 0)
+
+    def mark_modified(self, resource_path: str) -> None:
+        """Mark the model containing the given object as modified."""
+        model_key = self._model_key(resource_path)
+        with self._lock:
+            self._generations[model_key] = self._generations.get(model_key, 0) + 1
+
+    def is_up_to_date(
+        self, resource_path: str, operation: Hashable, state: Hashable = None
+    ) -> bool:
+        """Check if the operation was run since the last modification of the model.
+
+        If a ``state`` is given, it must match the state recorded with the operation.
+        """
+        model_key = self._model_key(resource_path)
+        with self._lock:
+            recorded = self._operation_generations.get((model_key, operation))
+            return recorded == (self._generations.get(model_key, 0), state)
+
+    def record_operation(
+        self,
+        resource_path: str,
+        operations: tuple[Hashable, ...],
+        start_generation: int,
+        modifies_model: bool = False,
+        state: Hashable = None,
+    ) -> None:
+        """Record that the given operations were successfully run.
+
+        Parameters
+        ----------
+        resource_path :
+            Resource path of the model, or an object in the model.
+        operations :
+            Keys of the operations which were run.
+        start_generation :
+            Generation of the model at the start of the operation. If the model was
+            modified while the operation was running, the operation is not recorded.
+        modifies_model :
+            Whether the operation itself modifies the model. If ``True``, the model
+            generation is incremented, invalidating all other recorded operations.
+        state :
+            State recorded with the operations, replacing the previously recorded state.
+        """
+        model_key = self._model_key(resource_path)
+        with self._lock:
+            current_generation = self._generations.get(model_key, 0)
+            if modifies_model:
+                current_generation += 1
+                self._generations[model_key] = current_generation
+                if current_generation != start_generation + 1:
+                    return
+            elif current_generation != start_generation:
+                return
+            for operation in operations:
+                self._operation_generations[(model_key, operation)] = (current_generation, state)
@@ -24,11 +24,13 @@
 
 import enum
 import os
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, BinaryIO, Union
 
-__all__ = ["PATH", "StrEnum"]
+__all__ = ["PATH", "PATH_OR_BINARY_IO", "StrEnum"]
 
 PATH = Union[str, os.PathLike[str]]
+# Destination of an export: a file path, or a binary file-like object.
+PATH_OR_BINARY_IO = Union[str, os.PathLike[str], BinaryIO]
 
 # For Python 3.10 and below, emulate the behavior of StrEnum by
 # inheriting from str and enum.Enum.
@@ -0,0 +1,40 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+def test_collection_access(benchmark, load_model_from_tempfile):
+    """Repeatedly access a collection, which creates the collection's stub."""
+    with load_model_from_tempfile() as model:
+        benchmark(lambda: model.fabrics)
+
+
+def test_iterate_collection(benchmark, load_model_from_tempfile):
+    """Iterate over a collection, constructing an object for each entry."""
+    with load_model_from_tempfile() as model:
+        for i in range(20):
+            model.create_fabric(name=f"Fabric.{i}")
+        benchmark(lambda: [fabric.name for fabric in model.fabrics.values()])
+
+
+def test_mesh_access(benchmark, load_model_from_tempfile):
+    with load_model_from_tempfile() as model:
+        benchmark(lambda: model.mesh)
@@ -20,7 +20,30 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import pytest
+
+from ansys.acp.core import Fabric, store_many
+
 
 def test_create_modeling_group(benchmark, load_model_from_tempfile):
     with load_model_from_tempfile() as model:
         benchmark(model.create_modeling_group)
+
+
+def _create_fabrics_sequential(model, num_objects):
+    for i in range(num_objects):
+        Fabric(name=f"Fabric.{i}").store(parent=model)
+
+
+def _create_fabrics_pipelined(model, num_objects):
+    store_many([Fabric(name=f"Fabric.{i}") for i in range(num_objects)], parent=model)
+
+
+@pytest.mark.parametrize(
+    "create_fabrics",
+    [_create_fabrics_sequential, _create_fabrics_pipelined],
+    ids=["sequential", "pipelined"],
+)
+def test_create_many_fabrics(benchmark, load_model_from_tempfile, create_fabrics):
+    with load_model_from_tempfile() as model:
+        benchmark(create_fabrics, model, 100)
@@ -0,0 +1,70 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import pytest
+
+import ansys.acp.core as pyacp
+from ansys.acp.core._server.acp_instance import ACPInstance
+
+TRANSPORT_PROFILES = {
+    "default": pyacp.TransportProfile(),
+    "gzip": pyacp.TransportProfile(control_compression="gzip", bulk_data_compression="gzip"),
+    "gzip_bulk_data": pyacp.TransportProfile(bulk_data_compression="gzip"),
+    "large_window": pyacp.TransportProfile(
+        http2_stream_window_size=16 * 1024**2, http2_bdp_probe=False
+    ),
+}
+
+
+@pytest.fixture(params=list(TRANSPORT_PROFILES), ids=list(TRANSPORT_PROFILES))
+def profiled_acp_instance(request, acp_instance):
+    # Connect to the benchmark server for the current network options,
+    # using channels with the settings of the profile.
+    return ACPInstance(
+        server=acp_instance._server,
+        filetransfer_handler=acp_instance._filetransfer_handler,
+        is_remote=acp_instance.is_remote,
+        transport_profile=TRANSPORT_PROFILES[request.param],
+    )
+
+
+@pytest.fixture
+def class40_model(profiled_acp_instance, model_data_dir):
+    model = profiled_acp_instance.import_model(
+        path=model_data_dir / "class40.cdb",
+        format="ansys:cdb",
+        unit_system=pyacp.UnitSystemType.MPA,
+    )
+    yield model
+    profiled_acp_instance.clear()
+
+
+def test_get_mesh_data(benchmark, class40_model):
+    benchmark(lambda: class40_model.mesh)
+
+
+def test_get_elemental_data(benchmark, class40_model):
+    benchmark(lambda: class40_model.elemental_data.normal)
+
+
+def test_get_property(benchmark, class40_model):
+    benchmark(lambda: class40_model.name)
@@ -224,6 +224,30 @@ class TreeObjectTester(TreeObjectTesterReadOnly):
         with pytest.raises(KeyError):
             object_collection[ref_id]
 
+    @staticmethod
+    def test_collection_delete_many(collection_test_data):
+        """Test deleting multiple items in the object collection."""
+        object_collection, _, object_ids = collection_test_data
+        # Use the last objects, since they are definitely not locked.
+        ref_id_key, ref_id_object = object_ids[-2:]
+        num_objects = len(object_collection)
+
+        object_collection.delete_many([ref_id_key, object_collection[ref_id_object]])
+        assert len(object_collection) == num_objects - 2
+        for ref_id in (ref_id_key, ref_id_object):
+            with pytest.raises(KeyError):
+                object_collection[ref_id]
+
+    @staticmethod
+    def test_collection_delete_many_inexistent(collection_test_data):
+        """Test that no item is deleted if one of the keys does not exist."""
+        object_collection, _, object_ids = collection_test_data
+        num_objects = len(object_collection)
+
+        with pytest.raises(KeyError):
+            object_collection.delete_many([object_ids[-1], "Inexistent ID"])
+        assert len(object_collection) == num_objects
+
     @staticmethod
     def test_unstored_parent_access_raises(collection_test_data):
         """Test that unstored objects raise an error when accessing the parent."""
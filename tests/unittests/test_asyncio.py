@@ -0,0 +1,172 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import asyncio
+import pathlib
+import tempfile
+
+import numpy.testing
+import pytest
+
+import ansys.acp.core as pyacp
+from ansys.acp.core._tree_objects._grpc_helpers.futures import await_grpc_call
+
+
+class _PendingGrpcFuture:
+    """Stand-in for a gRPC future which never completes unless cancelled."""
+
+    def __init__(self):
+        self.callbacks = []
+        self.is_cancelled = False
+
+    def add_done_callback(self, callback):
+        self.callbacks.append(callback)
+
+    def cancel(self):
+        self.is_cancelled = True
+        for callback in self.callbacks:
+            callback(self)
+        return True
+
+    def cancelled(self):
+        return self.is_cancelled
+
+
+def test_cancelling_task_cancels_grpc_call():
+    """Check that cancelling the awaiting task cancels the gRPC call."""
+    # GIVEN: a task awaiting a pending gRPC call
+    grpc_future = _PendingGrpcFuture()
+
+    async def cancel_call():
+        task = asyncio.ensure_future(await_grpc_call(grpc_future, on_success=lambda reply: reply))
+        await asyncio.sleep(0)
+        # WHEN: the task is cancelled
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel_call())
+
+    # THEN: the gRPC call is cancelled
+    assert grpc_future.is_cancelled
+
+
+@pytest.fixture
+def model(load_model_from_tempfile):
+    with load_model_from_tempfile() as model:
+        yield model
+
+
+def test_aget(model):
+    """Check that 'aget' returns the same values as the synchronous properties."""
+    # GIVEN: a fabric
+    fabric = model.create_fabric(name="Fabric", thickness=0.2)
+
+    # WHEN: the properties are fetched asynchronously
+    values = asyncio.run(fabric.aget("name", "thickness", "material"))
+
+    # THEN: they match the synchronous properties
+    assert values == {
+        "name": fabric.name,
+        "thickness": fabric.thickness,
+        "material": fabric.material,
+    }
+
+
+def test_aget_unstored():
+    """Check that 'aget' on an unstored object returns the local values."""
+    fabric = pyacp.Fabric(name="Fabric", thickness=0.3)
+    assert asyncio.run(fabric.aget("name", "thickness")) == {"name": "Fabric", "thickness": 0.3}
+
+
+def test_aget_refreshes_local_data(model):
+    """Check that 'aget' sees modifications made through another handle."""
+    # GIVEN: two handles to the same object, one of which is modified
+    fabric = model.create_fabric(name="Fabric")
+    other_handle = pyacp.Fabric._from_object_info(fabric._pb_object, fabric._server_wrapper)
+    fabric.thickness = 0.5
+
+    # WHEN: fetching the property from the other handle
+    values = asyncio.run(other_handle.aget("thickness"))
+
+    # THEN: the modification is seen
+    assert values == {"thickness": 0.5}
+
+
+def test_alist(model):
+    """Check that 'alist' returns the objects of the collection."""
+    model.fabrics.clear()
+    for name in ["Fabric.1", "Fabric.2", "Fabric.3"]:
+        model.create_fabric(name=name)
+
+    fabrics = asyncio.run(model.fabrics.alist())
+
+    assert fabrics == list(model.fabrics.values())
+
+
+def test_concurrent_requests(model):
+    """Check that several requests can run concurrently in one event loop."""
+    # GIVEN: several fabrics
+    fabrics = [model.create_fabric(name=f"Fabric.{i}", thickness=0.1 * i) for i in range(1, 6)]
+
+    # WHEN: fetching all of them concurrently
+    async def fetch_all():
+        return await asyncio.gather(*(fabric.aget("thickness") for fabric in fabrics))
+
+    results = asyncio.run(fetch_all())
+
+    # THEN: each result belongs to the corresponding fabric
+    assert [result["thickness"] for result in results] == [fabric.thickness for fabric in fabrics]
+
+
+def test_aupdate(model):
+    """Check that 'aupdate' updates the model."""
+    model.modeling_groups["ModelingGroup.1"].name = "New name"
+
+    asyncio.run(model.aupdate())
+
+    assert model._server_wrapper.modification_tracker.is_up_to_date(
+        model._resource_path.value, "update"
+    )
+
+
+def test_asave(model):
+    """Check that 'asave' writes the model file, and skips saving an unmodified model."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = pathlib.Path(tmp_dir) / "model.acph5"
+
+        asyncio.run(model.asave(path))
+        assert path.is_file()
+        mtime = path.stat().st_mtime_ns
+
+        asyncio.run(model.asave(path))
+        assert path.stat().st_mtime_ns == mtime
+
+
+def test_amesh(model):
+    """Check that the asynchronous mesh fetch matches the 'mesh' property."""
+    mesh = asyncio.run(model.amesh())
+    reference = model.mesh
+
+    numpy.testing.assert_equal(mesh.node_labels, reference.node_labels)
+    numpy.testing.assert_allclose(mesh.node_coordinates, reference.node_coordinates)
+    numpy.testing.assert_equal(mesh.element_nodes, reference.element_nodes)
@@ -0,0 +1,90 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import pytest
+
+
+@pytest.fixture
+def model(load_model_from_tempfile):
+    with load_model_from_tempfile() as model:
+        yield model
+
+
+def test_content_hash_stable(model):
+    """Check that the content hash is stable, and changes with the properties."""
+    # GIVEN: a fabric
+    fabric = model.fabrics["Fabric.1"]
+    initial_hash = fabric.content_hash()
+
+    # WHEN: computing the hash again, and after renaming the fabric
+    repeated_hash = fabric.content_hash()
+    fabric.name = "Renamed fabric"
+
+    # THEN: the hash is unchanged
+    assert repeated_hash == initial_hash
+    assert fabric.content_hash() == initial_hash
+
+    # WHEN: changing the thickness
+    fabric.thickness *= 2
+
+    # THEN: the hash changes
+    assert fabric.content_hash() != initial_hash
+
+
+def test_content_hash_clone(model):
+    """Check that an object and its clone have the same content hash."""
+    # GIVEN: a stored fabric and an unstored clone
+    fabric = model.fabrics["Fabric.1"]
+    clone = fabric.clone()
+
+    # THEN: the hashes match, before and after storing the clone
+    assert clone.content_hash() == fabric.content_hash()
+    clone.store(parent=model)
+    assert clone.content_hash() == fabric.content_hash()
+
+
+def test_subtree_hash(model):
+    """Check that the subtree hash changes when a child object is modified."""
+    # GIVEN: a modeling group and the model
+    modeling_group = model.modeling_groups["ModelingGroup.1"]
+    modeling_ply = modeling_group.modeling_plies["ModelingPly.1"]
+    initial_group_hash = modeling_group.subtree_hash()
+    initial_group_content_hash = modeling_group.content_hash()
+    initial_model_hash = model.subtree_hash()
+    initial_fabric_hash = model.fabrics["Fabric.1"].subtree_hash()
+
+    # WHEN: modifying a modeling ply
+    modeling_ply.number_of_layers += 1
+
+    # THEN: the subtree hashes of its ancestors change, but not their content
+    # hashes or the hashes of unrelated objects
+    assert modeling_group.subtree_hash() != initial_group_hash
+    assert modeling_group.content_hash() == initial_group_content_hash
+    assert model.subtree_hash() != initial_model_hash
+    assert model.fabrics["Fabric.1"].subtree_hash() == initial_fabric_hash
+
+
+def test_subtree_hash_unstored(model):
+    """Check that computing the subtree hash of an unstored object raises an error."""
+    clone = model.fabrics["Fabric.1"].clone()
+    with pytest.raises(RuntimeError):
+        clone.subtree_hash()
@@ -0,0 +1,192 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import subprocess
+from typing import Any
+
+import pytest
+
+import ansys.acp.core as pyacp
+from ansys.acp.core._server import docker_compose
+from ansys.acp.core._server.common import ServerKey
+from ansys.acp.core._server.docker_compose import DockerComposeLauncher
+from ansys.acp.core._server.startup import JsonCacheFile
+
+
+class FakeDockerCompose:
+    """Records the docker compose commands, and simulates their results."""
+
+    def __init__(self) -> None:
+        self.commands: list[list[str]] = []
+        self.running = False
+
+    def check_output(self, cmd: list[str], **kwargs: Any) -> str:
+        return "2.20.0\n"
+
+    def run(self, cmd: list[str], **kwargs: Any) -> subprocess.CompletedProcess[str]:
+        self.commands.append(cmd)
+        stdout = ""
+        if "up" in cmd:
+            self.running = True
+        elif "down" in cmd:
+            self.running = False
+        elif "ps" in cmd and self.running:
+            stdout = "container_id\n"
+        return subprocess.CompletedProcess(cmd, returncode=0, stdout=stdout, stderr="")
+
+    def count(self, subcommand: str) -> int:
+        return sum(subcommand in cmd for cmd in self.commands)
+
+
+@pytest.fixture
+def fake_compose(tmp_path, monkeypatch):
+    monkeypatch.setenv("PYACP_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(docker_compose, "_REUSABLE_STACKS", JsonCacheFile("stacks"))
+    fake = FakeDockerCompose()
+    monkeypatch.setattr(subprocess, "check_output", fake.check_output)
+    monkeypatch.setattr(subprocess, "run", fake.run)
+    ports = iter(range(50000, 50100))
+    monkeypatch.setattr(
+        docker_compose, "find_free_ports", lambda n: [next(ports) for _ in range(n)]
+    )
+    monkeypatch.setattr(docker_compose, "check_grpc_health", lambda channel, timeout: fake.running)
+    return fake
+
+
+def _make_config(**kwargs: Any) -> pyacp.DockerComposeLaunchConfig:
+    return pyacp.DockerComposeLaunchConfig(transport_mode="insecure", license_server="", **kwargs)
+
+
+def test_running_stack_is_reused(fake_compose):
+    # GIVEN: a stack started with a project name
+    first = DockerComposeLauncher(config=_make_config(project_name="pyacp_test"))
+    first.start()
+    first.stop()
+    assert fake_compose.running
+    assert not first.needs_clear
+
+    # WHEN: launching again with the same configuration
+    second = DockerComposeLauncher(config=_make_config(project_name="pyacp_test"))
+    second.start()
+
+    # THEN: the running stack is used, without starting it again
+    assert fake_compose.count("up") == 1
+    assert second.needs_clear
+    assert (
+        second.transport_options[ServerKey.MAIN].port
+        == first.transport_options[ServerKey.MAIN].port
+    )
+
+
+def test_stack_with_different_configuration_is_replaced(fake_compose):
+    # GIVEN: a stack started with a project name
+    DockerComposeLauncher(config=_make_config(project_name="pyacp_test")).start()
+
+    # WHEN: launching with the same project name, but a different image
+    launcher = DockerComposeLauncher(
+        config=_make_config(project_name="pyacp_test", image_name_acp="acp:other")
+    )
+    launcher.start()
+
+    # THEN: the stack is replaced by a new one
+    assert fake_compose.count("up") == 2
+    assert fake_compose.count("down") == 2
+    assert not launcher.needs_clear
+
+
+def test_stopped_stack_is_restarted(fake_compose):
+    # GIVEN: a reusable stack which was removed outside of PyACP
+    DockerComposeLauncher(config=_make_config(project_name="pyacp_test")).start()
+    fake_compose.running = False
+
+    # WHEN: launching with the same project name
+    launcher = DockerComposeLauncher(config=_make_config(project_name="pyacp_test"))
+    launcher.start()
+
+    # THEN: a new stack is started
+    assert fake_compose.count("up") == 2
+    assert not launcher.needs_clear
+
+
+def test_clear_on_reuse_can_be_disabled(fake_compose):
+    DockerComposeLauncher(config=_make_config(project_name="pyacp_test")).start()
+
+    launcher = DockerComposeLauncher(
+        config=_make_config(project_name="pyacp_test", clear_on_reuse=False)
+    )
+    launcher.start()
+
+    assert fake_compose.count("up") == 1
+    assert not launcher.needs_clear
+
+
+def test_stack_without_project_name_is_removed_on_stop(fake_compose):
+    # GIVEN: a stack started without a project name
+    launcher = DockerComposeLauncher(config=_make_config())
+    launcher.start()
+
+    # WHEN: stopping the launcher
+    launcher.stop()
+
+    # THEN: the stack is removed, including its volume
+    assert not fake_compose.running
+    assert "--volumes" in fake_compose.commands[-1]
+
+
+def test_restart_replaces_reusable_stack(fake_compose):
+    """Check that restarting a launcher does not attach to its own stack."""
+    # GIVEN: a started reusable stack
+    launcher = DockerComposeLauncher(config=_make_config(project_name="pyacp_test"))
+    launcher.start()
+
+    # WHEN: the launcher is restarted
+    launcher.stop()
+    launcher.start()
+
+    # THEN: the stack is brought down and started again
+    assert fake_compose.count("down") == 2
+    assert fake_compose.count("up") == 2
+    assert not launcher.needs_clear
+    assert fake_compose.running
+
+
+def test_remove_docker_compose_stack(fake_compose):
+    # GIVEN: a reusable stack, which is kept running when stopped
+    launcher = DockerComposeLauncher(config=_make_config(project_name="pyacp_test"))
+    launcher.start()
+    launcher.stop()
+
+    # WHEN: removing the stack
+    pyacp.remove_docker_compose_stack(_make_config(project_name="pyacp_test"))
+
+    # THEN: the stack is removed, and a new launch starts a new stack
+    assert not fake_compose.running
+    assert "--volumes" in fake_compose.commands[-1]
+    new_launcher = DockerComposeLauncher(config=_make_config(project_name="pyacp_test"))
+    new_launcher.start()
+    assert fake_compose.count("up") == 2
+    assert not new_launcher.needs_clear
+
+
+def test_remove_docker_compose_stack_requires_project_name(fake_compose):
+    with pytest.raises(ValueError):
+        pyacp.remove_docker_compose_stack(_make_config())
@@ -0,0 +1,156 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+import pathlib
+import threading
+
+import grpc
+
+from ansys.acp.core._server.acp_instance import (
+    _MAX_PARALLEL_TRANSFERS,
+    FileTransferHandler,
+    RemoteFileTransferStrategy,
+)
+
+
+class _BlockingStrategy(RemoteFileTransferStrategy):
+    """Remote strategy which records how many transfers run at the same time."""
+
+    def __init__(self, num_parallel: int) -> None:
+        super().__init__(channel_getter=lambda: None)  # type: ignore
+        self._barrier = threading.Barrier(num_parallel, timeout=10)
+        self.downloaded: list[tuple[str, str]] = []
+
+    def upload_file(self, local_path):
+        # Only returns once 'num_parallel' uploads are running.
+        self._barrier.wait()
+        return pathlib.PurePosixPath(os.path.basename(local_path))
+
+    def download_file(self, remote_path, local_path):
+        self._barrier.wait()
+        self.downloaded.append((str(remote_path), str(local_path)))
+
+
+def test_client_is_reused():
+    """Check that the file transfer client is only re-created if the channel changes."""
+    channels = [grpc.insecure_channel("localhost:1")]
+    strategy = RemoteFileTransferStrategy(channel_getter=lambda: channels[-1])
+    client = strategy._ft_client
+    assert strategy._ft_client is client
+
+    channels.append(grpc.insecure_channel("localhost:1"))
+    assert strategy._ft_client is not client
+    for channel in channels:
+        channel.close()
+
+
+def test_upload_many_is_parallel(tmp_path):
+    """Check that multiple files are uploaded at the same time."""
+    # GIVEN: files to upload, and a strategy which waits for parallel uploads
+    local_paths = [tmp_path / f"file_{i}.txt" for i in range(_MAX_PARALLEL_TRANSFERS)]
+    for local_path in local_paths:
+        local_path.write_text(local_path.name)
+    handler = FileTransferHandler(
+        _BlockingStrategy(num_parallel=_MAX_PARALLEL_TRANSFERS), auto_transfer_files=True
+    )
+
+    # WHEN: the files are uploaded
+    remote_paths = handler.upload_many(local_paths)
+
+    # THEN: the remote paths are returned in order
+    assert remote_paths == [pathlib.PurePosixPath(path.name) for path in local_paths]
+
+
+def test_download_many_is_parallel(tmp_path):
+    strategy = _BlockingStrategy(num_parallel=2)
+    handler = FileTransferHandler(strategy, auto_transfer_files=True)
+    paths = [("a.txt", str(tmp_path / "a.txt")), ("b.txt", str(tmp_path / "b.txt"))]
+
+    handler.download_many(paths)
+
+    assert sorted(strategy.downloaded) == paths
+
+
+def test_single_transfer_runs_in_calling_thread(tmp_path):
+    strategy = _BlockingStrategy(num_parallel=1)
+    handler = FileTransferHandler(strategy, auto_transfer_files=True)
+    (tmp_path / "a.txt").write_text("a")
+
+    assert handler.upload_many([tmp_path / "a.txt"]) == [pathlib.PurePosixPath("a.txt")]
+    assert handler._executor is None
+
+
+class _RecordingClient:
+    def __init__(self) -> None:
+        self.uploaded: list[str] = []
+
+    def upload_file(self, local_filename, remote_filename):
+        self.uploaded.append(remote_filename)
+
+
+def test_large_uploads_are_compressed(tmp_path, monkeypatch):
+    """Check that only files above the threshold are uploaded with compression."""
+    # GIVEN: a strategy which compresses files of at least 10 bytes
+    strategy = RemoteFileTransferStrategy(
+        channel_getter=lambda: None,  # type: ignore
+        compression="gzip",
+        compression_threshold=10,
+    )
+    client, compressing_client = _RecordingClient(), _RecordingClient()
+    monkeypatch.setattr(strategy, "_get_clients", lambda: (client, compressing_client))
+    (tmp_path / "small.cdb").write_text("small")
+    (tmp_path / "large.cdb").write_text("large" * 10)
+
+    # WHEN: the files are uploaded
+    strategy.upload_file(tmp_path / "small.cdb")
+    strategy.upload_file(tmp_path / "large.cdb")
+
+    # THEN: only the large file is compressed
+    assert client.uploaded == ["small.cdb"]
+    assert compressing_client.uploaded == ["large.cdb"]
+
+
+def test_no_compressing_client_by_default():
+    with grpc.insecure_channel("localhost:1") as channel:
+        strategy = RemoteFileTransferStrategy(channel_getter=lambda: channel)
+        client, compressing_client = strategy._get_clients()
+        assert compressing_client is client
+
+
+def test_close_stops_transfer_threads(tmp_path):
+    """Check that closing the handler stops its transfer threads."""
+    # GIVEN: a handler which ran transfers in the background
+    strategy = _BlockingStrategy(num_parallel=2)
+    handler = FileTransferHandler(strategy, auto_transfer_files=True)
+    paths = [("a.txt", str(tmp_path / "a.txt")), ("b.txt", str(tmp_path / "b.txt"))]
+    handler.download_many(paths)
+    assert any(thread.name.startswith("acp-file-transfer") for thread in threading.enumerate())
+
+    # WHEN: the handler is closed
+    handler.close()
+
+    # THEN: the threads are stopped, and new transfers start new threads
+    assert not any(thread.name.startswith("acp-file-transfer") for thread in threading.enumerate())
+    handler.download_many(paths)
+    handler.close()
+    assert len(strategy.downloaded) == 4
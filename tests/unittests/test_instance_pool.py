@@ -0,0 +1,138 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import concurrent.futures
+import shutil
+import tempfile
+
+import pytest
+
+import ansys.acp.core as pyacp
+
+POOL_SIZE = 2
+
+
+@pytest.fixture(scope="module")
+def instance_pool(_configure_launcher):
+    with pyacp.ACPInstancePool(size=POOL_SIZE) as pool:
+        yield pool
+
+
+@pytest.fixture
+def baseline_pool(instance_pool, model_data_dir):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = shutil.copy(
+            model_data_dir / "minimal_complete_model_no_matml_link.acph5", tmp_dir
+        )
+        instance_pool.load_model(file_path)
+        yield instance_pool
+
+
+def test_invalid_size():
+    """Check that a pool size smaller than one is rejected."""
+    with pytest.raises(ValueError):
+        pyacp.ACPInstancePool(size=0)
+
+
+def test_config_size_mismatch():
+    """Check that the number of launch configurations must match the pool size."""
+    with pytest.raises(ValueError) as exc:
+        pyacp.ACPInstancePool(size=2, config=[pyacp.DirectLaunchConfig()])
+    assert "pool size" in str(exc.value)
+
+
+def test_lease_distinct_instances(instance_pool):
+    """Check that concurrent leases get distinct instances."""
+    with instance_pool.lease() as instance_1, instance_pool.lease() as instance_2:
+        assert instance_1 is not instance_2
+        assert instance_1.check()
+        assert instance_2.check()
+
+
+def test_lease_timeout(instance_pool):
+    """Check that leasing times out when all instances are in use."""
+    with instance_pool.lease(), instance_pool.lease():
+        with pytest.raises(TimeoutError):
+            with instance_pool.lease(timeout=0.1):
+                pass
+
+
+def test_lease_model_reset(baseline_pool):
+    """Check that leased models are reset to the baseline state."""
+    # GIVEN: the thickness of a fabric in the baseline model
+    with baseline_pool.lease_model() as model:
+        initial_thickness = model.fabrics["Fabric.1"].thickness
+
+    # WHEN: modifying the model during a lease, in parallel on all instances
+    def modify(_):
+        with baseline_pool.lease_model() as model:
+            model.fabrics["Fabric.1"].thickness = initial_thickness * 2
+            model.create_fabric()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=POOL_SIZE) as executor:
+        list(executor.map(modify, range(POOL_SIZE)))
+
+    # THEN: the models are reset when the lease ends
+    for _ in range(POOL_SIZE):
+        with baseline_pool.lease_model() as model:
+            assert model.fabrics["Fabric.1"].thickness == initial_thickness
+            assert len(model.fabrics) == 1
+
+
+def test_lease_model_without_baseline(_configure_launcher):
+    """Check that leasing a model without loading it first raises an error."""
+    with pyacp.ACPInstancePool(size=1) as pool:
+        with pytest.raises(RuntimeError) as exc:
+            with pool.lease_model():
+                pass
+    assert "load_model" in str(exc.value)
+
+
+def test_reload_closes_previous_models(baseline_pool, model_data_dir):
+    """Check that loading the baseline model again closes the previous models."""
+    # WHEN: loading the baseline model a second time
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = shutil.copy(
+            model_data_dir / "minimal_complete_model_no_matml_link.acph5", tmp_dir
+        )
+        baseline_pool.load_model(file_path)
+
+    # THEN: each instance only holds the new baseline model
+    for _ in range(POOL_SIZE):
+        with baseline_pool.lease() as instance:
+            assert len(instance.models) == 1
+
+
+def test_failed_reset_closes_model(baseline_pool, monkeypatch):
+    """Check that the model is closed if it is reloaded after a failed reset."""
+
+    def restore(self, checkpoint):
+        raise RuntimeError("Restore failed.")
+
+    # WHEN: the model cannot be restored at the end of a lease
+    with baseline_pool.lease_model() as model:
+        instance = model._server_wrapper.acp_instance
+        monkeypatch.setattr(pyacp.Model, "restore", restore)
+    monkeypatch.undo()
+
+    # THEN: the instance only holds the reloaded baseline model
+    assert len(instance.models) == 1
@@ -0,0 +1,230 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import pathlib
+import threading
+import time
+
+import pytest
+
+from ansys.acp.core._server import startup
+from ansys.acp.core._server.startup import (
+    BinaryProbeCache,
+    JsonCacheFile,
+    LaunchTimings,
+    wait_until_running,
+)
+from ansys.tools.common.exceptions import ProductInstanceError
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("PYACP_CACHE_DIR", str(tmp_path / "cache"))
+    return tmp_path / "cache"
+
+
+@pytest.fixture
+def binary(tmp_path):
+    binary = tmp_path / "acp_grpcserver"
+    binary.write_text("binary")
+    return binary
+
+
+def test_probe_is_cached_on_disk(cache_dir, binary):
+    """Check that the probe result is re-used by a new process."""
+    # GIVEN: a probe which was run once
+    probe_results = []
+
+    def probe():
+        probe_results.append(True)
+        return True
+
+    assert BinaryProbeCache("test_probe").get(str(binary), probe)
+
+    # WHEN: the probe result is requested from a new cache, as in a new process
+    result = BinaryProbeCache("test_probe").get(str(binary), probe)
+
+    # THEN: the probe is not run again
+    assert result
+    assert len(probe_results) == 1
+    assert (cache_dir / "test_probe.json").exists()
+
+
+def test_probe_is_rerun_if_binary_changes(cache_dir, binary):
+    cache = BinaryProbeCache("test_probe")
+    assert not cache.get(str(binary), lambda: False)
+
+    binary.write_text("updated binary")
+
+    assert cache.get(str(binary), lambda: True)
+
+
+def test_unwritable_cache_is_ignored(tmp_path, monkeypatch, binary):
+    """Check that the probe result is still cached in memory if the cache cannot be written."""
+    # GIVEN: a cache directory which is a file, and can therefore not be created
+    (tmp_path / "not_a_directory").write_text("")
+    monkeypatch.setenv("PYACP_CACHE_DIR", str(tmp_path / "not_a_directory"))
+    probe_results = []
+
+    def probe():
+        probe_results.append(True)
+        return True
+
+    # WHEN: the probe is requested twice
+    cache = BinaryProbeCache("test_probe")
+    cache.get(str(binary), probe)
+    cache.get(str(binary), probe)
+
+    # THEN: the probe runs once
+    assert len(probe_results) == 1
+
+
+def test_corrupt_cache_file_is_ignored(cache_dir, binary):
+    cache_dir.mkdir()
+    (cache_dir / "test_probe.json").write_text("{not json")
+    assert BinaryProbeCache("test_probe").get(str(binary), lambda: True)
+
+
+def test_probe_for_command_on_path_is_cached(cache_dir, tmp_path, monkeypatch):
+    """Check that a bare command name is looked up on the PATH."""
+    # GIVEN: an executable which is only reachable through the PATH
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    executable = bin_dir / "acp_grpcserver"
+    executable.write_text("binary")
+    executable.chmod(0o755)
+    monkeypatch.setenv("PATH", str(bin_dir))
+    monkeypatch.chdir(tmp_path)
+    probe_results = []
+
+    def probe():
+        probe_results.append(True)
+        return True
+
+    # WHEN: the probe is requested twice by command name
+    assert BinaryProbeCache("test_probe").get("acp_grpcserver", probe)
+    assert BinaryProbeCache("test_probe").get("acp_grpcserver", probe)
+
+    # THEN: the probe runs once
+    assert len(probe_results) == 1
+
+
+def test_probe_for_missing_binary_is_not_cached(cache_dir, tmp_path):
+    probe_results = []
+
+    def probe():
+        probe_results.append(True)
+        return False
+
+    missing_binary = str(tmp_path / "does_not_exist")
+    assert not BinaryProbeCache("test_probe").get(missing_binary, probe)
+    assert not BinaryProbeCache("test_probe").get(missing_binary, probe)
+    assert len(probe_results) == 2
+
+
+def test_locked_cache_file_reads_changes_of_other_processes(cache_dir):
+    """Check that the entries are re-read from the file when locking it."""
+    # GIVEN: a cache file which was read, and is then modified by another process
+    cache_file = JsonCacheFile("test_cache")
+    assert cache_file.load() == {}
+    other_process_file = JsonCacheFile("test_cache")
+    with other_process_file.locked() as entries:
+        entries["key"] = "value"
+        other_process_file.store()
+
+    # WHEN: the cache file is locked
+    with cache_file.locked() as entries:
+        # THEN: the modified entries are returned
+        assert entries == {"key": "value"}
+
+
+def test_locked_cache_file_excludes_other_processes(cache_dir):
+    """Check that the file lock is held until the context exits."""
+    # GIVEN: a cache file locked by another file object, as in another process
+    other_process_file = JsonCacheFile("test_cache")
+    acquired = threading.Event()
+    with other_process_file.locked():
+        thread = threading.Thread(target=lambda: _lock_and_set(acquired))
+        thread.start()
+
+        # WHEN / THEN: the lock can only be acquired once it is released
+        assert not acquired.wait(timeout=0.2)
+    assert acquired.wait(timeout=10)
+    thread.join()
+
+
+def _lock_and_set(event):
+    with JsonCacheFile("test_cache").locked():
+        event.set()
+
+
+def test_wait_until_running_polls_with_growing_interval(monkeypatch):
+    """Check that the poll interval starts small and grows."""
+    # GIVEN: a server which responds on the fifth check
+    sleep_times: list[float] = []
+    monkeypatch.setattr(time, "sleep", sleep_times.append)
+    num_checks = 0
+
+    def check(timeout):
+        nonlocal num_checks
+        num_checks += 1
+        return num_checks == 5
+
+    # WHEN: waiting for the server
+    wait_until_running(check, timeout=10.0)
+
+    # THEN: the intervals between checks grow, starting from a short interval
+    assert len(sleep_times) == 4
+    assert sleep_times[0] <= 0.01
+    assert sleep_times == sorted(sleep_times)
+    assert sleep_times[-1] > sleep_times[0]
+
+
+def test_wait_until_running_timeout():
+    with pytest.raises(ProductInstanceError) as exc:
+        wait_until_running(lambda timeout: False, timeout=0.05)
+    assert "not running after" in str(exc.value)
+
+
+def test_poll_interval_is_bounded(monkeypatch):
+    sleep_times: list[float] = []
+    monkeypatch.setattr(time, "sleep", sleep_times.append)
+    num_checks = 0
+
+    def check(timeout):
+        nonlocal num_checks
+        num_checks += 1
+        return num_checks == 50
+
+    wait_until_running(check, timeout=1000.0)
+    assert max(sleep_times) == startup._MAX_POLL_INTERVAL_S
+
+
+def test_launch_timings_total():
+    assert LaunchTimings(launch=1.0, wait=2.0).total == 3.0
+    assert LaunchTimings(launch=1.0, wait=None).total == 1.0
+
+
+def test_default_cache_dir(monkeypatch):
+    monkeypatch.delenv("PYACP_CACHE_DIR", raising=False)
+    assert startup._get_cache_dir().name == "pyacp"
+    assert isinstance(startup._get_cache_dir(), pathlib.Path)
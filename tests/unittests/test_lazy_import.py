@@ -0,0 +1,69 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+import ansys.acp.core as pyacp
+
+
+def _get_imported_modules(code: str) -> set[str]:
+    """Run the code in a new interpreter, and get the modules imported by it."""
+    script = textwrap.dedent(code) + "\nimport sys\nprint('\\n'.join(sys.modules))\n"
+    output = subprocess.check_output([sys.executable, "-c", script], text=True)
+    return set(output.splitlines())
+
+
+def test_import_does_not_load_heavy_modules():
+    """Check that importing the package defers loading its heavy dependencies."""
+    # WHEN: importing the package
+    modules = _get_imported_modules("import ansys.acp.core")
+
+    # THEN: the tree objects, the server, and networkx are not imported
+    for name in ["ansys.acp.core._tree_objects", "ansys.acp.core._server", "networkx"]:
+        assert name not in modules
+
+
+def test_attribute_access_loads_module():
+    # WHEN: accessing a tree object class
+    modules = _get_imported_modules("import ansys.acp.core; ansys.acp.core.Model")
+
+    # THEN: its module is loaded, but networkx is only imported when first used
+    assert "ansys.acp.core._tree_objects.model" in modules
+    assert "networkx" not in modules
+
+
+def test_all_attributes_are_lazily_importable():
+    lazy_names = set(pyacp._ATTRIBUTE_MODULES) | set(pyacp._LAZY_SUBMODULES)
+    assert lazy_names | {"__version__"} == set(pyacp.__all__)
+    for name in pyacp.__all__:
+        assert getattr(pyacp, name) is not None
+    assert set(pyacp.__all__) <= set(dir(pyacp))
+
+
+def test_inexistent_attribute_raises():
+    with pytest.raises(AttributeError) as exc:
+        pyacp.InexistentAttribute
+    assert "InexistentAttribute" in str(exc.value)
@@ -22,9 +22,11 @@
 
 from __future__ import annotations
 
+import io
 import os
 import pathlib
 import tempfile
+import time
 from typing import Any, TypeVar
 
 import numpy as np
@@ -316,6 +318,16 @@ def test_material_export(minimal_complete_model):
         assert os.stat(export_path).st_size > 0
 
 
+def test_export_to_stream(minimal_complete_model):
+    """Check that exports can be written to a binary file-like object."""
+    # WHEN: the materials are exported to a stream
+    stream = io.BytesIO()
+    minimal_complete_model.export_materials(stream)
+
+    # THEN: the stream contains the XML file
+    assert stream.getvalue().lstrip().startswith(b"<")
+
+
 def test_material_import(minimal_complete_model, raises_before_version):
     # GIVEN: a model, and a material XML file containing a material which is
     # not present in the model
@@ -409,3 +421,190 @@ def test_hdf5_composite_cae_export_import(
                 import_mode=import_mode,
                 projection_mode=projection_mode,
             )
+
+
+def test_save_skipped_if_unmodified(minimal_complete_model):
+    """Check that saving an unmodified model to the same file is skipped."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        save_path = pathlib.Path(tmp_dir) / "model.acph5"
+        minimal_complete_model.save(save_path)
+        mtime_initial = os.stat(save_path).st_mtime_ns
+
+        # WHEN: saving the unmodified model again
+        minimal_complete_model.save(save_path)
+        # THEN: the file is not rewritten
+        assert os.stat(save_path).st_mtime_ns == mtime_initial
+
+        # WHEN: saving with 'force=True'
+        minimal_complete_model.save(save_path, force=True)
+        # THEN: the file is rewritten
+        mtime_forced = os.stat(save_path).st_mtime_ns
+        assert mtime_forced != mtime_initial
+
+        # WHEN: saving after a modification
+        minimal_complete_model.create_fabric()
+        minimal_complete_model.save(save_path)
+        # THEN: the file is rewritten
+        assert os.stat(save_path).st_mtime_ns != mtime_forced
+
+
+def test_update_skipped_if_unmodified(minimal_complete_model):
+    """Check that the modification tracker records model updates."""
+    tracker = minimal_complete_model._server_wrapper.modification_tracker
+    resource_path = minimal_complete_model._resource_path.value
+
+    minimal_complete_model.update()
+    assert tracker.is_up_to_date(resource_path, "update")
+    assert tracker.is_up_to_date(resource_path, "update_relations_only")
+
+    minimal_complete_model.modeling_groups["ModelingGroup.1"].name = "New name"
+    assert not tracker.is_up_to_date(resource_path, "update")
+
+    minimal_complete_model.update(relations_only=True)
+    assert tracker.is_up_to_date(resource_path, "update_relations_only")
+    assert not tracker.is_up_to_date(resource_path, "update")
+
+
+def test_update_async(minimal_complete_model):
+    """Check that the model can be updated without blocking."""
+    minimal_complete_model.modeling_groups["ModelingGroup.1"].name = "New name"
+    progress = []
+    future = minimal_complete_model.update_async(
+        progress_callback=lambda num_uptodate, total: progress.append((num_uptodate, total)),
+        poll_interval=0.01,
+    )
+    assert future.result(timeout=60) is None
+    assert minimal_complete_model._server_wrapper.modification_tracker.is_up_to_date(
+        minimal_complete_model._resource_path.value, "update"
+    )
+    # The final progress is reported after the update has completed.
+    deadline = time.monotonic() + 10
+    while not any(num_uptodate == total for num_uptodate, total in progress):
+        assert time.monotonic() < deadline, f"No final progress reported: {progress}"
+        time.sleep(0.01)
+
+
+def test_update_async_skipped_if_unmodified(minimal_complete_model):
+    """Check that an unmodified model returns a completed future."""
+    minimal_complete_model.update()
+    future = minimal_complete_model.update_async()
+    assert future.done()
+    assert future.result() is None
+
+
+def test_export_bundle(minimal_complete_model):
+    """Check that 'export_bundle' creates all files, and reports them in the manifest."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        exports = {
+            pathlib.Path(tmp_dir) / "model.acph5": minimal_complete_model.save,
+            pathlib.Path(tmp_dir)
+            / "analysis_model.cdb": (minimal_complete_model.export_analysis_model),
+            pathlib.Path(tmp_dir) / "materials.xml": minimal_complete_model.export_materials,
+        }
+        manifest = minimal_complete_model.export_bundle(exports)
+
+        assert [entry.path for entry in manifest.entries] == list(exports)
+        for entry in manifest.entries:
+            assert entry.path.exists()
+            assert entry.size == os.stat(entry.path).st_size > 0
+            assert entry.export_time >= 0
+            assert entry.download_time >= 0
+        assert manifest.total_time >= sum(entry.export_time for entry in manifest.entries)
+
+
+def test_export_bundle_records_save(minimal_complete_model):
+    """Check that a save within 'export_bundle' is recorded once the file is downloaded."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # GIVEN: a model saved as part of an export bundle
+        save_path = pathlib.Path(tmp_dir) / "model.acph5"
+        minimal_complete_model.export_bundle({save_path: minimal_complete_model.save})
+        mtime_bundle = os.stat(save_path).st_mtime_ns
+
+        # WHEN: saving the unmodified model again
+        minimal_complete_model.save(save_path)
+
+        # THEN: the save is skipped
+        assert os.stat(save_path).st_mtime_ns == mtime_bundle
+
+
+def test_export_bundle_failure_awaits_downloads(minimal_complete_model, monkeypatch):
+    """Check that downloads submitted before a failing export are completed or cancelled."""
+    # GIVEN: an export bundle whose second export fails
+    filetransfer_handler = minimal_complete_model._server_wrapper.filetransfer_handler
+    submit_transfer = filetransfer_handler.submit_transfer
+    futures = []
+
+    def recording_submit_transfer(*args):
+        futures.append(submit_transfer(*args))
+        return futures[-1]
+
+    monkeypatch.setattr(filetransfer_handler, "submit_transfer", recording_submit_transfer)
+
+    def failing_export(path):
+        raise RuntimeError("Export failed.")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # WHEN: the bundle is exported
+        with pytest.raises(RuntimeError, match="Export failed."):
+            minimal_complete_model.export_bundle(
+                {
+                    pathlib.Path(tmp_dir) / "model.acph5": minimal_complete_model.save,
+                    pathlib.Path(tmp_dir) / "materials.xml": failing_export,
+                }
+            )
+
+        # THEN: no download is still running when the error is raised
+        assert len(futures) == 1
+        assert all(future.done() for future in futures)
+
+
+def test_export_bundle_duplicate_file_names(acp_instance, minimal_complete_model):
+    """Check that exports with the same file name are rejected for remote servers."""
+    if not acp_instance.is_remote:
+        pytest.skip("File names only need to be unique for remote servers.")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with pytest.raises(ValueError):
+            minimal_complete_model.export_bundle(
+                {
+                    pathlib.Path(tmp_dir) / "a" / "model.acph5": minimal_complete_model.save,
+                    pathlib.Path(tmp_dir) / "b" / "model.acph5": minimal_complete_model.save,
+                }
+            )
+
+
+def test_checkpoint_restore(minimal_complete_model):
+    """Check that restoring a checkpoint reverts modifications, additions, and deletions."""
+    # GIVEN: a checkpoint of the model
+    model = minimal_complete_model
+    fabric = model.fabrics["Fabric.1"]
+    initial_thickness = fabric.thickness
+    modeling_group = model.modeling_groups["ModelingGroup.1"]
+    modeling_ply_name = modeling_group.modeling_plies["ModelingPly.1"].name
+    checkpoint = model.checkpoint()
+    assert len(checkpoint) > 0
+
+    # WHEN: modifying, adding, and deleting objects, then restoring the checkpoint
+    fabric.thickness = initial_thickness * 2
+    new_fabric = model.create_fabric(name="New Fabric")
+    modeling_group.modeling_plies["ModelingPly.1"].delete()
+    model.restore(checkpoint)
+
+    # THEN: the model is in the state of the checkpoint
+    assert fabric.thickness == initial_thickness
+    assert new_fabric.id not in model.fabrics
+    modeling_plies = list(modeling_group.modeling_plies.values())
+    assert [ply.name for ply in modeling_plies] == [modeling_ply_name]
+    assert modeling_plies[0].ply_material == fabric
+
+
+def test_restore_unmodified(minimal_complete_model):
+    """Check that restoring a checkpoint of an unmodified model does not modify it."""
+    model = minimal_complete_model
+    checkpoint = model.checkpoint()
+    tracker = model._server_wrapper.modification_tracker
+    generation = tracker.generation(model._resource_path.value)
+
+    model.restore(checkpoint)
+
+    assert tracker.generation(model._resource_path.value) == generation
+    assert model.checkpoint() == checkpoint
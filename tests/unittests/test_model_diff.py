@@ -0,0 +1,96 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import pytest
+
+import ansys.acp.core as pyacp
+
+
+@pytest.fixture
+def model(load_model_from_tempfile):
+    with load_model_from_tempfile() as model:
+        yield model
+
+
+def test_diff_identical(model):
+    """Check that comparing a model with itself yields an empty diff."""
+    # WHEN: comparing the model with itself
+    model_diff = pyacp.diff(model, model)
+
+    # THEN: no differences are reported
+    assert not model_diff
+    assert model_diff.added == ()
+    assert model_diff.removed == ()
+    assert model_diff.changed == ()
+
+
+def test_diff_changed_property(model):
+    """Check that a modified property is reported with field-level detail."""
+    # GIVEN: a checkpoint of the model
+    checkpoint = model.checkpoint()
+    fabric = model.fabrics["Fabric.1"]
+    initial_thickness = fabric.thickness
+
+    # WHEN: modifying the thickness of a fabric
+    fabric.thickness = initial_thickness * 2
+    model_diff = pyacp.diff(checkpoint, model)
+
+    # THEN: only the fabric is reported as changed
+    assert model_diff.added == ()
+    assert model_diff.removed == ()
+    assert [object_change.path for object_change in model_diff.changed] == ["fabrics/Fabric.1"]
+    assert model_diff.changed[0].field_changes == (
+        pyacp.FieldChange(
+            field="properties.thickness",
+            old_value=initial_thickness,
+            new_value=initial_thickness * 2,
+        ),
+    )
+
+
+def test_diff_added_removed(model):
+    """Check that added and removed objects are reported, including their children."""
+    # GIVEN: a checkpoint of the model
+    checkpoint = model.checkpoint()
+
+    # WHEN: adding a fabric and a modeling group with a ply
+    fabric = model.create_fabric()
+    modeling_group = model.create_modeling_group()
+    modeling_ply = modeling_group.create_modeling_ply()
+
+    # THEN: the new objects are reported as added in one direction, and
+    # removed in the other direction
+    relative_paths = tuple(
+        sorted(
+            obj._resource_path.value[len(model._resource_path.value) + 1 :]
+            for obj in (fabric, modeling_group, modeling_ply)
+        )
+    )
+    model_diff = pyacp.diff(checkpoint, model)
+    assert model_diff.added == relative_paths
+    assert model_diff.removed == ()
+    assert model_diff.changed == ()
+
+    reverse_diff = pyacp.diff(model, checkpoint)
+    assert reverse_diff.added == ()
+    assert reverse_diff.removed == relative_paths
+    assert reverse_diff.changed == ()
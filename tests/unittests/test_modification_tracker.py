@@ -0,0 +1,60 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from ansys.acp.core._utils.modification_tracker import ModificationTracker
+
+MODEL_PATH = "models/a1b2c3"
+
+
+def test_operation_state_must_match():
+    # GIVEN: an operation recorded with a state
+    tracker = ModificationTracker()
+    tracker.record_operation(MODEL_PATH, ("save",), start_generation=0, state=1)
+
+    # THEN: it is only up to date for the recorded state
+    assert tracker.is_up_to_date(MODEL_PATH, "save", state=1)
+    assert not tracker.is_up_to_date(MODEL_PATH, "save", state=2)
+    assert not tracker.is_up_to_date(MODEL_PATH, "save")
+
+
+def test_recording_new_state_replaces_entry():
+    """Check that repeatedly run operations do not accumulate entries."""
+    tracker = ModificationTracker()
+    for state in range(10):
+        tracker.mark_modified(MODEL_PATH + "/fabrics/Fabric.1")
+        start_generation = tracker.generation(MODEL_PATH)
+        tracker.record_operation(
+            MODEL_PATH, ("save",), start_generation=start_generation, state=state
+        )
+
+    assert len(tracker._operation_generations) == 1
+    assert tracker.is_up_to_date(MODEL_PATH, "save", state=9)
+
+
+def test_modification_invalidates_operation():
+    tracker = ModificationTracker()
+    tracker.record_operation(MODEL_PATH, ("update",), start_generation=0)
+    assert tracker.is_up_to_date(MODEL_PATH, "update")
+
+    tracker.mark_modified(MODEL_PATH + "/fabrics/Fabric.1")
+
+    assert not tracker.is_up_to_date(MODEL_PATH, "update")
@@ -0,0 +1,136 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import functools
+import shutil
+from typing import Any
+
+import numpy as np
+import pytest
+
+import ansys.acp.core as pyacp
+from ansys.acp.core._parameter_sweep import _expand_grid, _parameter_key
+
+THICKNESS = "fabrics/Fabric.1/thickness"
+AREA_PRICE = "fabrics/Fabric.1/area_price"
+
+
+def test_expand_grid_mapping():
+    """Check that a mapping grid is expanded to all combinations."""
+    grid: dict[str, list[Any]] = {"a": [1, 2], "b": ["x", "y", "z"]}
+    points = _expand_grid(grid)
+    assert len(points) == 6
+    assert points[0] == {"a": 1, "b": "x"}
+    assert points[-1] == {"a": 2, "b": "z"}
+
+
+def test_expand_grid_sequence():
+    """Check that an explicit sequence of points is kept as-is."""
+    points = [{"a": 1, "b": 2}, {"a": 3, "b": 4}]
+    assert _expand_grid(points) == points
+
+
+def test_parameter_key():
+    """Check that equal parameters produce the same key, independent of order and type."""
+    assert _parameter_key({"a": 1.0, "b": [1, 2]}) == _parameter_key(
+        {"b": np.array([1, 2]), "a": np.float64(1.0)}
+    )
+    assert _parameter_key({"a": 1.0}) != _parameter_key({"a": 2.0})
+
+
+def test_apply_property_parameters(load_model_from_tempfile):
+    """Check that properties are set from parameter names."""
+    with load_model_from_tempfile() as model:
+        pyacp.apply_property_parameters(model, {THICKNESS: 0.3, AREA_PRICE: 2.0})
+        fabric = model.fabrics["Fabric.1"]
+        assert fabric.thickness == 0.3
+        assert fabric.area_price == 2.0
+
+
+def test_apply_property_parameters_invalid_path(load_model_from_tempfile):
+    """Check that an error is raised for an inexistent object."""
+    with load_model_from_tempfile() as model:
+        with pytest.raises(ValueError):
+            pyacp.apply_property_parameters(model, {"inexistent/Object.1/thickness": 1.0})
+
+
+@pytest.fixture
+def model_factory(model_data_dir, tmp_path):
+    file_path = shutil.copy(model_data_dir / "minimal_complete_model_no_matml_link.acph5", tmp_path)
+    return functools.partial(pyacp.ACPInstance.import_model, path=file_path)
+
+
+@pytest.fixture(scope="module")
+def instance_pool(_configure_launcher):
+    with pyacp.ACPInstancePool(size=2) as pool:
+        yield pool
+
+
+def test_sweep(model_factory, instance_pool):
+    """Check that a sweep evaluates all points in the grid, in order."""
+    result = pyacp.sweep(
+        model_factory,
+        {THICKNESS: [0.1, 0.2], AREA_PRICE: [1.0, 2.0, 3.0]},
+        lambda model: model.fabrics["Fabric.1"].thickness * model.fabrics["Fabric.1"].area_price,
+        instances=instance_pool,
+    )
+    assert len(result) == 6
+    assert result.parameter_names == (THICKNESS, AREA_PRICE)
+    np.testing.assert_allclose(
+        result.results_array(),
+        result.parameter_values[:, 0] * result.parameter_values[:, 1],
+    )
+
+
+def test_sweep_cache(model_factory, instance_pool):
+    """Check that repeated points are served from the cache."""
+    evaluated = []
+
+    def evaluate(model):
+        evaluated.append(model.fabrics["Fabric.1"].thickness)
+        return model.fabrics["Fabric.1"].thickness
+
+    with pyacp.ParameterSweep(
+        model_factory, evaluate, instances=instance_pool, update=False
+    ) as parameter_sweep:
+        assert parameter_sweep.evaluate({THICKNESS: 0.1}) == pytest.approx(0.1)
+        assert parameter_sweep.evaluate({THICKNESS: 0.1}) == pytest.approx(0.1)
+        result = parameter_sweep.run([{THICKNESS: 0.1}, {THICKNESS: 0.2}, {THICKNESS: 0.2}])
+
+    np.testing.assert_allclose(result.results_array(), [0.1, 0.2, 0.2])
+    assert sorted(evaluated) == pytest.approx([0.1, 0.2])
+    assert parameter_sweep.cache_hits == 2
+    assert parameter_sweep.cache_size == 2
+
+
+def test_sweep_resets_model(model_factory, instance_pool):
+    """Check that each design point starts from the baseline model."""
+    with pyacp.ParameterSweep(
+        model_factory,
+        lambda model: model.fabrics["Fabric.1"].area_price,
+        instances=instance_pool,
+        update=False,
+    ) as parameter_sweep:
+        baseline_area_price = parameter_sweep.evaluate({})
+        parameter_sweep.evaluate({AREA_PRICE: baseline_area_price + 1})
+        parameter_sweep.clear_cache()
+        assert parameter_sweep.evaluate({}) == baseline_area_price
@@ -0,0 +1,126 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import concurrent.futures
+import multiprocessing
+import pickle
+
+import pytest
+
+import ansys.acp.core as pyacp
+from ansys.api.acp.v0 import fabric_pb2
+
+requires_fork = pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(),
+    reason="The 'fork' start method is not available on this platform.",
+)
+
+
+@pytest.fixture
+def model(load_model_from_tempfile):
+    with load_model_from_tempfile() as model:
+        yield model
+
+
+def test_pickle_unstored_object():
+    """Check that unstored objects are pickled with their data."""
+    fabric = pyacp.Fabric(name="Fabric", thickness=0.3)
+    unpickled = pickle.loads(pickle.dumps(fabric))
+    assert isinstance(unpickled, pyacp.Fabric)
+    assert unpickled is not fabric
+    assert unpickled.name == "Fabric"
+    assert unpickled.thickness == 0.3
+
+
+def test_pickle_acp_instance(acp_instance):
+    """Check that an unpickled ACP instance connects to the same server."""
+    unpickled = pickle.loads(pickle.dumps(acp_instance))
+    assert unpickled.server_version == acp_instance.server_version
+    assert unpickled.is_remote == acp_instance.is_remote
+    # Unpickling again re-uses the connection of this process.
+    assert pickle.loads(pickle.dumps(acp_instance)) is unpickled
+
+
+def test_pickle_stored_object(model):
+    """Check that stored objects are pickled as handles to the server object."""
+    fabric = model.fabrics["Fabric.1"]
+    data = pickle.dumps(fabric)
+    # The handle does not contain the object data.
+    fabric.name = "Renamed fabric"
+
+    unpickled = pickle.loads(data)
+    assert isinstance(unpickled, pyacp.Fabric)
+    assert unpickled._resource_path.value == fabric._resource_path.value
+    assert unpickled.name == "Renamed fabric"
+
+
+def _get_names(fabrics):
+    return [fabric.name for fabric in fabrics]
+
+
+def test_process_pool(model):
+    """Check that stored objects can be sent to worker processes."""
+    fabrics = list(model.fabrics.values())
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=2, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        names = executor.submit(_get_names, fabrics).result()
+    assert names == [fabric.name for fabric in fabrics]
+
+
+@requires_fork
+def test_process_pool_fork(model):
+    """Check that objects unpickled in forked workers use the worker's connection."""
+    fabrics = list(model.fabrics.values())
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=2, mp_context=multiprocessing.get_context("fork")
+    ) as executor:
+        names = executor.submit(_get_names, fabrics).result()
+    assert names == [fabric.name for fabric in fabrics]
+
+
+def _get_fabric_cache():
+    return pyacp.Fabric._OBJECT_CACHE  # type: ignore[misc]
+
+
+def _get_cached_fabric_count():
+    return len(_get_fabric_cache())
+
+
+@requires_fork
+def test_object_cache_cleared_after_fork():
+    """Check that forked processes do not inherit the cached objects of the parent."""
+    # GIVEN: a cached object in the parent process
+    object_info = fabric_pb2.ObjectInfo()
+    object_info.info.resource_path.value = "models/0/fabrics/Fabric.1"
+    fabric = pyacp.Fabric._from_object_info(object_info)
+    assert len(_get_fabric_cache()) > 0
+
+    # WHEN: checking the cache in a forked process
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("fork")
+    ) as executor:
+        count = executor.submit(_get_cached_fabric_count).result()
+
+    # THEN: the cache is empty
+    assert count == 0
+    assert _get_fabric_cache()[object_info.info.resource_path.value] is fabric
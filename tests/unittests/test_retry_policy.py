@@ -0,0 +1,248 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import dataclasses
+import json
+import time
+
+import grpc
+import pytest
+
+import ansys.acp.core as pyacp
+from ansys.acp.core._server import transport
+from ansys.acp.core._server.direct import DirectLauncher
+from ansys.acp.core._server.transport import _RetryInterceptor
+
+GET_METHOD = "/ansys.api.acp.v0.fabric.ObjectService/Get"
+PUT_METHOD = "/ansys.api.acp.v0.fabric.ObjectService/Put"
+
+
+class _Outcome:
+    def __init__(self, code, done=True):
+        self._code = code
+        self._done = done
+
+    def code(self):
+        return self._code
+
+    def done(self):
+        return self._done
+
+
+class _RpcError(grpc.RpcError, grpc.Call):  # type: ignore[misc]
+    def __init__(self, code):
+        self._code = code
+
+    def code(self):
+        return self._code
+
+    def details(self):
+        return ""
+
+    def initial_metadata(self):
+        return None
+
+    def trailing_metadata(self):
+        return None
+
+    def is_active(self):
+        return False
+
+    def time_remaining(self):
+        return None
+
+    def cancel(self):
+        return False
+
+    def add_callback(self, callback):
+        return False
+
+
+def _call_details(method, timeout=None):
+    return transport._ClientCallDetails(
+        method=method,
+        timeout=timeout,
+        metadata=None,
+        credentials=None,
+        wait_for_ready=None,
+        compression=None,
+    )
+
+
+@pytest.fixture(autouse=True)
+def no_wait(monkeypatch):
+    monkeypatch.setattr(time, "sleep", lambda delay: None)
+
+
+def _continuation(codes):
+    """Create a continuation which returns outcomes with the given status codes."""
+    received_details = []
+    outcomes = iter(codes)
+
+    def continuation(details, request):
+        received_details.append(details)
+        return _Outcome(next(outcomes))
+
+    return continuation, received_details
+
+
+def test_idempotent_call_is_retried():
+    """Check that idempotent calls are retried until they succeed."""
+    # GIVEN: a call which fails twice with a retryable status
+    interceptor = _RetryInterceptor(
+        pyacp.RetryPolicy(retryable_status_codes=("UNAVAILABLE", "DEADLINE_EXCEEDED"))
+    )
+    continuation, received_details = _continuation(
+        [grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.DEADLINE_EXCEEDED, grpc.StatusCode.OK]
+    )
+
+    # WHEN: the call is made
+    outcome = interceptor.intercept_unary_unary(continuation, _call_details(GET_METHOD), None)
+
+    # THEN: the successful outcome is returned after three attempts
+    assert outcome.code() == grpc.StatusCode.OK
+    assert len(received_details) == 3
+
+
+def test_retries_are_limited():
+    interceptor = _RetryInterceptor(pyacp.RetryPolicy(max_attempts=2))
+    continuation, received_details = _continuation([grpc.StatusCode.UNAVAILABLE] * 3)
+    outcome = interceptor.intercept_unary_unary(continuation, _call_details(GET_METHOD), None)
+    assert outcome.code() == grpc.StatusCode.UNAVAILABLE
+    assert len(received_details) == 2
+
+
+@pytest.mark.parametrize(
+    "method, code",
+    [(PUT_METHOD, grpc.StatusCode.UNAVAILABLE), (GET_METHOD, grpc.StatusCode.NOT_FOUND)],
+)
+def test_call_is_not_retried(method, code):
+    """Check that non-idempotent calls and non-retryable errors are not retried."""
+    interceptor = _RetryInterceptor(pyacp.RetryPolicy())
+    continuation, received_details = _continuation([code, grpc.StatusCode.OK])
+    outcome = interceptor.intercept_unary_unary(continuation, _call_details(method), None)
+    assert outcome.code() == code
+    assert len(received_details) == 1
+
+
+def test_future_call_is_not_retried():
+    """Check that calls which have not completed are returned immediately."""
+    interceptor = _RetryInterceptor(pyacp.RetryPolicy())
+    pending = _Outcome(None, done=False)
+    outcome = interceptor.intercept_unary_unary(
+        lambda details, request: pending, _call_details(GET_METHOD), None
+    )
+    assert outcome is pending
+
+
+def test_no_deadline_by_default():
+    """Check that calls wait indefinitely, and are not retried after a timeout by default."""
+    interceptor = _RetryInterceptor(pyacp.RetryPolicy())
+    continuation, received_details = _continuation(
+        [grpc.StatusCode.DEADLINE_EXCEEDED, grpc.StatusCode.OK]
+    )
+
+    outcome = interceptor.intercept_unary_unary(continuation, _call_details(GET_METHOD), None)
+
+    assert outcome.code() == grpc.StatusCode.DEADLINE_EXCEEDED
+    assert [details.timeout for details in received_details] == [None]
+
+
+def test_default_deadline():
+    """Check that the default deadline is set, unless the call sets a timeout."""
+    interceptor = _RetryInterceptor(pyacp.RetryPolicy(deadlines_s={"Get": 12.0}))
+    continuation, received_details = _continuation([grpc.StatusCode.OK] * 3)
+
+    interceptor.intercept_unary_unary(continuation, _call_details(GET_METHOD), None)
+    interceptor.intercept_unary_unary(continuation, _call_details(GET_METHOD, timeout=3.0), None)
+    interceptor.intercept_unary_unary(continuation, _call_details(PUT_METHOD), None)
+
+    assert [details.timeout for details in received_details] == [12.0, 3.0, None]
+
+
+def test_backoff_is_bounded():
+    policy = pyacp.RetryPolicy(initial_backoff_s=1.0, max_backoff_s=3.0, backoff_multiplier=2.0)
+    for attempt in range(1, 10):
+        assert 0 <= policy.backoff_s(attempt) <= min(3.0, 2.0 ** (attempt - 1))
+
+
+def test_invalid_status_code():
+    with pytest.raises(ValueError) as exc:
+        pyacp.RetryPolicy(retryable_status_codes=("NOT_A_CODE",))
+    assert "NOT_A_CODE" in str(exc.value)
+
+
+@pytest.mark.parametrize("applied", [True, False])
+def test_call_unless_applied(applied):
+    """Check that a modifying call is only repeated if it was not applied."""
+    # GIVEN: a call which fails once with a retryable status
+    policy = pyacp.RetryPolicy()
+    results = iter([_RpcError(grpc.StatusCode.UNAVAILABLE), "repeated"])
+
+    def call():
+        result = next(results)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    # WHEN: the call is made
+    result = policy.call_unless_applied("Put", call, lambda: "from server" if applied else None)
+
+    # THEN: the call is repeated only if the server state shows it was not applied
+    assert result == ("from server" if applied else "repeated")
+
+
+def test_call_unless_applied_non_retryable_error():
+    policy = pyacp.RetryPolicy()
+
+    def call():
+        raise _RpcError(grpc.StatusCode.INVALID_ARGUMENT)
+
+    def get_applied_result():
+        raise AssertionError("The server state should not be checked.")
+
+    with pytest.raises(grpc.RpcError):
+        policy.call_unless_applied("Put", call, get_applied_result)
+
+
+def test_retry_policy_stored_in_launcher_configuration():
+    """Check that the retry policy survives the JSON round-trip of the launcher configuration."""
+    # GIVEN: a launch configuration with a retry policy
+    profile = pyacp.TransportProfile(
+        retry_policy=pyacp.RetryPolicy(max_attempts=8, retryable_status_codes=("UNAVAILABLE",))
+    )
+    config = pyacp.DirectLaunchConfig(transport_profile=profile)
+
+    # WHEN: the configuration is stored and loaded as JSON
+    loaded_config = pyacp.DirectLaunchConfig(**json.loads(json.dumps(dataclasses.asdict(config))))
+
+    # THEN: the launcher uses the same retry policy
+    loaded_profile = DirectLauncher(config=loaded_config).transport_profile
+    assert loaded_profile == profile
+    assert isinstance(loaded_profile.retry_policy, pyacp.RetryPolicy)
+
+
+def test_retries_can_be_disabled():
+    profile = pyacp.TransportProfile(retry_policy=None)
+    with grpc.insecure_channel("localhost:1") as channel:
+        assert profile.retry_policy is None
+        assert isinstance(pyacp.RetryPolicy().intercept_channel(channel), grpc.Channel)
@@ -0,0 +1,125 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from packaging.version import parse as parse_version
+import pytest
+
+import ansys.acp.core as pyacp
+from ansys.acp.core._server.acp_instance import (
+    ACPInstance,
+    FileTransferHandler,
+    LocalFileTransferStrategy,
+)
+from ansys.acp.core._server.common import ServerKey
+from ansys.acp.core._tree_objects._grpc_helpers.supported_since import ServerCapabilities
+from ansys.acp.core._tree_objects.base import ServerWrapper
+from ansys.api.acp.v0 import control_pb2_grpc
+
+
+class _FakeServer:
+    def __init__(self):
+        self.channels = {ServerKey.MAIN: object()}
+
+    def restart(self, stop_timeout=None):
+        self.channels = {ServerKey.MAIN: object()}
+
+
+class _CountingControlStub:
+    num_calls = 0
+    version = "25.2"
+
+    def __init__(self, channel):
+        pass
+
+    def GetServerInfo(self, request):
+        type(self).num_calls += 1
+        return type("ServerInfo", (), {"version": self.version})()
+
+
+@pytest.fixture
+def fake_instance(monkeypatch, tmp_path):
+    _CountingControlStub.num_calls = 0
+    monkeypatch.setattr(control_pb2_grpc, "ControlStub", _CountingControlStub)
+    return ACPInstance(
+        server=_FakeServer(),
+        filetransfer_handler=FileTransferHandler(
+            LocalFileTransferStrategy(working_directory=tmp_path), auto_transfer_files=True
+        ),
+        is_remote=False,
+    )
+
+
+def test_server_version_is_cached(fake_instance):
+    """Check that the server version is requested once per connection."""
+    assert fake_instance.server_version == "25.2"
+    assert fake_instance.server_version == "25.2"
+    assert _CountingControlStub.num_calls == 1
+
+
+def test_server_version_refreshed_on_restart(fake_instance):
+    """Check that restarting the instance discards the cached server information."""
+    # GIVEN: an instance whose server version and wrapper are cached
+    server_wrapper = ServerWrapper.from_acp_instance(fake_instance)
+
+    # WHEN: the instance is restarted
+    fake_instance.restart()
+
+    # THEN: the server information is requested again
+    assert fake_instance.server_version == "25.2"
+    assert _CountingControlStub.num_calls == 2
+    assert ServerWrapper.from_acp_instance(fake_instance) is not server_wrapper
+
+
+def test_server_wrapper_is_reused(fake_instance):
+    """Check that the server wrapper is created once per connection."""
+    server_wrapper = ServerWrapper.from_acp_instance(fake_instance)
+    assert ServerWrapper.from_acp_instance(fake_instance) is server_wrapper
+    assert server_wrapper.capabilities is server_wrapper.capabilities
+    assert server_wrapper.version == parse_version("25.2")
+
+
+@pytest.mark.parametrize(
+    "server_version,required_version,expected",
+    [
+        ("25.2", "25.1", True),
+        ("25.2", "25.2", True),
+        ("25.1", "25.2", False),
+        ("25.1", None, True),
+    ],
+)
+def test_supports(server_version, required_version, expected):
+    capabilities = ServerCapabilities(parse_version(server_version))
+    assert capabilities.supports(required_version) is expected
+    # The result is memoized.
+    assert capabilities.supports(required_version) is expected
+
+
+def test_object_types():
+    """Check that the supported object types are determined from the server version."""
+    old_capabilities = ServerCapabilities(parse_version("24.2"))
+    new_capabilities = ServerCapabilities(parse_version("99.0"))
+
+    assert pyacp.Fabric in old_capabilities.object_types
+    assert old_capabilities.supports_object_type(pyacp.Fabric)
+    assert pyacp.SolidModel._SUPPORTED_SINCE == "25.1"
+    assert not old_capabilities.supports_object_type(pyacp.SolidModel)
+    assert new_capabilities.supports_object_type(pyacp.SolidModel)
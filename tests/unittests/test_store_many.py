@@ -0,0 +1,82 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import pytest
+
+from ansys.acp.core import Fabric, store_many
+
+
+@pytest.fixture
+def minimal_complete_model(load_model_from_tempfile):
+    with load_model_from_tempfile() as model:
+        yield model
+
+
+@pytest.mark.parametrize("max_in_flight", [1, 3, 64])
+def test_store_many(minimal_complete_model, max_in_flight):
+    """Test that store_many stores all objects, in the input order."""
+    # GIVEN: Unstored fabrics
+    material = minimal_complete_model.materials["Structural Steel"]
+    fabrics = [Fabric(name=f"BulkFabric.{i}", material=material) for i in range(10)]
+
+    # WHEN: Storing them with store_many
+    result = store_many(fabrics, parent=minimal_complete_model, max_in_flight=max_in_flight)
+
+    # THEN: The objects are stored, and returned in the input order
+    assert result == fabrics
+    for i, fabric in enumerate(result):
+        assert fabric._is_stored
+        assert fabric.name == f"BulkFabric.{i}"
+        assert fabric.material == material
+        assert minimal_complete_model.fabrics[fabric.id] is fabric
+
+
+def test_store_many_validates_before_creating(minimal_complete_model, load_model_from_tempfile):
+    """Test that no object is created if one of the objects is invalid."""
+    # GIVEN: A list of fabrics, one of which links to a material in another model
+    with load_model_from_tempfile() as other_model:
+        fabrics = [
+            Fabric(name="BulkFabric.1"),
+            Fabric(name="BulkFabric.2", material=other_model.materials["Structural Steel"]),
+        ]
+        num_fabrics = len(minimal_complete_model.fabrics)
+
+        # WHEN: Storing them with store_many
+        # THEN: An error is raised, and no object is created
+        with pytest.raises(ValueError):
+            store_many(fabrics, parent=minimal_complete_model)
+        assert len(minimal_complete_model.fabrics) == num_fabrics
+        assert not any(fabric._is_stored for fabric in fabrics)
+
+
+def test_store_many_rejects_duplicates(minimal_complete_model):
+    """Test that the same object cannot be passed twice."""
+    fabric = Fabric()
+    with pytest.raises(ValueError):
+        store_many([fabric, fabric], parent=minimal_complete_model)
+    assert not fabric._is_stored
+
+
+def test_store_many_invalid_max_in_flight(minimal_complete_model):
+    """Test that at least one request must be allowed in flight."""
+    with pytest.raises(ValueError):
+        store_many([Fabric()], parent=minimal_complete_model, max_in_flight=0)
@@ -0,0 +1,148 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import hashlib
+import io
+import pathlib
+import tempfile
+
+from packaging.version import parse as parse_version
+import pytest
+
+from ansys.acp.core._server.acp_instance import (
+    FileTransferHandler,
+    LocalFileTransferStrategy,
+    RemoteFileTransferStrategy,
+)
+from ansys.acp.core._tree_objects.base import ServerWrapper
+from ansys.api.tools.filetransfer.v1 import (
+    file_transfer_service_pb2,
+    file_transfer_service_pb2_grpc,
+)
+
+
+def _server_wrapper(filetransfer_handler):
+    return ServerWrapper(
+        channel=None,  # type: ignore
+        version=parse_version("25.2"),
+        filetransfer_handler=filetransfer_handler,
+    )
+
+
+@pytest.mark.parametrize("auto_transfer_files", [True, False])
+def test_local_export_to_stream(tmp_path, monkeypatch, auto_transfer_files):
+    """Check that an export to a stream leaves no file behind."""
+    # GIVEN: a server sharing the client's file system
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(tempfile, "gettempdir", lambda: str(tmp_path))
+    server_wrapper = _server_wrapper(
+        FileTransferHandler(
+            LocalFileTransferStrategy(tmp_path), auto_transfer_files=auto_transfer_files
+        )
+    )
+    stream = io.BytesIO()
+
+    # WHEN: the server writes the export file
+    with server_wrapper.auto_download(stream, suffix=".cdb") as export_path:
+        assert export_path.endswith(".cdb")
+        (tmp_path / export_path).write_bytes(b"exported content")
+
+    # THEN: the content is written to the stream, and the file is removed
+    assert stream.getvalue() == b"exported content"
+    assert list(tmp_path.iterdir()) == []
+
+
+def _download_responses(data, chunk_size=4):
+    yield file_transfer_service_pb2.DownloadFileResponse(
+        file_info=file_transfer_service_pb2.FileInfo(
+            sha1=file_transfer_service_pb2.SHA1(hex_digest=hashlib.sha1(data).hexdigest())
+        )
+    )
+    for offset in range(0, len(data), chunk_size):
+        yield file_transfer_service_pb2.DownloadFileResponse(
+            file_data=file_transfer_service_pb2.FileChunk(
+                offset=offset, data=data[offset : offset + chunk_size]
+            )
+        )
+
+
+class _FakeFileTransferStub:
+    responses: list[file_transfer_service_pb2.DownloadFileResponse] = []
+
+    def __init__(self, channel):
+        pass
+
+    def DownloadFile(self, requests):
+        requests = list(requests)
+        assert requests[0].initialize.filename == "export.cdb"
+        return iter(self.responses)
+
+
+def test_remote_download_to_stream(monkeypatch):
+    """Check that downloaded chunks are written to the stream."""
+    monkeypatch.setattr(
+        file_transfer_service_pb2_grpc,
+        "FileTransferServiceStub",
+        _FakeFileTransferStub,
+    )
+    monkeypatch.setattr(
+        _FakeFileTransferStub, "responses", list(_download_responses(b"remote file content"))
+    )
+    strategy = RemoteFileTransferStrategy(channel_getter=lambda: None)  # type: ignore
+    stream = io.BytesIO()
+
+    strategy.download_to_stream(pathlib.PurePosixPath("export.cdb"), stream)
+
+    assert stream.getvalue() == b"remote file content"
+
+
+def test_remote_download_to_stream_checksum_mismatch(monkeypatch):
+    monkeypatch.setattr(
+        file_transfer_service_pb2_grpc,
+        "FileTransferServiceStub",
+        _FakeFileTransferStub,
+    )
+    responses = list(_download_responses(b"remote file content"))
+    responses[0].file_info.sha1.hex_digest = "0" * 40
+    monkeypatch.setattr(_FakeFileTransferStub, "responses", responses)
+    strategy = RemoteFileTransferStrategy(channel_getter=lambda: None)  # type: ignore
+
+    with pytest.raises(ValueError) as exc:
+        strategy.download_to_stream("export.cdb", io.BytesIO())
+    assert "Checksum mismatch" in str(exc.value)
+
+
+def test_remote_export_to_stream_without_autotransfer():
+    """Check that streaming an export from a remote server needs auto-transfer."""
+    # GIVEN: a remote server, with auto-transfer disabled
+    server_wrapper = _server_wrapper(
+        FileTransferHandler(
+            RemoteFileTransferStrategy(channel_getter=lambda: None),  # type: ignore
+            auto_transfer_files=False,
+        )
+    )
+
+    # WHEN / THEN: an export to a stream is refused before the export runs
+    with pytest.raises(RuntimeError) as exc:
+        with server_wrapper.auto_download(io.BytesIO(), suffix=".cdb"):
+            pytest.fail("The export should not run.")
+    assert "auto_transfer_files" in str(exc.value)
@@ -0,0 +1,99 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import grpc
+from packaging.version import parse as parse_version
+import pytest
+
+from ansys.acp.core._tree_objects.base import ServerWrapper
+from ansys.api.acp.v0 import fabric_pb2_grpc, mesh_query_pb2_grpc
+
+
+@pytest.fixture
+def server_wrapper():
+    # The channel connects lazily, so no server is needed to create stubs.
+    with grpc.insecure_channel("localhost:1") as channel:
+        yield ServerWrapper(
+            channel=channel,
+            version=parse_version("25.2"),
+            filetransfer_handler=None,  # type: ignore
+        )
+
+
+def test_get_stub_is_cached(server_wrapper):
+    """Check that a stub is created once per service."""
+    fabric_stub = server_wrapper.get_stub(fabric_pb2_grpc.ObjectServiceStub)
+    mesh_query_stub = server_wrapper.get_stub(mesh_query_pb2_grpc.MeshQueryServiceStub)
+
+    assert isinstance(fabric_stub, fabric_pb2_grpc.ObjectServiceStub)
+    assert isinstance(mesh_query_stub, mesh_query_pb2_grpc.MeshQueryServiceStub)
+    assert server_wrapper.get_stub(fabric_pb2_grpc.ObjectServiceStub) is fabric_stub
+    assert server_wrapper.get_stub(mesh_query_pb2_grpc.MeshQueryServiceStub) is mesh_query_stub
+
+
+def test_stubs_are_per_connection(server_wrapper):
+    """Check that wrappers for different channels do not share stubs."""
+    with grpc.insecure_channel("localhost:2") as other_channel:
+        other_wrapper = ServerWrapper(
+            channel=other_channel,
+            version=server_wrapper.version,
+            filetransfer_handler=server_wrapper.filetransfer_handler,
+        )
+        assert other_wrapper.get_stub(
+            fabric_pb2_grpc.ObjectServiceStub
+        ) is not server_wrapper.get_stub(fabric_pb2_grpc.ObjectServiceStub)
+
+
+class _RecordingStub:
+    def __init__(self, channel):
+        self.channel = channel
+
+
+def test_bulk_data_stub_falls_back_to_main_channel(server_wrapper):
+    """Check that bulk data stubs use the main channel if there is no bulk data channel."""
+    # WHEN getting a stub for bulk data without a bulk data channel
+    stub = server_wrapper.get_stub(_RecordingStub, bulk_data=True)
+
+    # THEN the stub uses the main channel
+    assert stub.channel is server_wrapper.channel
+
+
+def test_bulk_data_stub_uses_bulk_data_channel(server_wrapper):
+    """Check that bulk data stubs are separate from the stubs on the main channel."""
+    # GIVEN a wrapper with a bulk data channel
+    with grpc.insecure_channel("localhost:1") as bulk_data_channel:
+        wrapper = ServerWrapper(
+            channel=server_wrapper.channel,
+            version=server_wrapper.version,
+            filetransfer_handler=server_wrapper.filetransfer_handler,
+            bulk_data_channel=bulk_data_channel,
+        )
+
+        # WHEN getting stubs for the same service with and without bulk data
+        main_stub = wrapper.get_stub(_RecordingStub)
+        bulk_data_stub = wrapper.get_stub(_RecordingStub, bulk_data=True)
+
+        # THEN each stub uses its own channel, and is cached
+        assert main_stub.channel is wrapper.channel
+        assert bulk_data_stub.channel is bulk_data_channel
+        assert wrapper.get_stub(_RecordingStub, bulk_data=True) is bulk_data_stub
+        assert wrapper.get_stub(_RecordingStub) is main_stub
@@ -0,0 +1,147 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import concurrent.futures
+import threading
+
+import pytest
+
+import ansys.acp.core as pyacp
+from ansys.acp.core._tree_objects._object_cache import ObjectCacheMixin, constructor_with_cache
+from ansys.api.acp.v0 import fabric_pb2
+
+NUM_THREADS = 16
+NUM_ITERATIONS = 50
+
+
+def test_object_cache_concurrent_construction():
+    """Check that concurrent construction from the same resource path returns one instance."""
+    barrier = threading.Barrier(NUM_THREADS)
+
+    def construct(index):
+        object_info = fabric_pb2.ObjectInfo()
+        object_info.info.resource_path.value = f"models/0/fabrics/Fabric.{index % 4}"
+        barrier.wait()
+        return pyacp.Fabric._from_object_info(object_info)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=NUM_THREADS) as executor:
+        instances = list(executor.map(construct, range(NUM_THREADS)))
+
+    for index, instance in enumerate(instances):
+        assert instance is instances[index % 4]
+
+
+class _SlowCachedObject(ObjectCacheMixin):
+    constructing = threading.Event()
+    release = threading.Event()
+
+    @staticmethod
+    def _cache_key_valid(key):
+        return True
+
+    @classmethod
+    @constructor_with_cache(key_getter=lambda key: key)
+    def create(cls, key):
+        if key == "slow":
+            cls.constructing.set()
+            assert cls.release.wait(timeout=10)
+        return cls()
+
+
+def test_object_cache_not_locked_during_construction():
+    """Check that a slow constructor does not block constructing other objects."""
+    # GIVEN: a constructor which is blocked in another thread
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        slow_future = executor.submit(_SlowCachedObject.create, "slow")
+        assert _SlowCachedObject.constructing.wait(timeout=10)
+
+        # WHEN: constructing another object
+        # THEN: it is created while the other constructor is still running
+        fast = _SlowCachedObject.create("fast")
+        assert _SlowCachedObject.create("fast") is fast
+        assert not slow_future.done()
+
+        _SlowCachedObject.release.set()
+        assert slow_future.result() is _SlowCachedObject.create("slow")
+
+
+@pytest.fixture
+def model(load_model_from_tempfile):
+    with load_model_from_tempfile() as model:
+        yield model
+
+
+def test_concurrent_reads(model):
+    """Check that concurrent reads of the same object return consistent values."""
+    fabric = model.fabrics["Fabric.1"]
+    expected = (fabric.name, fabric.thickness, fabric.material.name)
+
+    def read(_):
+        return (fabric.name, fabric.thickness, fabric.material.name)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=NUM_THREADS) as executor:
+        results = list(executor.map(read, range(NUM_THREADS * NUM_ITERATIONS)))
+
+    assert all(result == expected for result in results)
+
+
+def test_concurrent_writes(model):
+    """Check that concurrent writes to different properties of one object are not lost."""
+    fabric = model.fabrics["Fabric.1"]
+
+    thickness = 0.002
+    area_price = 3.0
+
+    def write_thickness():
+        fabric.thickness = thickness
+
+    def write_area_price():
+        fabric.area_price = area_price
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=NUM_THREADS) as executor:
+        futures = [
+            executor.submit(write_thickness if i % 2 else write_area_price)
+            for i in range(NUM_THREADS * NUM_ITERATIONS)
+        ]
+        for future in futures:
+            future.result()
+
+    # Each write is an atomic read-modify-write of the object, so neither
+    # property is reset by a concurrent write to the other one.
+    assert fabric.thickness == pytest.approx(thickness)
+    assert fabric.area_price == area_price
+
+
+def test_concurrent_collection_access(model):
+    """Check that concurrent access to a collection yields the cached objects."""
+    for i in range(NUM_THREADS):
+        model.create_fabric(name=f"Fabric {i}")
+
+    def list_fabrics(_):
+        return list(model.fabrics.values())
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=NUM_THREADS) as executor:
+        results = list(executor.map(list_fabrics, range(NUM_THREADS)))
+
+    for result in results:
+        assert len(result) == len(results[0])
+        assert all(a is b for a, b in zip(result, results[0]))
@@ -0,0 +1,150 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import dataclasses
+import json
+
+import grpc
+import pytest
+
+import ansys.acp.core as pyacp
+from ansys.acp.core._server.direct import DirectLauncher
+from ansys.acp.core._server.transport import _CompressionInterceptor
+
+
+def test_default_channel_options():
+    options = dict(pyacp.TransportProfile().channel_options())
+    assert options["grpc.max_receive_message_length"] == 256 * 1024**2
+    assert options["grpc.max_send_message_length"] == 256 * 1024**2
+    assert "grpc.keepalive_time_ms" not in options
+
+
+def test_channel_options():
+    profile = pyacp.TransportProfile(
+        keepalive_time_ms=10_000,
+        keepalive_timeout_ms=2_000,
+        keepalive_permit_without_calls=True,
+        http2_stream_window_size=8 * 1024**2,
+        http2_bdp_probe=False,
+    )
+    options = dict(profile.channel_options())
+    assert options["grpc.keepalive_time_ms"] == 10_000
+    assert options["grpc.keepalive_timeout_ms"] == 2_000
+    assert options["grpc.keepalive_permit_without_calls"] == 1
+    assert options["grpc.http2.lookahead_bytes"] == 8 * 1024**2
+    assert options["grpc.http2.bdp_probe"] == 0
+
+
+def test_invalid_compression():
+    with pytest.raises(ValueError) as exc:
+        pyacp.TransportProfile(bulk_data_compression="zstd")
+    assert "bulk_data_compression" in str(exc.value)
+
+
+def test_compression_by_method_class():
+    """Check that mesh queries use the bulk data compression."""
+    profile = pyacp.TransportProfile(control_compression="none", bulk_data_compression="gzip")
+    assert (
+        profile.compression_for("/ansys.api.acp.v0.mesh_query.MeshQueryService/GetMeshData")
+        == grpc.Compression.Gzip
+    )
+    assert (
+        profile.compression_for("/ansys.api.acp.v0.fabric.ObjectService/Get")
+        == grpc.Compression.NoCompression
+    )
+
+
+def test_interceptor_sets_compression():
+    """Check that the interceptor sets the compression, unless it is set on the call."""
+    profile = pyacp.TransportProfile(bulk_data_compression="deflate")
+    interceptor = _CompressionInterceptor(profile.compression_for)
+    received_details = []
+
+    def continuation(details, request):
+        received_details.append(details)
+
+    method = "/ansys.api.acp.v0.mesh_query.MeshQueryService/GetNodalData"
+    call_details = dict(
+        method=method, timeout=None, metadata=None, credentials=None, wait_for_ready=None
+    )
+    interceptor.intercept_unary_unary(
+        continuation, _call_details(**call_details, compression=None), request=None
+    )
+    interceptor.intercept_unary_unary(
+        continuation,
+        _call_details(**call_details, compression=grpc.Compression.Gzip),
+        request=None,
+    )
+    assert received_details[0].compression == grpc.Compression.Deflate
+    assert received_details[0].method == method
+    assert received_details[1].compression == grpc.Compression.Gzip
+
+
+def _call_details(**kwargs):
+    return type("ClientCallDetails", (), kwargs)()
+
+
+def test_profile_stored_in_launcher_configuration():
+    """Check that the profile survives the JSON round-trip of the launcher configuration."""
+    # GIVEN: a launch configuration with a transport profile
+    profile = pyacp.TransportProfile(bulk_data_compression="gzip", keepalive_time_ms=30_000)
+    config = pyacp.DirectLaunchConfig(transport_profile=profile)
+
+    # WHEN: the configuration is stored and loaded as JSON
+    loaded_config = pyacp.DirectLaunchConfig(**json.loads(json.dumps(dataclasses.asdict(config))))
+
+    # THEN: the launcher uses the same profile
+    assert isinstance(loaded_config.transport_profile, dict)
+    assert DirectLauncher(config=loaded_config).transport_profile == profile
+
+
+def test_no_profile_by_default():
+    assert DirectLauncher(config=pyacp.DirectLaunchConfig()).transport_profile is None
+
+
+def test_invalid_file_transfer_compression():
+    with pytest.raises(ValueError) as exc:
+        pyacp.TransportProfile(file_transfer_compression="zstd")
+    assert "file_transfer_compression" in str(exc.value)
+
+
+def test_interceptor_sets_compression_of_streams():
+    """Check that streaming calls, used for file transfer, are compressed."""
+    interceptor = _CompressionInterceptor(lambda method: grpc.Compression.Gzip)
+    received_details = []
+
+    def continuation(details, request_iterator):
+        received_details.append(details)
+
+    interceptor.intercept_stream_stream(
+        continuation,
+        _call_details(
+            method="/ansys.api.tools.filetransfer.v1.FileTransferService/UploadFile",
+            timeout=None,
+            metadata=None,
+            credentials=None,
+            wait_for_ready=None,
+            compression=None,
+        ),
+        request_iterator=iter([]),
+    )
+    assert received_details[0].compression == grpc.Compression.Gzip
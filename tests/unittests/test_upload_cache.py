@@ -0,0 +1,144 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+import pathlib
+
+import pytest
+
+from ansys.acp.core._server.acp_instance import (
+    FileTransferHandler,
+    LocalFileTransferStrategy,
+    RemoteFileTransferStrategy,
+)
+
+
+class _RecordingStrategy(RemoteFileTransferStrategy):
+    """Remote strategy which records the uploads instead of transferring files."""
+
+    def __init__(self) -> None:
+        super().__init__(channel_getter=lambda: None)  # type: ignore
+        self.uploaded: list[str] = []
+
+    def upload_file(self, local_path):
+        self.uploaded.append(pathlib.Path(local_path).read_text())
+        return pathlib.PurePosixPath(os.path.basename(local_path))
+
+
+@pytest.fixture
+def strategy():
+    return _RecordingStrategy()
+
+
+@pytest.fixture
+def handler(strategy):
+    return FileTransferHandler(strategy, auto_transfer_files=True)
+
+
+def test_unchanged_file_is_uploaded_once(tmp_path, strategy, handler):
+    """Check that an unchanged file is not uploaded again."""
+    # GIVEN: an uploaded file
+    local_path = tmp_path / "model.cdb"
+    local_path.write_text("content")
+    remote_path = handler.upload_file(local_path)
+
+    # WHEN: the file is uploaded again
+    # THEN: the previous upload is used
+    assert handler.upload_file(local_path) == remote_path
+    assert strategy.uploaded == ["content"]
+
+
+def test_modified_file_is_uploaded_again(tmp_path, strategy, handler):
+    local_path = tmp_path / "model.cdb"
+    local_path.write_text("content")
+    handler.upload_file(local_path)
+
+    local_path.write_text("modified content")
+    handler.upload_file(local_path)
+
+    assert strategy.uploaded == ["content", "modified content"]
+
+
+def test_touched_file_with_same_content_is_not_uploaded_again(tmp_path, strategy, handler):
+    """Check that the content hash is used if the modification time changes."""
+    local_path = tmp_path / "model.cdb"
+    local_path.write_text("content")
+    handler.upload_file(local_path)
+
+    stat = local_path.stat()
+    os.utime(local_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    handler.upload_file(local_path)
+
+    assert strategy.uploaded == ["content"]
+
+
+def test_overwritten_remote_file_is_uploaded_again(tmp_path, strategy, handler):
+    """Check that uploading a file with the same name invalidates the previous upload."""
+    # GIVEN: two files with the same name and different content
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    path_a = tmp_path / "a" / "model.cdb"
+    path_b = tmp_path / "b" / "model.cdb"
+    path_a.write_text("content a")
+    path_b.write_text("content b")
+
+    # WHEN: the files are uploaded alternately
+    handler.upload_file(path_a)
+    handler.upload_file(path_b)
+    handler.upload_file(path_a)
+
+    # THEN: each upload overwrites the remote file, so none is skipped
+    assert strategy.uploaded == ["content a", "content b", "content a"]
+
+
+@pytest.mark.parametrize("is_directory", [True, False])
+def test_export_invalidates_upload(tmp_path, strategy, handler, is_directory):
+    """Check that an export to the path of an uploaded file invalidates the upload."""
+    local_path = tmp_path / "model.cdb"
+    local_path.write_text("content")
+    handler.upload_file(local_path)
+
+    handler.to_export_path(local_path, is_directory=is_directory)
+    handler.upload_file(local_path)
+
+    assert strategy.uploaded == ["content", "content"]
+
+
+def test_invalidate_upload_cache(tmp_path, strategy, handler):
+    local_path = tmp_path / "model.cdb"
+    local_path.write_text("content")
+    handler.upload_file(local_path)
+
+    handler.invalidate_upload_cache()
+    handler.upload_file(local_path)
+
+    assert strategy.uploaded == ["content", "content"]
+
+
+def test_missing_file_raises(tmp_path, handler):
+    with pytest.raises(FileNotFoundError):
+        handler.upload_file(tmp_path / "missing.cdb")
+
+
+def test_local_strategy_has_no_cache(tmp_path):
+    handler = FileTransferHandler(LocalFileTransferStrategy(tmp_path), auto_transfer_files=True)
+    assert handler._upload_cache is None